@@ -0,0 +1,34 @@
+"""Drop single-column indexes covered by composite indexes
+
+Revision ID: 007_drop_redundant_indexes
+Revises: 006_email_nullable
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+revision = "007_drop_redundant_indexes"
+down_revision = "006_email_nullable"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Remove indexes that are strict prefixes of the composites created by
+    ``ensure_indexes``; they only add write amplification.
+    idx_expenses_payer_id stays: every composite holding payer_id leads with
+    another column.
+    """
+    op.drop_index("idx_expenses_group_id", table_name="expenses", if_exists=True)
+    op.drop_index("idx_expense_splits_expense_id", table_name="expense_splits", if_exists=True)
+    op.drop_index("idx_expense_splits_user_id", table_name="expense_splits", if_exists=True)
+    op.drop_index("idx_audit_entity", table_name="audit_logs", if_exists=True)
+
+
+def downgrade() -> None:
+    """Recreate the single-column indexes."""
+    op.create_index("idx_audit_entity", "audit_logs", ["entity_type", "entity_id"], unique=False)
+    op.create_index("idx_expense_splits_user_id", "expense_splits", ["user_id"], unique=False)
+    op.create_index("idx_expense_splits_expense_id", "expense_splits", ["expense_id"], unique=False)
+    op.create_index("idx_expenses_group_id", "expenses", ["group_id"], unique=False)
@@ -0,0 +1,37 @@
+"""Rebuild hot composite indexes as covering indexes
+
+Revision ID: 008_covering_indexes
+Revises: 007_drop_redundant_indexes
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+revision = "008_covering_indexes"
+down_revision = "007_drop_redundant_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Drop the plain composite indexes so ``ensure_indexes`` recreates them with
+    their INCLUDE columns (``CREATE INDEX IF NOT EXISTS`` never rewrites an
+    existing definition).
+    """
+    op.drop_index("idx_expenses_group_deleted_created", table_name="expenses", if_exists=True)
+    op.drop_index("idx_expense_splits_expense_user", table_name="expense_splits", if_exists=True)
+    op.drop_index("idx_group_members_user_group", table_name="group_members", if_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the non-covering composite indexes."""
+    op.drop_index("idx_group_members_user_group", table_name="group_members", if_exists=True)
+    op.drop_index("idx_expense_splits_expense_user", table_name="expense_splits", if_exists=True)
+    op.drop_index("idx_expenses_group_deleted_created", table_name="expenses", if_exists=True)
+    op.create_index("idx_group_members_user_group", "group_members", ["user_id", "group_id"], unique=False)
+    op.create_index("idx_expense_splits_expense_user", "expense_splits", ["expense_id", "user_id"], unique=False)
+    op.execute(
+        "CREATE INDEX idx_expenses_group_deleted_created "
+        "ON expenses (group_id, deleted_at, created_at DESC)"
+    )
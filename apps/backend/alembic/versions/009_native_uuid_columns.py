@@ -0,0 +1,84 @@
+"""Store UUID keys in native uuid columns
+
+Revision ID: 009_native_uuid_columns
+Revises: 008_covering_indexes
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "009_native_uuid_columns"
+down_revision = "008_covering_indexes"
+branch_labels = None
+depends_on = None
+
+
+# Every column holding a generated UUID (primary keys and the foreign keys
+# that point at them). group_members.id and idempotency_keys.id are composite
+# strings and stay varchar.
+UUID_COLUMNS: dict[str, list[str]] = {
+    "users": ["id"],
+    "groups": ["id", "owner_id"],
+    "group_members": ["group_id", "user_id", "invited_by"],
+    "group_invites": ["id", "group_id", "inviter_id", "invitee_user_id"],
+    "friendships": ["id", "user_a", "user_b", "initiator"],
+    "friend_invites": ["id", "inviter_id", "invitee_user_id"],
+    "expenses": ["id", "group_id", "payer_id", "created_by"],
+    "expense_splits": ["id", "expense_id", "user_id"],
+    "settlements": ["id", "group_id", "from_user_id", "to_user_id", "created_by"],
+    "identity_claims": ["id", "user_id"],
+    "refresh_tokens": ["jti", "user_id"],
+    "idempotency_keys": ["actor_user_id"],
+    "audit_logs": ["actor_user_id"],
+    "notifications_outbox": ["user_id"],
+    "sync_ops": ["user_id"],
+}
+
+
+# Invite and friendship ids used to be random base64 tokens rather than UUIDs.
+# Nothing references them, so those rows are simply given fresh UUIDs.
+REKEYED_COLUMNS = {("group_invites", "id"), ("friendships", "id"), ("friend_invites", "id")}
+
+UUID_PATTERN = "^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+
+
+def _foreign_keys(conn) -> list[tuple[str, str, str]]:
+    """Return (table, constraint, definition) for FKs on the affected tables."""
+    rows = conn.execute(
+        sa.text(
+            "SELECT conrelid::regclass::text, conname, pg_get_constraintdef(oid) "
+            "FROM pg_constraint WHERE contype = 'f' AND conrelid::regclass::text = ANY(:tables)"
+        ),
+        {"tables": list(UUID_COLUMNS)},
+    ).all()
+    return [(row[0], row[1], row[2]) for row in rows]
+
+
+def _convert(target_type: str, using: str) -> None:
+    conn = op.get_bind()
+    # Foreign keys must be dropped while both sides change type.
+    foreign_keys = _foreign_keys(conn)
+    for table, name, _ in foreign_keys:
+        op.execute(f'ALTER TABLE {table} DROP CONSTRAINT "{name}"')
+    for table, columns in UUID_COLUMNS.items():
+        for column in columns:
+            expression = f"{column}{using}"
+            if target_type == "uuid" and (table, column) in REKEYED_COLUMNS:
+                expression = f"CASE WHEN {column} ~ '{UUID_PATTERN}' THEN {expression} ELSE gen_random_uuid() END"
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"TYPE {target_type} USING {expression}"
+            )
+    for table, name, definition in foreign_keys:
+        op.execute(f'ALTER TABLE {table} ADD CONSTRAINT "{name}" {definition}')
+
+
+def upgrade() -> None:
+    """Convert varchar UUID columns to the 16-byte uuid type."""
+    _convert("uuid", "::uuid")
+
+
+def downgrade() -> None:
+    """Convert uuid columns back to varchar."""
+    _convert("varchar", "::text")
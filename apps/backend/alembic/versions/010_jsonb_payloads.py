@@ -0,0 +1,42 @@
+"""Store document payloads as JSONB
+
+Revision ID: 010_jsonb_payloads
+Revises: 009_native_uuid_columns
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "010_jsonb_payloads"
+down_revision = "009_native_uuid_columns"
+branch_labels = None
+depends_on = None
+
+
+JSON_COLUMNS = [
+    ("notifications_outbox", "payload"),
+    ("idempotency_keys", "response"),
+    ("sync_ops", "payload"),
+]
+
+
+def upgrade() -> None:
+    """Convert json columns to jsonb and index the outbox dispatch scan."""
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+    op.create_index(
+        "ix_outbox_dispatch",
+        "notifications_outbox",
+        ["status", "created_at"],
+        unique=False,
+        postgresql_include=["user_id", "type"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    """Restore plain json columns."""
+    op.drop_index("ix_outbox_dispatch", table_name="notifications_outbox", if_exists=True)
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json")
@@ -0,0 +1,36 @@
+"""Index only live refresh tokens
+
+Revision ID: 011_refresh_token_partial_index
+Revises: 010_jsonb_payloads
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "011_refresh_token_partial_index"
+down_revision = "010_jsonb_payloads"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace the per-column and full composite indexes with one partial index."""
+    op.drop_index("ix_refresh_tokens_user_id", table_name="refresh_tokens", if_exists=True)
+    op.drop_index("ix_refresh_tokens_expires_at", table_name="refresh_tokens", if_exists=True)
+    op.drop_index("idx_refresh_tokens_user_expires", table_name="refresh_tokens", if_exists=True)
+    op.create_index(
+        "ix_refresh_active",
+        "refresh_tokens",
+        ["user_id", "expires_at"],
+        unique=False,
+        postgresql_where=sa.text("revoked = false"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Restore the single-column indexes."""
+    op.drop_index("ix_refresh_active", table_name="refresh_tokens", if_exists=True)
+    op.create_index("ix_refresh_tokens_user_id", "refresh_tokens", ["user_id"], unique=False)
+    op.create_index("ix_refresh_tokens_expires_at", "refresh_tokens", ["expires_at"], unique=False)
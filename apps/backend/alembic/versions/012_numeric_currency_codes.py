@@ -0,0 +1,47 @@
+"""Store currencies as ISO 4217 numeric codes
+
+Revision ID: 012_numeric_currency_codes
+Revises: 011_refresh_token_partial_index
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+from app.utils.currency_codes import ISO_4217_NUMERIC
+
+revision = "012_numeric_currency_codes"
+down_revision = "011_refresh_token_partial_index"
+branch_labels = None
+depends_on = None
+
+
+# (table, column, previous type)
+CURRENCY_COLUMNS = [
+    ("settlements", "currency", "char(3)"),
+    ("users", "preferred_currency", "varchar"),
+    ("subscription_plans", "currency", "varchar(3)"),
+]
+
+
+def _to_numeric(column: str) -> str:
+    # Codes that were never valid ISO 4217 fall back to INR, the app default.
+    branches = " ".join(f"WHEN '{alpha}' THEN {numeric}" for alpha, numeric in ISO_4217_NUMERIC.items())
+    return f"CASE upper(trim({column})) {branches} ELSE {ISO_4217_NUMERIC['INR']} END"
+
+
+def _to_alpha(column: str) -> str:
+    branches = " ".join(f"WHEN {numeric} THEN '{alpha}'" for alpha, numeric in ISO_4217_NUMERIC.items())
+    return f"CASE {column} {branches} END"
+
+
+def upgrade() -> None:
+    """Convert currency columns to SMALLINT numeric codes."""
+    for table, column, _ in CURRENCY_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE smallint USING {_to_numeric(column)}")
+
+
+def downgrade() -> None:
+    """Convert numeric codes back to three-letter strings."""
+    for table, column, previous_type in CURRENCY_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {previous_type} USING {_to_alpha(column)}")
@@ -0,0 +1,52 @@
+"""Replace single-column settlement indexes with composites
+
+Revision ID: 013_settlement_composite_indexes
+Revises: 012_numeric_currency_codes
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+revision = "013_settlement_composite_indexes"
+down_revision = "012_numeric_currency_codes"
+branch_labels = None
+depends_on = None
+
+
+OLD_INDEXES = [
+    "idx_settlements_group_id",
+    "idx_settlements_from_user_id",
+    "idx_settlements_to_user_id",
+    "idx_settlements_status",
+    # Previously created by ensure_indexes
+    "idx_settlements_group_status",
+    "idx_settlements_from_user",
+    "idx_settlements_to_user",
+]
+
+
+def upgrade() -> None:
+    """Drop the singleton indexes and build the composite ones."""
+    for name in OLD_INDEXES:
+        op.drop_index(name, table_name="settlements", if_exists=True)
+    op.create_index(
+        "ix_settle_group_status_created",
+        "settlements",
+        ["group_id", "status", "created_at"],
+        unique=False,
+        postgresql_include=["amount_inr", "from_user_id", "to_user_id"],
+        if_not_exists=True,
+    )
+    op.create_index("ix_settle_user_status", "settlements", ["from_user_id", "status"], unique=False, if_not_exists=True)
+    op.create_index("ix_settle_to_user_status", "settlements", ["to_user_id", "status"], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the single-column indexes."""
+    op.drop_index("ix_settle_to_user_status", table_name="settlements", if_exists=True)
+    op.drop_index("ix_settle_user_status", table_name="settlements", if_exists=True)
+    op.drop_index("ix_settle_group_status_created", table_name="settlements", if_exists=True)
+    op.create_index("idx_settlements_from_user_id", "settlements", ["from_user_id"], unique=False)
+    op.create_index("idx_settlements_group_id", "settlements", ["group_id"], unique=False)
+    op.create_index("idx_settlements_status", "settlements", ["status"], unique=False)
+    op.create_index("idx_settlements_to_user_id", "settlements", ["to_user_id"], unique=False)
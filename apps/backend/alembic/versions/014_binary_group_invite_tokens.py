@@ -0,0 +1,33 @@
+"""Store group invite tokens as raw bytes
+
+Revision ID: 014_binary_group_invite_tokens
+Revises: 013_settlement_composite_indexes
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+revision = "014_binary_group_invite_tokens"
+down_revision = "013_settlement_composite_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Decode 22-character base64url tokens into 16-byte bytea values."""
+    # Anything that is not a 22-character token cannot have come from
+    # generate_token_128b; hashing it keeps the value unique but unusable.
+    op.execute(
+        "ALTER TABLE group_invites ALTER COLUMN token TYPE bytea USING "
+        "CASE WHEN token ~ '^[A-Za-z0-9_-]{22}$' "
+        "THEN decode(translate(token, '-_', '+/') || '==', 'base64') "
+        "ELSE decode(md5(token), 'hex') END"
+    )
+
+
+def downgrade() -> None:
+    """Re-encode tokens as unpadded base64url text."""
+    op.execute(
+        "ALTER TABLE group_invites ALTER COLUMN token TYPE varchar USING "
+        "rtrim(translate(encode(token, 'base64'), '+/', '-_'), '=')"
+    )
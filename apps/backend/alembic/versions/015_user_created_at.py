@@ -0,0 +1,27 @@
+"""Add users.created_at for registration analytics
+
+Revision ID: 015_user_created_at
+Revises: 014_binary_group_invite_tokens
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "015_user_created_at"
+down_revision = "014_binary_group_invite_tokens"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the column; existing rows are stamped with the migration time."""
+    op.add_column(
+        "users",
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Drop the column."""
+    op.drop_column("users", "created_at")
@@ -0,0 +1,28 @@
+"""Add materialized views for admin analytics
+
+Revision ID: 016_analytics_materialized_views
+Revises: 015_user_created_at
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+from app.db.analytics_views import MATERIALIZED_VIEWS, create_statements
+
+revision = "016_analytics_materialized_views"
+down_revision = "015_user_created_at"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create and populate each view along with its unique index."""
+    for name in MATERIALIZED_VIEWS:
+        for statement in create_statements(name):
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Drop the views (their indexes go with them)."""
+    for name in reversed(list(MATERIALIZED_VIEWS)):
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {name}")
@@ -0,0 +1,54 @@
+"""Add covering indexes for analytics created_at range scans
+
+Revision ID: 017_analytics_covering_indexes
+Revises: 016_analytics_materialized_views
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+revision = "017_analytics_covering_indexes"
+down_revision = "016_analytics_materialized_views"
+branch_labels = None
+depends_on = None
+
+
+# name -> (table, CREATE INDEX CONCURRENTLY statement); kept in sync with
+# app.db.ensure_indexes
+INDEXES = {
+    "idx_expenses_created_live": (
+        "expenses",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_expenses_created_live "
+        "ON expenses (created_at) INCLUDE (amount_inr, currency, group_id, payer_id) "
+        "WHERE deleted_at IS NULL",
+    ),
+    "idx_settlements_created_status": (
+        "settlements",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_settlements_created_status "
+        "ON settlements (created_at, status) INCLUDE (amount_inr, group_id)",
+    ),
+    "idx_audit_created_action": (
+        "audit_logs",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_created_action "
+        "ON audit_logs (created_at, action)",
+    ),
+    "idx_users_created": (
+        "users",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_created "
+        "ON users (created_at) INCLUDE (google_sub, apple_sub, email_verified, phone_verified)",
+    ),
+}
+
+
+def upgrade() -> None:
+    """Build the indexes without locking out writes (needs autocommit)."""
+    with op.get_context().autocommit_block():
+        for _, statement in INDEXES.values():
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Drop the indexes."""
+    with op.get_context().autocommit_block():
+        for name in reversed(list(INDEXES)):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,27 @@
+"""Add JSON-returning functions for small analytics dashboard sections
+
+Revision ID: 018_analytics_json_functions
+Revises: 017_analytics_covering_indexes
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+from app.db.analytics_views import ANALYTICS_FUNCTIONS
+
+revision = "018_analytics_json_functions"
+down_revision = "017_analytics_covering_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the functions."""
+    for statement in ANALYTICS_FUNCTIONS.values():
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Drop the functions."""
+    for signature in reversed(list(ANALYTICS_FUNCTIONS)):
+        op.execute(f"DROP FUNCTION IF EXISTS {signature}")
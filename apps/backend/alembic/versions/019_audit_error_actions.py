@@ -0,0 +1,45 @@
+"""Prefix audit error actions and index them
+
+Revision ID: 019_audit_error_actions
+Revises: 018_analytics_json_functions
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+from app.db.analytics_views import ANALYTICS_FUNCTIONS
+
+revision = "019_audit_error_actions"
+down_revision = "018_analytics_json_functions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Rename "<action>_error" events to "error.<action>", index them and
+    redefine the analytics functions to match on the prefix.
+    """
+    op.execute(
+        "UPDATE audit_logs SET action = 'error.' || left(action, -length('_error')) "
+        "WHERE action LIKE '%\\_error'"
+    )
+    for statement in ANALYTICS_FUNCTIONS.values():
+        op.execute(statement)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_errors "
+            "ON audit_logs (created_at, entity_type) WHERE action LIKE 'error.%'"
+        )
+
+
+def downgrade() -> None:
+    """Drop the index, restore the suffixed action names and the old match."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_audit_errors")
+    for statement in ANALYTICS_FUNCTIONS.values():
+        op.execute(statement.replace("LIKE 'error.%'", "LIKE '%error%'"))
+    op.execute(
+        "UPDATE audit_logs SET action = substr(action, length('error.') + 1) || '_error' "
+        "WHERE action LIKE 'error.%'"
+    )
@@ -0,0 +1,32 @@
+"""Add a covering index for group balance aggregation
+
+Revision ID: 020_balance_covering_index
+Revises: 019_audit_error_actions
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+revision = "020_balance_covering_index"
+down_revision = "019_audit_error_actions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Cover the live-expense branches of the group balance query (payer sums
+    and the join to expense_splits) so they run index-only.
+    """
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_expenses_group_balance "
+            "ON expenses (group_id) INCLUDE (id, payer_id, amount_inr) "
+            "WHERE deleted_at IS NULL"
+        )
+
+
+def downgrade() -> None:
+    """Drop the index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_expenses_group_balance")
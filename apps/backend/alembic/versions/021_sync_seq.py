@@ -0,0 +1,34 @@
+"""Add per-user sync sequence counters
+
+Revision ID: 021_sync_seq
+Revises: 020_balance_covering_index
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "021_sync_seq"
+down_revision = "020_balance_covering_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create sync_seq and seed it with each user's current highest seq."""
+    op.create_table(
+        "sync_seq",
+        sa.Column("user_id", sa.Uuid(as_uuid=False), nullable=False),
+        sa.Column("next_seq", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.execute(
+        "INSERT INTO sync_seq (user_id, next_seq) "
+        "SELECT user_id, max(seq) FROM sync_ops GROUP BY user_id"
+    )
+
+
+def downgrade() -> None:
+    """Drop the counters; sequencing falls back to MAX(seq) on sync_ops."""
+    op.drop_table("sync_seq")
@@ -0,0 +1,29 @@
+"""Restore the single-column payer index on expenses
+
+Revision ID: 022_restore_expense_payer_index
+Revises: 021_sync_seq
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+revision = "022_restore_expense_payer_index"
+down_revision = "021_sync_seq"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Recreate idx_expenses_payer_id where 007 dropped it. No composite leads
+    with payer_id, so payer lookups and the users foreign key checks need it.
+    """
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_expenses_payer_id "
+            "ON expenses (payer_id)"
+        )
+
+
+def downgrade() -> None:
+    """Nothing to undo: the index belongs to the 001 schema."""
@@ -124,10 +124,10 @@ def get_admin_analytics(
         return analytics_data
         
     except ValueError as e:
-        write_audit(db, current_user.id, "admin", "analytics", "admin_read_error", {"error": f"Invalid date format: {str(e)}"})
+        write_audit(db, current_user.id, "admin", "analytics", "error.admin_read", {"error": f"Invalid date format: {str(e)}"})
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid date format")
     except Exception as e:
-        write_audit(db, current_user.id, "admin", "analytics", "admin_read_error", {"error": str(e)})
+        write_audit(db, current_user.id, "admin", "analytics", "error.admin_read", {"error": str(e)})
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to fetch analytics data")
 
 
@@ -261,7 +261,7 @@ def get_admin_dashboard_summary(
         }
         
     except Exception as e:
-        write_audit(db, current_user.id, "admin", "dashboard", "admin_read_error", {"error": str(e)})
+        write_audit(db, current_user.id, "admin", "dashboard", "error.admin_read", {"error": str(e)})
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to fetch dashboard data")
 
 
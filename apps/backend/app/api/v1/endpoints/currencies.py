@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, status
 from decimal import Decimal
 from ....services.currency import get_exchange_rate, convert_to_inr, convert_from_inr
@@ -87,12 +88,12 @@ async def get_all_rates(base_currency: str = "INR", r: Redis = Depends(get_redis
     """Get exchange rates for all supported currencies from base currency."""
     try:
         currencies = ["USD", "EUR", "GBP", "JPY", "AUD", "CAD", "SGD", "AED"]
-        rates = {}
-        
-        for currency in currencies:
-            if currency != base_currency.upper():
-                rate = await get_exchange_rate(base_currency.upper(), currency)
-                rates[currency] = float(rate)
+        targets = [currency for currency in currencies if currency != base_currency.upper()]
+        # Fetch the rates concurrently rather than one after another
+        results = await asyncio.gather(
+            *(get_exchange_rate(base_currency.upper(), currency) for currency in targets)
+        )
+        rates = {currency: float(rate) for currency, rate in zip(targets, results)}
         
         return {
             "base_currency": base_currency.upper(),
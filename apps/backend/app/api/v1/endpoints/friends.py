@@ -14,7 +14,7 @@ from ....services.idempotency import with_idempotency
 from ....tasks.notify import send_friend_invite_email
 from ....utils.identity import normalize_email, normalize_phone_e164
 from ....utils.ids import generate_token_128b
-from ....utils.ratelimit import sliding_window_allow
+from ....utils.ratelimit import fixed_window_allow
 from ..errors import RATE_LIMITED, ALREADY_FRIENDS, INVITE_EXISTS, BLOCKED, INVITE_NOT_FOUND, GONE
 from ..schemas import FriendInviteRequest
 
@@ -27,8 +27,8 @@ def create_friend_invite(body: FriendInviteRequest, current_user: User = Depends
     via = body.via
     value = body.value
     client_request_id = body.client_request_id
-    rl_key = f"rl:friend_invite:{current_user.id}"
-    allowed, retry_in = sliding_window_allow(r, rl_key, 24 * 3600, 30)
+    rl_key = f"rl:friend_invite:count:{current_user.id}"
+    allowed, retry_in = fixed_window_allow(r, rl_key, 24 * 3600, 30)
     if not allowed:
         raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail={"error": RATE_LIMITED, "retry_in": retry_in})
     def _handle() -> dict:
@@ -61,7 +61,7 @@ def create_friend_invite(body: FriendInviteRequest, current_user: User = Depends
                 b = max(current_user.id, existing_user.id)
                 fs2 = db.query(Friendship).filter(Friendship.user_a == a, Friendship.user_b == b).first()
                 if not fs2:
-                    fs2 = Friendship(id=generate_token_128b(), user_a=a, user_b=b, status="accepted", initiator=rev.inviter_id)
+                    fs2 = Friendship(user_a=a, user_b=b, status="accepted", initiator=rev.inviter_id)
                     db.add(fs2)
                 else:
                     fs2.status = "accepted"
@@ -83,7 +83,6 @@ def create_friend_invite(body: FriendInviteRequest, current_user: User = Depends
             return {"invite_id": pending.id, "status": pending.status}
         token = generate_token_128b()
         inv = FriendInvite(
-            id=generate_token_128b(),
             inviter_id=current_user.id,
             invitee_user_id=existing_user.id if existing_user else None,
             invitee_claim_type=via,
@@ -104,7 +103,6 @@ def create_friend_invite(body: FriendInviteRequest, current_user: User = Depends
             if via == "email":
                 send_friend_invite_email.delay(claim_value, inv.token, inviter_label=current_user.id)
         append_sync(db, current_user.id, "friend_invite_created", "friend_invite", inv.id, {"invitee": claim_value, "via": via})
-        db.commit()
         return {"invite_id": inv.id, "status": inv.status}
 
     return with_idempotency(db, current_user.id, client_request_id, _handle)
@@ -192,7 +190,7 @@ def accept_friend_invite(invite_id: str, current_user: User = Depends(get_curren
     if fs and fs.status == "blocked":
         raise HTTPException(status_code=409, detail={"error": BLOCKED})
     if not fs:
-        fs = Friendship(id=generate_token_128b(), user_a=a, user_b=b, status="accepted", initiator=inv.inviter_id)
+        fs = Friendship(user_a=a, user_b=b, status="accepted", initiator=inv.inviter_id)
         db.add(fs)
     else:
         fs.status = "accepted"
@@ -310,7 +308,7 @@ def block_user(friend_user_id: str, current_user: User = Depends(get_current_use
     b = max(current_user.id, friend_user_id)
     fs = db.query(Friendship).filter(Friendship.user_a == a, Friendship.user_b == b).first()
     if not fs:
-        fs = Friendship(id=generate_token_128b(), user_a=a, user_b=b, status="blocked", initiator=current_user.id)
+        fs = Friendship(user_a=a, user_b=b, status="blocked", initiator=current_user.id)
     else:
         fs.status = "blocked"
     db.add(fs)
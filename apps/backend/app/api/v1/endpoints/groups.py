@@ -18,7 +18,7 @@ from ....services.idempotency import with_idempotency
 from ....services.expenses_guard import group_has_expenses
 from ....utils.identity import normalize_email, normalize_phone_e164
 from ....utils.ids import generate_token_128b
-from ....utils.ratelimit import sliding_window_allow
+from ....utils.ratelimit import fixed_window_allow
 from ....tasks.notify import send_group_invite_email, send_group_invite_sms
 from ..schemas import GroupCreateRequest, GroupUpdateRequest, GroupInviteRequest, GroupRoleChangeRequest, TransferOwnershipRequest, LeaveGroupRequest, GroupType, GroupTypeExtraOptionsResponse, GroupTypeExtraField, GroupBulkInviteRequest, GroupBulkInviteResponse, GroupBulkInviteItemResult
 from ..errors import FORBIDDEN, ALREADY_MEMBER, INVITE_NOT_FOUND, GONE, OWNER_MUST_TRANSFER, GROUP_HAS_EXPENSES, RATE_LIMITED, CURRENCY_LOCKED, CANNOT_REMOVE_OWNER, USER_NOT_MEMBER, INVALID_NEW_OWNER, PENDING_DUES, EXPIRED
@@ -249,8 +249,8 @@ def create_group_invite(group_id: str, body: GroupInviteRequest, current_user: U
         raise HTTPException(status_code=403, detail={"error": FORBIDDEN})
     via = body.via
     value = body.value
-    rl_key = f"rl:group_invite:{current_user.id}"
-    allowed, retry_in = sliding_window_allow(r, rl_key, 24 * 3600, 30)
+    rl_key = f"rl:group_invite:count:{current_user.id}"
+    allowed, retry_in = fixed_window_allow(r, rl_key, 24 * 3600, 30)
     if not allowed:
         raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail={"error": RATE_LIMITED, "retry_in": retry_in})
     def _handle() -> dict:
@@ -278,7 +278,6 @@ def create_group_invite(group_id: str, body: GroupInviteRequest, current_user: U
             return {"invite_id": pending.id, "status": pending.status}
         token = generate_token_128b()
         inv = GroupInvite(
-            id=generate_token_128b(),
             group_id=group_id,
             inviter_id=current_user.id,
             invitee_user_id=None,
@@ -311,7 +310,6 @@ def create_group_invite(group_id: str, body: GroupInviteRequest, current_user: U
         write_audit(db, current_user.id, "group_invite", inv.id, "invite", {})
         invitee_label = (known_user.display_name or known_user.email) if known_user else claim_value
         append_sync(db, current_user.id, "group_invite_created", "group_invite", inv.id, {"invite_id": inv.id, "group_id": group_id, "group_name": g.name, "inviter_id": current_user.id, "inviter_name": (current_user.display_name or current_user.email), "invitee": invitee_label, "invitee_user_id": (known_user.id if known_user else None)})
-        db.commit()
         return {"invite_id": inv.id, "status": inv.status}
     return with_idempotency(db, current_user.id, body.client_request_id, _handle)
 
@@ -328,8 +326,8 @@ def create_group_invites_bulk(group_id: str, body: GroupBulkInviteRequest, curre
         raise HTTPException(status_code=403, detail={"error": FORBIDDEN})
 
     # Rate limit per bulk request (count toward the same daily bucket as singles)
-    rl_key = f"rl:group_invite:{current_user.id}"
-    allowed, retry_in = sliding_window_allow(r, rl_key, 24 * 3600, 30)
+    rl_key = f"rl:group_invite:count:{current_user.id}"
+    allowed, retry_in = fixed_window_allow(r, rl_key, 24 * 3600, 30)
     if not allowed:
         raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail={"error": RATE_LIMITED, "retry_in": retry_in})
 
@@ -372,7 +370,6 @@ def create_group_invites_bulk(group_id: str, body: GroupBulkInviteRequest, curre
 
             token = generate_token_128b()
             inv = GroupInvite(
-                id=generate_token_128b(),
                 group_id=group_id,
                 inviter_id=current_user.id,
                 invitee_user_id=None,
@@ -666,7 +663,7 @@ def remove_member(group_id: str, user_id: str, current_user: User = Depends(get_
     if not gm:
         return {"status": "removed"}
     try:
-        balances = calculate_group_balances(group_id, db)
+        balances = calculate_group_balances(group_id, db, use_l1=False)
         member_balance = next((b for b in balances if getattr(b, "user_id", None) == user_id), None)
         if member_balance and getattr(member_balance, "balance_inr", 0) != 0:
             raise HTTPException(status_code=409, detail={"error": PENDING_DUES})
@@ -775,7 +772,7 @@ def leave_group(group_id: str, body: LeaveGroupRequest = None, current_user: Use
     
     # Prevent leaving if user has pending dues in this group (applies to ALL users, including owners)
     try:
-        balances = calculate_group_balances(group_id, db)
+        balances = calculate_group_balances(group_id, db, use_l1=False)
         my_balance = next((b for b in balances if getattr(b, "user_id", None) == current_user.id), None)
         if my_balance and getattr(my_balance, "balance_inr", 0) != 0:
             raise HTTPException(status_code=409, detail={"error": PENDING_DUES})
@@ -15,12 +15,14 @@ Response shape (per group):
 from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+import asyncio
 import json
 import time
 
-from ....db.deps import get_db
+from ....db.deps import get_async_db
 from ....db.models import Group, GroupMember, Expense, Settlement, User
 from ....auth.deps import get_current_user
 from ....auth.rbac import has_permission
@@ -31,9 +33,11 @@ from ..errors import FORBIDDEN
 router = APIRouter()
 
 
-def _redis_get_json(key: str):
+# The Redis client is synchronous; every call goes through the threadpool so
+# the handler never blocks the event loop on a Redis round-trip.
+async def _redis_get_json(key: str):
     r = get_redis()
-    raw = r.get(key)
+    raw = await run_in_threadpool(r.get, key)
     if not raw:
         return None
     try:
@@ -42,19 +46,19 @@ def _redis_get_json(key: str):
         return None
 
 
-def _redis_set_json(key: str, value, ttl_seconds: int) -> None:
+async def _redis_set_json(key: str, value, ttl_seconds: int) -> None:
     r = get_redis()
     try:
-        r.setex(key, ttl_seconds, json.dumps(value))
+        await run_in_threadpool(r.setex, key, ttl_seconds, json.dumps(value))
     except Exception:
         # Best-effort cache
         pass
 
 
 @router.get("/overview")
-def get_groups_overview(
+async def get_groups_overview(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     limit: int = 50,
 ) -> dict:
     """Return consolidated group overview for the current user.
@@ -70,7 +74,7 @@ def get_groups_overview(
     ttl_seconds = 45
 
     # Fast path from cache
-    cached = _redis_get_json(cache_key)
+    cached = await _redis_get_json(cache_key)
     if cached is not None:
         return {"items": cached[: max(1, min(200, limit))]}
 
@@ -78,7 +82,7 @@ def get_groups_overview(
     # Simple single-flight: try lock; if taken, wait briefly for cache
     got_lock = False
     try:
-        got_lock = bool(r.set(lock_key, "1", nx=True, ex=3))
+        got_lock = bool(await run_in_threadpool(r.set, lock_key, "1", nx=True, ex=3))
     except Exception:
         got_lock = False
 
@@ -86,76 +90,81 @@ def get_groups_overview(
         # Wait up to ~1.5s for another worker to populate cache
         start = time.time()
         while time.time() - start < 1.5:
-            time.sleep(0.05)
-            cached = _redis_get_json(cache_key)
+            await asyncio.sleep(0.05)
+            cached = await _redis_get_json(cache_key)
             if cached is not None:
                 return {"items": cached[: max(1, min(200, limit))]}
 
     # Compute fresh
-    memberships = (
-        db.query(GroupMember)
-        .filter(GroupMember.user_id == user_id, GroupMember.status == "active")
-        .all()
-    )
-    if not memberships:
+    group_ids = (
+        await db.scalars(
+            select(GroupMember.group_id).where(
+                GroupMember.user_id == user_id, GroupMember.status == "active"
+            )
+        )
+    ).all()
+    if not group_ids:
         if got_lock:
             try:
-                r.delete(lock_key)
+                await run_in_threadpool(r.delete, lock_key)
             except Exception:
                 pass
         return {"items": []}
 
-    group_ids = [m.group_id for m in memberships]
-
     # Member counts per group in a single query
     member_counts_rows = (
-        db.query(GroupMember.group_id, func.count(GroupMember.id))
-        .filter(GroupMember.group_id.in_(group_ids), GroupMember.status == "active")
-        .group_by(GroupMember.group_id)
-        .all()
-    )
+        await db.execute(
+            select(GroupMember.group_id, func.count(GroupMember.id))
+            .where(GroupMember.group_id.in_(group_ids), GroupMember.status == "active")
+            .group_by(GroupMember.group_id)
+        )
+    ).all()
     member_counts = {gid: cnt for gid, cnt in member_counts_rows}
 
     # Last activity: latest expense or settlement per group
     latest_expense_rows = (
-        db.query(Expense.group_id, func.max(Expense.created_at))
-        .filter(Expense.group_id.in_(group_ids), Expense.deleted_at.is_(None))
-        .group_by(Expense.group_id)
-        .all()
-    )
+        await db.execute(
+            select(Expense.group_id, func.max(Expense.created_at))
+            .where(Expense.group_id.in_(group_ids), Expense.deleted_at.is_(None))
+            .group_by(Expense.group_id)
+        )
+    ).all()
     latest_settlement_rows = (
-        db.query(Settlement.group_id, func.max(Settlement.created_at))
-        .filter(Settlement.group_id.in_(group_ids))
-        .group_by(Settlement.group_id)
-        .all()
-    )
+        await db.execute(
+            select(Settlement.group_id, func.max(Settlement.created_at))
+            .where(Settlement.group_id.in_(group_ids))
+            .group_by(Settlement.group_id)
+        )
+    ).all()
     latest_expense_map = {gid: ts for gid, ts in latest_expense_rows}
     latest_settlement_map = {gid: ts for gid, ts in latest_settlement_rows}
 
     # Pending counts
     seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
     pending_expense_counts = (
-        db.query(Expense.group_id, func.count(Expense.id))
-        .filter(
-            Expense.group_id.in_(group_ids),
-            Expense.deleted_at.is_(None),
-            Expense.created_at >= seven_days_ago,
+        await db.execute(
+            select(Expense.group_id, func.count(Expense.id))
+            .where(
+                Expense.group_id.in_(group_ids),
+                Expense.deleted_at.is_(None),
+                Expense.created_at >= seven_days_ago,
+            )
+            .group_by(Expense.group_id)
         )
-        .group_by(Expense.group_id)
-        .all()
-    )
+    ).all()
     pending_expense_map = {gid: cnt for gid, cnt in pending_expense_counts}
 
     pending_settlement_counts = (
-        db.query(Settlement.group_id, func.count(Settlement.id))
-        .filter(Settlement.group_id.in_(group_ids), Settlement.status == "pending")
-        .group_by(Settlement.group_id)
-        .all()
-    )
+        await db.execute(
+            select(Settlement.group_id, func.count(Settlement.id))
+            .where(Settlement.group_id.in_(group_ids), Settlement.status == "pending")
+            .group_by(Settlement.group_id)
+        )
+    ).all()
     pending_settlement_map = {gid: cnt for gid, cnt in pending_settlement_counts}
 
     # Base group info
-    groups = db.query(Group).filter(Group.id.in_(group_ids)).all()
+    groups = (await db.scalars(select(Group).where(Group.id.in_(group_ids)))).all()
     groups_by_id = {g.id: g for g in groups}
 
     items: list[dict] = []
@@ -194,12 +203,12 @@ def get_groups_overview(
     items.sort(key=lambda x: x["last_activity"] or "", reverse=True)
 
     # Store in cache
-    _redis_set_json(cache_key, items, ttl_seconds)
+    await _redis_set_json(cache_key, items, ttl_seconds)
 
     # Release lock
     if got_lock:
         try:
-            r.delete(lock_key)
+            await run_in_threadpool(r.delete, lock_key)
         except Exception:
             pass
 
@@ -196,19 +196,20 @@ def list_settlements(
     group_ids = [membership.group_id for membership in memberships]
     
     # Query settlements from all user's groups with eager loading to prevent N+1 queries
-    from sqlalchemy.orm import joinedload
-    
-    query = db.query(Settlement).filter(Settlement.group_id.in_(group_ids)).options(
-        joinedload(Settlement.from_user),
-        joinedload(Settlement.to_user)
-    )
+    query = db.query(Settlement).filter(Settlement.group_id.in_(group_ids))
     total = query.count()
-    settlements = query.order_by(Settlement.created_at.desc()).offset((page - 1) * page_size).limit(page_size).all()
+    settlements = (
+        query.options(*Settlement.options_for_list())
+        .order_by(Settlement.created_at.desc())
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+        .all()
+    )
     
     # Format response (optimized - no additional queries needed due to eager loading)
     settlement_list = []
     for settlement in settlements:
-        # User data is already loaded via joinedload
+        # User data is already loaded by options_for_list
         from_user_name = settlement.from_user.display_name or settlement.from_user.email if settlement.from_user else "Unknown"
         to_user_name = settlement.to_user.display_name or settlement.to_user.email if settlement.to_user else "Unknown"
         
@@ -257,13 +258,19 @@ def list_group_settlements(
     # Query settlements
     query = db.query(Settlement).filter(Settlement.group_id == group_id)
     total = query.count()
-    settlements = query.order_by(Settlement.created_at.desc()).offset((page - 1) * page_size).limit(page_size).all()
+    settlements = (
+        query.options(*Settlement.options_for_list())
+        .order_by(Settlement.created_at.desc())
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+        .all()
+    )
     
     # Format response
     settlement_list = []
     for settlement in settlements:
-        from_user = db.query(User).filter(User.id == settlement.from_user_id).first()
-        to_user = db.query(User).filter(User.id == settlement.to_user_id).first()
+        from_user = settlement.from_user
+        to_user = settlement.to_user
         
         from_user_name = from_user.display_name or from_user.email if from_user else "Unknown"
         to_user_name = to_user.display_name or to_user.email if to_user else "Unknown"
@@ -24,7 +24,7 @@ Created: 2025-01-27
 from __future__ import annotations
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import desc
 from pydantic import BaseModel, Field
 from datetime import datetime
@@ -34,6 +34,7 @@ from ....db.models import SubscriptionPlan, SubscriptionFeature, User
 from ....auth.deps import get_current_user
 from ....auth.rbac import has_permission
 from ....services.audit import write_audit
+from ..schemas import ISOCurrencyCode
 from ....core.redis import get_redis_dependency
 from ....core.config import settings
 import json
@@ -75,7 +76,7 @@ class SubscriptionPlanBase(BaseModel):
     name: str = Field(..., max_length=100, description="Plan display name")
     slug: str = Field(..., max_length=100, description="URL-friendly identifier")
     price: float = Field(..., ge=0, description="Plan price")
-    currency: str = Field(default="INR", max_length=3, description="Currency code")
+    currency: ISOCurrencyCode = Field(default="INR", description="Currency code")
     billing_period: str = Field(default="month", max_length=20, description="Billing period: forever, month, year")
     description: Optional[str] = Field(None, description="Plan description")
     is_popular: bool = Field(default=False, description="Whether this plan is highlighted as popular")
@@ -91,7 +92,7 @@ class SubscriptionPlanUpdate(BaseModel):
     name: Optional[str] = Field(None, max_length=100)
     slug: Optional[str] = Field(None, max_length=100)
     price: Optional[float] = Field(None, ge=0)
-    currency: Optional[str] = Field(None, max_length=3)
+    currency: Optional[ISOCurrencyCode] = None
     billing_period: Optional[str] = Field(None, max_length=20)
     description: Optional[str] = None
     is_popular: Optional[bool] = None
@@ -145,7 +146,7 @@ def get_subscription_plans(
     logger.info("🐌 Fetching subscription plans from database")
     plans = (
         db.query(SubscriptionPlan)
-        .options(joinedload(SubscriptionPlan.features))
+        .options(selectinload(SubscriptionPlan.features))
         .filter(SubscriptionPlan.is_active == True)
         .order_by(SubscriptionPlan.display_order)
         .all()
@@ -218,7 +219,7 @@ def admin_get_subscription_plans(
             detail="Insufficient permissions. PLATFORM_ADMIN role required."
         )
     
-    query = db.query(SubscriptionPlan).options(joinedload(SubscriptionPlan.features))
+    query = db.query(SubscriptionPlan).options(selectinload(SubscriptionPlan.features))
     if not include_inactive:
         query = query.filter(SubscriptionPlan.is_active == True)
     
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from ....db.deps import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from ....db.deps import get_async_db
 from ....db.models import User
 from ....auth.deps import get_current_user
 from ....auth.rbac import has_permission, get_platform_permissions_for_roles
@@ -16,8 +16,8 @@ def read_me(current_user: User = Depends(get_current_user)) -> dict:
 
 
 @router.get("/{user_id}")
-def read_user(user_id: str, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)) -> dict:
-    target = db.get(User, user_id)
+async def read_user(user_id: str, current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)) -> dict:
+    target = await db.get(User, user_id)
     if not target:
         return {}
     if current_user.id == target.id or has_permission(current_user, "user.read.any"):
@@ -3,6 +3,8 @@ Error codes and their corresponding user-friendly messages.
 This module provides centralized error handling for the API.
 """
 
+from fastapi.responses import JSONResponse
+
 # Error codes
 INVALID_CREDENTIALS = "invalid_credentials"
 EMAIL_NOT_VERIFIED = "email_not_verified"
@@ -101,3 +103,38 @@ def create_error_response(error_code: str, status_code: int = 400) -> dict:
         "detail": error_code
     }
 
+
+# Body returned for unhandled (non-HTTP) exceptions
+INTERNAL_ERROR_CONTENT = {
+    "error_code": "internal_error",
+    "message": "An unexpected error occurred. Please try again.",
+    "detail": "internal_error"
+}
+
+
+def format_error(status_code: int, detail: object) -> JSONResponse:
+    """
+    Build the standardized JSON error response for an HTTP exception detail.
+    
+    Args:
+        status_code: HTTP status code
+        detail: The exception detail (dict with error/message keys, error code string, or anything else)
+        
+    Returns:
+        JSONResponse with error_code, message and detail fields
+    """
+    if isinstance(detail, dict):
+        error_code = str(detail.get("error") or detail.get("code") or detail.get("detail") or "error")
+        message = detail.get("message") or detail.get("msg") or get_error_message(error_code)
+        content = {"error_code": error_code, "message": str(message), "detail": error_code}
+    elif isinstance(detail, str):
+        # Use our error message mapping for string details
+        content = {"error_code": detail, "message": get_error_message(detail), "detail": detail}
+    else:
+        # Fallback for other detail types
+        content = {
+            "error_code": "error",
+            "message": get_error_message("error"),
+            "detail": str(detail) if detail else "error",
+        }
+    return JSONResponse(status_code=status_code, content=content)
@@ -1,8 +1,13 @@
-from pydantic import BaseModel, EmailStr, constr
-from typing import List, Optional, Literal, Any
+from pydantic import AfterValidator, BaseModel, EmailStr, constr
+from typing import Annotated, List, Optional, Literal, Any
 from decimal import Decimal
 from datetime import datetime
 from enum import Enum
+from ...utils.currency_codes import normalize_currency_code
+
+
+# Currencies are stored as ISO 4217 numeric codes, so only known codes are accepted
+ISOCurrencyCode = Annotated[str, AfterValidator(normalize_currency_code)]
 
 
 class GroupType(str, Enum):
@@ -21,13 +26,13 @@ class RegisterRequest(BaseModel):
     password: constr(min_length=8)
     display_name: Optional[constr(min_length=1, max_length=64)] = None
     phone: Optional[constr(min_length=10, max_length=15)] = None
-    preferred_currency: Optional[constr(min_length=3, max_length=3)] = None
+    preferred_currency: Optional[ISOCurrencyCode] = None
 
 
 class RegisterPhoneRequest(BaseModel):
     phone: constr(min_length=10, max_length=15)
     display_name: Optional[constr(min_length=1, max_length=64)] = None
-    preferred_currency: Optional[constr(min_length=3, max_length=3)] = None
+    preferred_currency: Optional[ISOCurrencyCode] = None
     password: Optional[constr(min_length=8)] = None
 
 
@@ -136,7 +141,7 @@ class FriendInviteRequest(BaseModel):
 
 class ProfileUpdateRequest(BaseModel):
     display_name: Optional[constr(min_length=1, max_length=64)] = None
-    preferred_currency: Optional[constr(min_length=3, max_length=3)] = None
+    preferred_currency: Optional[ISOCurrencyCode] = None
     language: Optional[constr(min_length=2, max_length=8)] = None
     notifications_enabled: Optional[bool] = None
 
@@ -227,7 +232,7 @@ class SettlementCreateRequest(BaseModel):
     from_user_id: str
     to_user_id: str
     amount: Decimal
-    currency: str = "INR"
+    currency: ISOCurrencyCode = "INR"
     method: Literal["cash", "upi", "bank_transfer"]
     notes: Optional[str] = None
 
@@ -9,21 +9,24 @@ The service shares the same database and Redis as the main backend but runs
 on a separate port (8001) for microservices architecture.
 """
 
+import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi import Request, HTTPException
 from .core.config import settings
-from .db.session import engine
-from .db.base import Base
-from .db.ensure_indexes import ensure_indexes
-from .middleware.performance import PerformanceMiddleware
-from .middleware.access_log import AccessLogMiddleware
+from .core.log_config import configure_logging
+from .api.v1.errors import INTERNAL_ERROR_CONTENT, format_error
+from .db.init_db import init_db, should_init_on_startup
+from .middleware.observability import ObservabilityMiddleware
 
 # Import only auth-related routers
 from .api.v1.endpoints import auth, otp
 
+configure_logging()
+logger = logging.getLogger(__name__)
+
 # Create FastAPI app for auth service
 app = FastAPI(
     title=f"{settings.app_name} Auth Service",
@@ -36,11 +39,8 @@ app = FastAPI(
 # Add GZip compression middleware
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
-# Add access log middleware
-app.add_middleware(AccessLogMiddleware)
-
-# Add performance monitoring middleware
-app.add_middleware(PerformanceMiddleware, slow_request_threshold=2.0)
+# Add access log and performance monitoring middleware
+app.add_middleware(ObservabilityMiddleware, slow_threshold=2.0)
 
 # CORS middleware
 app.add_middleware(
@@ -60,45 +60,9 @@ def health() -> dict:
 async def http_exception_handler(request: Request, exc: HTTPException):
     """HTTP exception handler for consistent error responses."""
     try:
-        from app.api.v1.errors import get_error_message
-        
-        status_code = exc.status_code
-        detail = getattr(exc, "detail", None)
-        
-        if isinstance(detail, dict):
-            error_code = detail.get("error") or detail.get("code") or detail.get("detail") or "error"
-            message = detail.get("message") or detail.get("msg") or get_error_message(str(error_code))
-            return JSONResponse(
-                status_code=status_code,
-                content={
-                    "error_code": str(error_code),
-                    "message": str(message),
-                    "detail": str(error_code)
-                }
-            )
-        elif isinstance(detail, str):
-            message = get_error_message(detail)
-            return JSONResponse(
-                status_code=status_code,
-                content={
-                    "error_code": detail,
-                    "message": message,
-                    "detail": detail
-                }
-            )
-        else:
-            error_code = "error"
-            message = get_error_message(error_code)
-            return JSONResponse(
-                status_code=status_code,
-                content={
-                    "error_code": error_code,
-                    "message": message,
-                    "detail": str(detail) if detail else error_code
-                }
-            )
-    except Exception as e:
-        print(f"❌ HTTP Exception handler error: {str(e)}")
+        return format_error(exc.status_code, getattr(exc, "detail", None))
+    except Exception:
+        logger.exception("❌ HTTP Exception handler error")
         return JSONResponse(
             status_code=exc.status_code,
             content={"detail": str(exc.detail) if exc.detail else "error"}
@@ -107,14 +71,8 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(Exception)
 async def generic_exception_handler(request: Request, exc: Exception):
     """Global exception handler."""
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error_code": "internal_error",
-            "message": "An unexpected error occurred. Please try again.",
-            "detail": "internal_error"
-        }
-    )
+    logger.exception("❌ Unhandled exception on %s %s", request.method, request.url.path)
+    return JSONResponse(status_code=500, content=INTERNAL_ERROR_CONTENT)
 
 # Include only auth-related routers
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["auth"])
@@ -122,11 +80,7 @@ app.include_router(otp.router, prefix="/api/v1/auth", tags=["auth"])
 
 @app.on_event("startup")
 def on_startup() -> None:
-    """Initialize database and indexes on startup."""
-    if settings.environment in {"development", "dev", "local"}:
-        Base.metadata.create_all(bind=engine)
-    try:
-        ensure_indexes()
-    except Exception:
-        pass
+    """Initialize database and indexes when this is the designated init worker."""
+    if should_init_on_startup():
+        init_db(seed=False)
 
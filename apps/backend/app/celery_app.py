@@ -1,13 +1,14 @@
 from celery import Celery
 from .core.config import settings
 from celery.schedules import crontab
+from celery.signals import worker_process_init
 
 
 celery_app = Celery(
     "baantlo",
     broker=str(settings.redis_url),
     backend=str(settings.redis_url),
-    include=["app.tasks.sample", "app.tasks.notify", "app.tasks.cleanup", "app.tasks.outbox_consumer"],
+    include=["app.tasks.sample", "app.tasks.notify", "app.tasks.cleanup", "app.tasks.outbox_consumer", "app.tasks.analytics"],
 )
 
 
@@ -16,5 +17,25 @@ celery_app.conf.beat_schedule = {
         "task": "app.tasks.outbox.process",
         "schedule": 60.0,
     },
+    "prune-refresh-tokens-daily": {
+        "task": "app.tasks.cleanup.prune_refresh_tokens",
+        "schedule": crontab(hour=3, minute=0),
+    },
+    "prune-idempotency-keys-hourly": {
+        "task": "app.tasks.cleanup.prune_idempotency_keys",
+        "schedule": crontab(minute=15),
+    },
+    "refresh-analytics-views": {
+        "task": "app.tasks.analytics.refresh_views",
+        "schedule": crontab(minute="*/10"),
+    },
 }
 
+
+@worker_process_init.connect
+def _reset_db_pool(**kwargs) -> None:
+    # Each prefork child starts with its own empty pool; its sessions then keep
+    # reusing those connections across tasks. close=False leaves the parent's
+    # sockets alone instead of closing them from the child.
+    from app.db.session import engine
+    engine.dispose(close=False)
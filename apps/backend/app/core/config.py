@@ -7,12 +7,14 @@ class Settings(BaseSettings):
     app_name: str = "Baant Lo"
     app_tagline: str = "Ab Sab Kuch Batega?"
     environment: str = "development"
+    log_level: str = Field(default="INFO", validation_alias=AliasChoices("LOG_LEVEL"))
     secret_key: str = Field(..., validation_alias=AliasChoices("SECRET_KEY"))
     database_url: AnyUrl = "postgresql+psycopg://postgres:postgres@db:5432/baantlo"
     redis_url: AnyUrl = "redis://redis:6379/0"
     redis_socket_timeout: float = Field(default=5.0, validation_alias=AliasChoices("REDIS_SOCKET_TIMEOUT"))
     redis_socket_connect_timeout: float = Field(default=5.0, validation_alias=AliasChoices("REDIS_SOCKET_CONNECT_TIMEOUT"))
     redis_health_check_interval: int = Field(default=30, validation_alias=AliasChoices("REDIS_HEALTH_CHECK_INTERVAL"))
+    redis_max_connections: int = Field(default=50, validation_alias=AliasChoices("REDIS_MAX_CONNECTIONS"))
     minio_endpoint: str = "minio:9000"
     minio_access_key: str = "minioadmin"
     minio_secret_key: str = "minioadmin"
@@ -0,0 +1,29 @@
+"""
+Logging setup for the application's own loggers.
+
+Only the ``app`` logger hierarchy is configured: uvicorn manages its own
+loggers, and leaving the root logger alone keeps SQLAlchemy's engine loggers
+(which log SQL at INFO once any ancestor enables it) quiet.
+"""
+
+from __future__ import annotations
+import logging
+
+from .config import settings
+
+
+def configure_logging() -> None:
+    """
+    Set the ``app.*`` log level from LOG_LEVEL and attach a stderr handler.
+
+    Records below the level are dropped before their message is formatted,
+    so DEBUG output (e.g. the analytics result dumps) costs nothing in
+    production. Safe to call more than once.
+    """
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(settings.log_level.upper())
+    if not app_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(levelname)s:     %(name)s - %(message)s"))
+        app_logger.addHandler(handler)
+        app_logger.propagate = False
@@ -7,7 +7,10 @@ for monitoring and optimizing the backend service.
 
 from __future__ import annotations
 import logging
+import os
+import sys
 import time
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from decimal import Decimal
 from ..core.config import settings
@@ -41,9 +44,26 @@ class PerformanceConfig:
     CURRENCY_CACHE_TTL = 3600  # 1 hour
     USER_CACHE_TTL = 1800  # 30 minutes
     
-    # Database connection pool settings
-    DB_POOL_SIZE = 20
-    DB_MAX_OVERFLOW = 30
+    # Database connection pool settings. Every web worker process owns its
+    # own pool, so the per-process size is derived from the worker count to
+    # keep the total connections across workers within
+    # DB_TOTAL_POOL_SIZE + DB_TOTAL_MAX_OVERFLOW. The only floor is the one
+    # connection a pool needs to work at all; check_pool_budget warns when
+    # that floor pushes WORKERS past the budget.
+    WEB_WORKERS = max(1, int(os.getenv("WORKERS", "1")))
+    DB_TOTAL_POOL_SIZE = 40
+    DB_TOTAL_MAX_OVERFLOW = 60
+    # The async engine only serves the few ``async def`` routes, so it gets a
+    # small share carved out of the same total rather than a second budget.
+    # Those routes still authenticate through the sync session (via
+    # get_current_user -> get_db), so one request to them checks out a
+    # connection from each pool at the same time.
+    DB_ASYNC_TOTAL_POOL_SIZE = 8
+    DB_ASYNC_TOTAL_MAX_OVERFLOW = 12
+    DB_POOL_SIZE = max(1, (DB_TOTAL_POOL_SIZE - DB_ASYNC_TOTAL_POOL_SIZE) // WEB_WORKERS)
+    DB_MAX_OVERFLOW = (DB_TOTAL_MAX_OVERFLOW - DB_ASYNC_TOTAL_MAX_OVERFLOW) // WEB_WORKERS
+    DB_ASYNC_POOL_SIZE = max(1, DB_ASYNC_TOTAL_POOL_SIZE // WEB_WORKERS)
+    DB_ASYNC_MAX_OVERFLOW = DB_ASYNC_TOTAL_MAX_OVERFLOW // WEB_WORKERS
     DB_POOL_TIMEOUT = 30
     DB_POOL_RECYCLE = 3600
     
@@ -57,6 +77,24 @@ class PerformanceConfig:
     ENABLE_SLOW_QUERY_LOGGING = True
     ENABLE_MEMORY_MONITORING = True
     
+    @classmethod
+    def check_pool_budget(cls) -> bool:
+        """
+        Warn when the per-worker pools add up to more than the total budget.
+        
+        Returns:
+            True if WEB_WORKERS x (sync + async pool and overflow) fits
+        """
+        per_worker = cls.DB_POOL_SIZE + cls.DB_MAX_OVERFLOW + cls.DB_ASYNC_POOL_SIZE + cls.DB_ASYNC_MAX_OVERFLOW
+        budget = cls.DB_TOTAL_POOL_SIZE + cls.DB_TOTAL_MAX_OVERFLOW
+        if cls.WEB_WORKERS * per_worker <= budget:
+            return True
+        logger.warning(
+            f"⚠️ DB POOL OVER BUDGET: {cls.WEB_WORKERS} workers x {per_worker} connections "
+            f"exceeds the {budget} connection budget; lower WORKERS"
+        )
+        return False
+    
     @classmethod
     def get_threshold_for_duration(cls, duration: float) -> str:
         """
@@ -98,6 +136,48 @@ class PerformanceConfig:
             return "NORMAL"
 
 
+_NS_PER_SECOND = 1_000_000_000
+_NS_PER_MS = 1_000_000
+_NS_PER_US = 1_000
+
+
+@dataclass(slots=True)
+class EndpointMetrics:
+    """
+    Aggregated timings for a single ``METHOD:path`` endpoint.
+    
+    Slotted so each bucket is a compact fixed-layout object instead of a
+    nine-key dict. Durations are kept as integer nanoseconds and converted
+    to seconds only when read.
+    """
+    
+    count: int = 0
+    total_ns: int = 0
+    min_ns: int = 0
+    max_ns: int = 0
+    memory_kb: int = 0
+    slow_requests: int = 0
+    errors: int = 0
+    status_codes: Dict[str, int] = field(default_factory=dict)
+    
+    @property
+    def avg_duration(self) -> float:
+        return self.total_ns / self.count / _NS_PER_SECOND if self.count else 0.0
+    
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_duration": self.total_ns / _NS_PER_SECOND,
+            "min_duration": self.min_ns / _NS_PER_SECOND,
+            "max_duration": self.max_ns / _NS_PER_SECOND,
+            "avg_duration": self.avg_duration,
+            "status_codes": dict(self.status_codes),
+            "memory_usage": self.memory_kb / 1024,
+            "slow_requests": self.slow_requests,
+            "errors": self.errors,
+        }
+
+
 class PerformanceMetrics:
     """
     Performance metrics collector and analyzer.
@@ -106,9 +186,11 @@ class PerformanceMetrics:
     performance metrics across the application.
     """
     
+    _SLOW_REQUEST_NS = int(PerformanceConfig.SLOW_REQUEST_THRESHOLD * _NS_PER_SECOND)
+    
     def __init__(self):
-        self.metrics: Dict[str, Any] = {}
-        self.start_time = time.time()
+        self.metrics: Dict[str, EndpointMetrics] = {}
+        self._start_ns = time.monotonic_ns()
     
     def record_request(
         self,
@@ -128,40 +210,58 @@ class PerformanceMetrics:
             status_code: HTTP status code
             memory_usage: Memory usage in MB
         """
-        key = f"{method}:{path}"
+        self.record_request_ns(
+            method,
+            path,
+            int(duration * _NS_PER_SECOND),
+            status_code,
+            int(memory_usage * 1024),
+        )
+    
+    def record_request_ns(
+        self,
+        method: str,
+        path: str,
+        duration_ns: int,
+        status_code: int,
+        memory_kb: int
+    ) -> None:
+        """
+        Record a request performance metric using integer units.
         
-        if key not in self.metrics:
-            self.metrics[key] = {
-                "count": 0,
-                "total_duration": 0.0,
-                "min_duration": float('inf'),
-                "max_duration": 0.0,
-                "avg_duration": 0.0,
-                "status_codes": {},
-                "memory_usage": 0.0,
-                "slow_requests": 0,
-                "errors": 0
-            }
+        Args:
+            method: HTTP method
+            path: Request path
+            duration_ns: Request duration in nanoseconds (from time.monotonic_ns)
+            status_code: HTTP status code
+            memory_kb: Memory usage in KB
+        """
+        # Interned keys make the bucket lookup an identity comparison
+        key = sys.intern(f"{method}:{path}")
+        
+        metric = self.metrics.get(key)
+        if metric is None:
+            metric = self.metrics[key] = EndpointMetrics(min_ns=duration_ns)
         
-        metric = self.metrics[key]
-        metric["count"] += 1
-        metric["total_duration"] += duration
-        metric["min_duration"] = min(metric["min_duration"], duration)
-        metric["max_duration"] = max(metric["max_duration"], duration)
-        metric["avg_duration"] = metric["total_duration"] / metric["count"]
-        metric["memory_usage"] = memory_usage
+        metric.count += 1
+        metric.total_ns += duration_ns
+        if duration_ns < metric.min_ns:
+            metric.min_ns = duration_ns
+        if duration_ns > metric.max_ns:
+            metric.max_ns = duration_ns
+        metric.memory_kb = memory_kb
         
         # Track status codes
         status_str = str(status_code)
-        metric["status_codes"][status_str] = metric["status_codes"].get(status_str, 0) + 1
+        metric.status_codes[status_str] = metric.status_codes.get(status_str, 0) + 1
         
         # Track slow requests
-        if duration > PerformanceConfig.SLOW_REQUEST_THRESHOLD:
-            metric["slow_requests"] += 1
+        if duration_ns > self._SLOW_REQUEST_NS:
+            metric.slow_requests += 1
         
         # Track errors
         if status_code >= 400:
-            metric["errors"] += 1
+            metric.errors += 1
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -170,11 +270,15 @@ class PerformanceMetrics:
         Returns:
             Dictionary containing performance summary
         """
-        uptime = time.time() - self.start_time
+        uptime = (time.monotonic_ns() - self._start_ns) / _NS_PER_SECOND
         
-        total_requests = sum(metric["count"] for metric in self.metrics.values())
-        total_slow_requests = sum(metric["slow_requests"] for metric in self.metrics.values())
-        total_errors = sum(metric["errors"] for metric in self.metrics.values())
+        total_requests = 0
+        total_slow_requests = 0
+        total_errors = 0
+        for metric in self.metrics.values():
+            total_requests += metric.count
+            total_slow_requests += metric.slow_requests
+            total_errors += metric.errors
         
         return {
             "uptime_seconds": uptime,
@@ -183,7 +287,7 @@ class PerformanceMetrics:
             "total_errors": total_errors,
             "slow_request_percentage": (total_slow_requests / total_requests * 100) if total_requests > 0 else 0,
             "error_percentage": (total_errors / total_requests * 100) if total_requests > 0 else 0,
-            "endpoints": self.metrics
+            "endpoints": {key: metric.as_dict() for key, metric in self.metrics.items()}
         }
     
     def get_slowest_endpoints(self, limit: int = 10) -> list:
@@ -196,18 +300,22 @@ class PerformanceMetrics:
         Returns:
             List of endpoint performance data
         """
-        endpoints = []
-        for key, metric in self.metrics.items():
-            if metric["count"] > 0:
-                endpoints.append({
-                    "endpoint": key,
-                    "avg_duration": metric["avg_duration"],
-                    "max_duration": metric["max_duration"],
-                    "count": metric["count"],
-                    "slow_requests": metric["slow_requests"]
-                })
+        ranked = sorted(
+            (item for item in self.metrics.items() if item[1].count > 0),
+            key=lambda item: item[1].total_ns // item[1].count,
+            reverse=True,
+        )[:limit]
         
-        return sorted(endpoints, key=lambda x: x["avg_duration"], reverse=True)[:limit]
+        return [
+            {
+                "endpoint": key,
+                "avg_duration": metric.avg_duration,
+                "max_duration": metric.max_ns / _NS_PER_SECOND,
+                "count": metric.count,
+                "slow_requests": metric.slow_requests
+            }
+            for key, metric in ranked
+        ]
 
 
 # Global performance metrics instance
@@ -249,12 +357,25 @@ def format_duration(duration: float) -> str:
     Returns:
         Formatted duration string
     """
-    if duration < 0.001:
-        return f"{duration * 1000000:.0f}μs"
-    elif duration < 1:
-        return f"{duration * 1000:.1f}ms"
+    return format_duration_ns(int(duration * _NS_PER_SECOND))
+
+
+def format_duration_ns(duration_ns: int) -> str:
+    """
+    Format an integer nanosecond duration in a human-readable way.
+    
+    Args:
+        duration_ns: Duration in nanoseconds
+        
+    Returns:
+        Formatted duration string
+    """
+    if duration_ns < _NS_PER_MS:
+        return f"{duration_ns // _NS_PER_US}μs"
+    elif duration_ns < _NS_PER_SECOND:
+        return f"{duration_ns / _NS_PER_MS:.1f}ms"
     else:
-        return f"{duration:.3f}s"
+        return f"{duration_ns / _NS_PER_SECOND:.3f}s"
 
 
 def format_memory(memory_mb: float) -> str:
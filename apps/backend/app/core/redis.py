@@ -1,19 +1,29 @@
 from functools import lru_cache
-from redis import Redis
+from redis import BlockingConnectionPool, Redis
 from fastapi import Depends
 from .config import settings
 
 
 @lru_cache(maxsize=1)
 def get_redis() -> Redis:
-    return Redis.from_url(
+    """
+    Return the process-wide Redis client.
+
+    Every caller shares one bounded connection pool; when all
+    ``redis_max_connections`` connections are busy a caller waits up to the
+    socket timeout for one to free up instead of opening another.
+    """
+    pool = BlockingConnectionPool.from_url(
         str(settings.redis_url),
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_socket_timeout,
         decode_responses=True,
         socket_timeout=settings.redis_socket_timeout,
         socket_connect_timeout=settings.redis_socket_connect_timeout,
         health_check_interval=settings.redis_health_check_interval,
         retry_on_timeout=False,
     )
+    return Redis(connection_pool=pool)
 
 
 def get_redis_dependency() -> Redis:
@@ -0,0 +1,177 @@
+"""
+Materialized views and SQL functions backing the admin analytics dashboard.
+
+Each view pre-aggregates one of the heavy GROUP BY scans in
+``app.services.analytics`` into per-day rows, so a dashboard request reads a
+few hundred pre-summed rows instead of scanning expenses/settlements/users.
+The views are refreshed by the ``app.tasks.analytics.refresh_views`` beat
+task; reads therefore lag live data by at most one refresh interval.
+
+Every view has a unique index so it can be refreshed CONCURRENTLY without
+blocking dashboard readers.
+"""
+
+from __future__ import annotations
+import logging
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+# name -> (definition, unique index); definitions are plain SELECTs so the
+# same SQL works from Alembic and from the development bootstrap.
+MATERIALIZED_VIEWS: dict[str, tuple[str, str]] = {
+    "mv_timeseries_daily": (
+        """
+        WITH u AS (
+            SELECT created_at::date AS day, count(*) AS n FROM users GROUP BY 1
+        ), e AS (
+            SELECT created_at::date AS day, count(*) AS n FROM expenses
+            WHERE deleted_at IS NULL GROUP BY 1
+        ), s AS (
+            SELECT created_at::date AS day, count(*) AS n FROM settlements GROUP BY 1
+        )
+        SELECT coalesce(u.day, e.day, s.day) AS day,
+               coalesce(u.n, 0) AS users,
+               coalesce(e.n, 0) AS expenses,
+               coalesce(s.n, 0) AS settlements
+        FROM u
+        FULL OUTER JOIN e ON e.day = u.day
+        FULL OUTER JOIN s ON s.day = coalesce(u.day, e.day)
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_mv_timeseries_daily ON mv_timeseries_daily (day)",
+    ),
+    "mv_financial_daily": (
+        """
+        SELECT created_at::date AS day,
+               currency,
+               count(*) AS expense_count,
+               sum(amount) AS sum_amount,
+               sum(amount_inr) AS sum_inr
+        FROM expenses
+        WHERE deleted_at IS NULL
+        GROUP BY 1, 2
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_mv_financial_daily ON mv_financial_daily (day, currency)",
+    ),
+    "mv_group_activity": (
+        """
+        SELECT created_at::date AS day,
+               group_id,
+               count(*) AS expense_count,
+               sum(amount_inr) AS sum_inr
+        FROM expenses
+        WHERE deleted_at IS NULL
+        GROUP BY 1, 2
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_mv_group_activity ON mv_group_activity (day, group_id)",
+    ),
+}
+
+# Dashboard sections that are just a handful of small aggregates are built
+# server-side as one JSON document, saving a round-trip per sub-query.
+# signature -> CREATE OR REPLACE FUNCTION statement; the output shape matches
+# the Python fallbacks in app.services.analytics.
+ANALYTICS_FUNCTIONS: dict[str, str] = {
+    "analytics_system_health(timestamptz)": """
+        CREATE OR REPLACE FUNCTION analytics_system_health(since timestamptz)
+        RETURNS json LANGUAGE sql STABLE AS $$
+        SELECT json_build_object(
+            'recentAuditLogs', coalesce((
+                SELECT json_agg(json_build_object('action', action, 'count', n) ORDER BY n DESC)
+                FROM (
+                    SELECT action, count(*) AS n FROM audit_logs
+                    WHERE created_at >= since
+                    GROUP BY action ORDER BY n DESC LIMIT 10
+                ) t
+            ), '[]'::json),
+            'notificationOutboxStatus', coalesce((
+                SELECT json_object_agg(status, n)
+                FROM (SELECT status, count(*) AS n FROM notifications_outbox GROUP BY status) t
+            ), '{}'::json),
+            'syncOperationStats', json_build_object(
+                'total', (
+                    SELECT CASE WHEN reltuples >= 0 THEN reltuples::bigint
+                                ELSE (SELECT count(*) FROM sync_ops) END
+                    FROM pg_class WHERE oid = 'sync_ops'::regclass
+                ),
+                'pending', 0
+            ),
+            'recentErrors', coalesce((
+                SELECT json_agg(
+                    json_build_object('type', entity_type, 'count', n, 'lastOccurred', last_occurred)
+                    ORDER BY n DESC
+                )
+                FROM (
+                    SELECT entity_type, count(*) AS n, max(created_at) AS last_occurred
+                    FROM audit_logs
+                    WHERE action LIKE 'error.%' AND created_at >= since
+                    GROUP BY entity_type ORDER BY n DESC LIMIT 5
+                ) t
+            ), '[]'::json)
+        )
+        $$
+    """,
+    "analytics_data_quality(timestamptz)": """
+        CREATE OR REPLACE FUNCTION analytics_data_quality(dormant_before timestamptz)
+        RETURNS json LANGUAGE sql STABLE AS $$
+        SELECT json_build_object(
+            'usersWithIncompleteProfiles',
+                (SELECT count(*) FROM users WHERE display_name IS NULL OR avatar_key IS NULL),
+            'expensesWithoutReceipts',
+                (SELECT count(*) FROM expenses WHERE receipt_key IS NULL AND deleted_at IS NULL),
+            'dormantGroups',
+                (SELECT count(*) FROM groups WHERE updated_at < dormant_before AND archived_at IS NULL),
+            'pendingOperations',
+                (SELECT count(*) FROM settlements WHERE status = 'pending')
+        )
+        $$
+    """,
+}
+
+
+def create_statements(name: str) -> list[str]:
+    """
+    Build the DDL that creates one analytics view and its unique index.
+
+    Args:
+        name: Key in MATERIALIZED_VIEWS
+
+    Returns:
+        CREATE MATERIALIZED VIEW and CREATE UNIQUE INDEX statements
+    """
+    definition, unique_index = MATERIALIZED_VIEWS[name]
+    return [f"CREATE MATERIALIZED VIEW IF NOT EXISTS {name} AS {definition}", unique_index]
+
+
+def ensure_analytics_views() -> None:
+    """
+    Create any missing analytics views and (re)create the analytics functions
+    (used by the development bootstrap; deployed databases get them from
+    Alembic).
+    """
+    # Imported here so Alembic can import the definitions without an engine
+    from .session import engine
+
+    with engine.begin() as conn:
+        for name in MATERIALIZED_VIEWS:
+            for statement in create_statements(name):
+                conn.execute(text(statement))
+        for statement in ANALYTICS_FUNCTIONS.values():
+            conn.execute(text(statement))
+
+
+def refresh_analytics_views() -> None:
+    """
+    Refresh every analytics view without blocking concurrent readers.
+
+    A view that does not exist yet is logged and skipped so one missing view
+    does not stop the others from refreshing.
+    """
+    from .session import engine
+
+    for name in MATERIALIZED_VIEWS:
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {name}"))
+        except Exception as e:
+            logger.warning("Skipping refresh of %s: %s", name, e)
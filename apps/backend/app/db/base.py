@@ -1,7 +1,20 @@
+import base64
+import binascii
+import uuid
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import String
+from sqlalchemy import JSON, LargeBinary, SmallInteger, String, Uuid
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
 from ..utils.ids import generate_uuid
+from ..utils.currency_codes import ISO_4217_ALPHA, ISO_4217_NUMERIC, normalize_currency_code
+
+
+NIL_UUID = "00000000-0000-0000-0000-000000000000"
+
+# Document columns are stored as binary JSONB on PostgreSQL (parsed once on
+# write, GIN-indexable) and fall back to plain JSON on other backends.
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
 
 
 class Base(DeclarativeBase):
@@ -14,6 +27,81 @@ class Base(DeclarativeBase):
     pass
 
 
+class UUIDString(TypeDecorator):
+    """UUID column stored natively but exposed to Python as a string.
+    
+    On PostgreSQL this maps to the 16-byte ``uuid`` type (other backends store
+    32 hex characters), halving key and index size compared to ``varchar``,
+    while models, JWT claims and API payloads keep working with canonical
+    UUID strings. Values that are not valid UUIDs bind as the nil UUID, which
+    is never generated, so lookups by a malformed id simply match no rows.
+    """
+    impl = Uuid
+    cache_ok = True
+
+    def __init__(self) -> None:
+        super().__init__(as_uuid=False)
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return str(uuid.UUID(str(value)))
+        except ValueError:
+            return NIL_UUID
+
+
+class TokenBytes(TypeDecorator):
+    """Random 128-bit token stored as raw bytes, exposed as base64url text.
+    
+    Tokens from ``generate_token_128b`` are 22 base64url characters; storing
+    the 16 decoded bytes halves the column and its unique index while links,
+    emails and lookups keep using the text form. Text that does not decode to
+    16 bytes binds as an empty value, which no stored token matches.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self) -> None:
+        super().__init__(length=16)
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(str(value) + "==")
+        except (binascii.Error, ValueError):
+            return b""
+        return raw if len(raw) == 16 else b""
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return base64.urlsafe_b64encode(bytes(value)).decode().rstrip("=")
+
+
+class CurrencyCode(TypeDecorator):
+    """Currency column stored as its ISO 4217 numeric code.
+    
+    The database holds a 2-byte SMALLINT (356 for INR, 840 for USD) instead
+    of a three-character string, while models and API payloads keep using
+    alphabetic codes. Unknown codes are rejected at bind time; request
+    schemas validate them earlier with ``normalize_currency_code``.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return ISO_4217_NUMERIC[normalize_currency_code(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return ISO_4217_ALPHA[value]
+
+
 def generate_id() -> str:
     """Generate a UUID for use as primary key.
     
@@ -24,4 +112,3 @@ def generate_id() -> str:
         str: A UUID4 string
     """
     return generate_uuid()
-
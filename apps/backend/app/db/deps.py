@@ -1,5 +1,6 @@
-from collections.abc import Generator
-from .session import SessionLocal
+from collections.abc import AsyncGenerator, Generator
+from sqlalchemy.ext.asyncio import AsyncSession
+from .session import SessionLocal, AsyncSessionLocal
 
 
 def get_db() -> Generator:
@@ -15,3 +16,18 @@ def get_db() -> Generator:
     finally:
         db.close()
 
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get an async database session for `async def` endpoints.
+    
+    Queries are awaited so DB wait time overlaps with other in-flight
+    requests on the same worker. Any uncommitted work is rolled back if
+    the request fails.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
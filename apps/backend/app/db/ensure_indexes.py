@@ -30,7 +30,16 @@ INDEX_DEFINITIONS: dict[str, list[str]] = {
     "expenses": [
         """
         CREATE INDEX IF NOT EXISTS idx_expenses_group_deleted_created
-        ON expenses (group_id, deleted_at, created_at DESC);
+        ON expenses (group_id, deleted_at, created_at DESC)
+        INCLUDE (amount_inr, payer_id, description)
+        WHERE deleted_at IS NULL;
+        """,
+        # Group balance aggregation: payer sums and the expense_splits join
+        # read group_id -> (id, payer_id, amount_inr) index-only
+        """
+        CREATE INDEX IF NOT EXISTS idx_expenses_group_balance
+        ON expenses (group_id) INCLUDE (id, payer_id, amount_inr)
+        WHERE deleted_at IS NULL;
         """,
         """
         CREATE INDEX IF NOT EXISTS idx_expenses_group_payer_date
@@ -40,6 +49,19 @@ INDEX_DEFINITIONS: dict[str, list[str]] = {
         CREATE INDEX IF NOT EXISTS idx_expenses_amount_range
         ON expenses (amount_inr, group_id) WHERE deleted_at IS NULL;
         """,
+        # Day bucketing in the analytics time series; created_at is
+        # timestamptz, so the cast goes through UTC to stay immutable
+        """
+        CREATE INDEX IF NOT EXISTS idx_expenses_created_day
+        ON expenses (((created_at AT TIME ZONE 'UTC')::date)) WHERE deleted_at IS NULL;
+        """,
+        # Analytics created_at range scans over live expenses, index-only
+        """
+        CREATE INDEX IF NOT EXISTS idx_expenses_created_live
+        ON expenses (created_at)
+        INCLUDE (amount_inr, currency, group_id, payer_id)
+        WHERE deleted_at IS NULL;
+        """,
     ],
     "expense_splits": [
         """
@@ -48,13 +70,15 @@ INDEX_DEFINITIONS: dict[str, list[str]] = {
         """,
         """
         CREATE INDEX IF NOT EXISTS idx_expense_splits_expense_user
-        ON expense_splits (expense_id, user_id);
+        ON expense_splits (expense_id, user_id)
+        INCLUDE (amount_inr);
         """,
     ],
     "group_members": [
         """
         CREATE INDEX IF NOT EXISTS idx_group_members_user_group
-        ON group_members (user_id, group_id);
+        ON group_members (user_id, group_id)
+        INCLUDE (role, status);
         """,
         """
         CREATE INDEX IF NOT EXISTS idx_group_members_group_role
@@ -91,10 +115,28 @@ INDEX_DEFINITIONS: dict[str, list[str]] = {
         ON user_sessions (token_hash);
         """,
     ],
+    "idempotency_keys": [
+        # Serves the hourly TTL prune; keys are insert-only so created_at
+        # follows physical order and BRIN stays tiny.
+        """
+        CREATE INDEX IF NOT EXISTS idx_idempotency_keys_created_brin
+        ON idempotency_keys USING brin (created_at);
+        """,
+    ],
     "audit_logs": [
+        # audit_logs has no user_id column; "recent events per user" keys on
+        # the actor. System events (NULL actor) are never queried per user.
+        """
+        CREATE INDEX IF NOT EXISTS idx_audit_logs_actor_created
+        ON audit_logs (actor_user_id, created_at DESC)
+        WHERE actor_user_id IS NOT NULL;
+        """,
+        # Rows are append-only, so created_at tracks physical order and a
+        # BRIN index serves "last N hours" range scans at a fraction of the
+        # size of a btree.
         """
-        CREATE INDEX IF NOT EXISTS idx_audit_logs_user_created
-        ON audit_logs (user_id, created_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_audit_logs_created_brin
+        ON audit_logs USING brin (created_at);
         """,
         """
         CREATE INDEX IF NOT EXISTS idx_audit_logs_entity_created
@@ -108,20 +150,52 @@ INDEX_DEFINITIONS: dict[str, list[str]] = {
         CREATE INDEX IF NOT EXISTS idx_audit_logs_entity_action
         ON audit_logs (entity_type, entity_id, action, created_at DESC);
         """,
+        # Analytics: events by action over a time window
+        """
+        CREATE INDEX IF NOT EXISTS idx_audit_created_action
+        ON audit_logs (created_at, action);
+        """,
+        # Analytics "recent errors": only error.* events, which are rare
+        """
+        CREATE INDEX IF NOT EXISTS idx_audit_errors
+        ON audit_logs (created_at, entity_type)
+        WHERE action LIKE 'error.%';
+        """,
     ],
     "settlements": [
         """
-        CREATE INDEX IF NOT EXISTS idx_settlements_group_status
-        ON settlements (group_id, status);
+        CREATE INDEX IF NOT EXISTS ix_settle_group_status_created
+        ON settlements (group_id, status, created_at)
+        INCLUDE (amount_inr, from_user_id, to_user_id);
         """,
         """
-        CREATE INDEX IF NOT EXISTS idx_settlements_from_user
+        CREATE INDEX IF NOT EXISTS ix_settle_user_status
         ON settlements (from_user_id, status);
         """,
         """
-        CREATE INDEX IF NOT EXISTS idx_settlements_to_user
+        CREATE INDEX IF NOT EXISTS ix_settle_to_user_status
         ON settlements (to_user_id, status);
         """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_settlements_created_day
+        ON settlements (((created_at AT TIME ZONE 'UTC')::date));
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_settlements_created_status
+        ON settlements (created_at, status)
+        INCLUDE (amount_inr, group_id);
+        """,
+    ],
+    "users": [
+        """
+        CREATE INDEX IF NOT EXISTS idx_users_created_day
+        ON users (((created_at AT TIME ZONE 'UTC')::date));
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_users_created
+        ON users (created_at)
+        INCLUDE (google_sub, apple_sub, email_verified, phone_verified);
+        """,
     ],
     "sync_ops": [
         """
@@ -141,35 +215,47 @@ INDEX_DEFINITIONS: dict[str, list[str]] = {
     ],
     "refresh_tokens": [
         """
-        CREATE INDEX IF NOT EXISTS idx_refresh_tokens_user_expires
-        ON refresh_tokens (user_id, expires_at);
-        """,
-        """
-        CREATE INDEX IF NOT EXISTS idx_refresh_tokens_token
-        ON refresh_tokens (token);
+        CREATE INDEX IF NOT EXISTS ix_refresh_active
+        ON refresh_tokens (user_id, expires_at) WHERE revoked = false;
         """,
     ],
 }
 
+# Tables backing covering indexes get a tighter autovacuum threshold so the
+# visibility map stays current and index-only scans avoid heap fetches.
+TABLE_STORAGE_PARAMETERS: dict[str, str] = {
+    "expenses": "autovacuum_vacuum_scale_factor = 0.05, autovacuum_analyze_scale_factor = 0.02",
+    "expense_splits": "autovacuum_vacuum_scale_factor = 0.05, autovacuum_analyze_scale_factor = 0.02",
+    "group_members": "autovacuum_vacuum_scale_factor = 0.05, autovacuum_analyze_scale_factor = 0.02",
+}
+
 
-def _table_exists(conn, table_name: str) -> bool:
-    result = conn.execute(
-        text("SELECT to_regclass(:table)"),
-        {"table": f"public.{table_name}"},
-    ).scalar()
-    return result is not None
+def _existing_tables(conn, table_names: list[str]) -> set[str]:
+    rows = conn.execute(
+        text(
+            "SELECT c.relname FROM pg_class c "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = 'public' AND c.relname = ANY(:names)"
+        ),
+        {"names": table_names},
+    ).all()
+    return {row[0] for row in rows}
 
 
 def ensure_indexes() -> None:
     """
     Ensure all critical database indexes are created for optimal performance.
     This function skips index creation for tables that have not yet been created.
+    All tables are probed in a single catalog query.
     """
     with engine.begin() as conn:
+        present = _existing_tables(conn, list(INDEX_DEFINITIONS))
         for table_name, statements in INDEX_DEFINITIONS.items():
-            if not _table_exists(conn, table_name):
+            if table_name not in present:
                 logger.debug("Skipping index creation for missing table %s", table_name)
                 continue
             for statement in statements:
                 conn.execute(text(statement))
-
+            storage_parameters = TABLE_STORAGE_PARAMETERS.get(table_name)
+            if storage_parameters:
+                conn.execute(text(f"ALTER TABLE {table_name} SET ({storage_parameters})"))
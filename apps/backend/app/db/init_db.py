@@ -0,0 +1,123 @@
+"""
+One-shot database initialisation.
+
+Creating tables, ensuring indexes and seeding users only needs to happen once
+per deployment, not once per web worker. ``start_server.py`` calls
+:func:`init_db` before Uvicorn starts its workers; the app startup hooks only
+run it when ``BAANTLO_INIT_WORKER=1`` is set (e.g. when the app is launched
+directly with ``uvicorn``).
+
+Usage:
+    python -m app.db.init_db
+"""
+
+from __future__ import annotations
+import logging
+import os
+
+from ..core.config import settings
+from .analytics_views import ensure_analytics_views
+from .base import Base
+from .ensure_indexes import ensure_indexes
+from .session import engine
+
+logger = logging.getLogger(__name__)
+
+INIT_WORKER_ENV = "BAANTLO_INIT_WORKER"
+
+
+def should_init_on_startup() -> bool:
+    """
+    Check whether this process should initialise the database at app startup.
+
+    Returns:
+        True if ``BAANTLO_INIT_WORKER`` is set to ``"1"``
+    """
+    return os.environ.get(INIT_WORKER_ENV) == "1"
+
+
+def seed_users() -> None:
+    """
+    Seed users for the current environment and log a short summary.
+
+    Development seeds the admin plus test users; every other environment only
+    seeds the admin user. Failures are logged, never raised.
+    """
+    try:
+        # Imported lazily: seeding only runs in the one-shot init process, so
+        # web workers never load the seed module at import time
+        if settings.environment in {"development", "dev", "local"}:
+            from .seed_admin import seed_all_users, get_all_users_info
+
+            # In development, seed both admin and test users
+            users_seeded = seed_all_users()
+            if not users_seeded:
+                logger.error("❌ User seeding failed")
+            elif logger.isEnabledFor(logging.INFO):
+                # The summary costs extra queries, so only fetch it when it will be logged
+                users_info = get_all_users_info()
+                if users_info and "error" not in users_info:
+                    logger.info(
+                        "✅ User seeding completed: %d users (%d admin, %d basic)",
+                        users_info['total_users'],
+                        users_info['admin_users'],
+                        users_info['basic_users'],
+                    )
+
+                    # Show admin user details
+                    admin_users = [u for u in users_info['users'] if u['role'] == 'PLATFORM_ADMIN']
+                    if admin_users:
+                        admin = admin_users[0]
+                        logger.info("   - Admin: %s (ID: %s)", admin['email'], admin['id'])
+
+                    # Show test users
+                    test_users = [u for u in users_info['users'] if u['role'] == 'BASIC_USER']
+                    if test_users:
+                        logger.info("   - Test users: %s", ", ".join(u['email'] for u in test_users))
+                else:
+                    logger.warning("⚠️  User seeding completed but info unavailable")
+        else:
+            from .seed_admin import seed_admin_user, get_admin_user_info
+
+            # In production, only seed admin user
+            admin_seeded = seed_admin_user()
+            if not admin_seeded:
+                logger.error("❌ Admin user seeding failed")
+            elif logger.isEnabledFor(logging.INFO):
+                admin_info = get_admin_user_info()
+                if admin_info:
+                    logger.info("✅ Admin user ready: %s (ID: %s)", admin_info['email'], admin_info['id'])
+                else:
+                    logger.warning("⚠️  Admin user seeding completed but info unavailable")
+    except Exception as e:
+        logger.error("❌ User seeding error: %s", e)
+
+
+def init_db(seed: bool = True) -> None:
+    """
+    Create tables and analytics views (development only), ensure indexes and
+    optionally seed users.
+
+    Args:
+        seed: Whether to seed the admin/test users after the schema is ready
+    """
+    if settings.environment in {"development", "dev", "local"}:
+        Base.metadata.create_all(bind=engine)
+        # Deployed databases get these from Alembic
+        try:
+            ensure_analytics_views()
+        except Exception as e:
+            logger.warning("⚠️  Analytics view creation skipped: %s", e)
+    try:
+        ensure_indexes()
+    except Exception as e:
+        logger.warning("⚠️  Index creation skipped: %s", e)
+    if seed:
+        seed_users()
+    # Don't hand pooled connections to forked workers
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    init_db()
@@ -7,7 +7,7 @@ from .settlement import Settlement
 from .identity import IdentityClaim
 from .audit import AuditLog
 from .notify import NotificationOutbox
-from .sync import SyncOp
+from .sync import SyncOp, SyncSeq
 from .refresh_token import RefreshToken
 from .idempotency import IdempotencyKey
 from .subscription_plan import SubscriptionPlan, SubscriptionFeature
@@ -28,6 +28,7 @@ __all__ = [
     "AuditLog",
     "NotificationOutbox",
     "SyncOp",
+    "SyncSeq",
     "RefreshToken",
     "IdempotencyKey",
     "SubscriptionPlan",
@@ -1,23 +1,19 @@
 from __future__ import annotations
-from sqlalchemy import String, BigInteger, JSON, DateTime, Index
+from sqlalchemy import String, BigInteger, JSON, DateTime
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
-from ..base import Base
+from ..base import Base, UUIDString
 
 
 class AuditLog(Base):
     __tablename__ = "audit_logs"
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
-    actor_user_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    actor_user_id: Mapped[str | None] = mapped_column(UUIDString, nullable=True)
     entity_type: Mapped[str] = mapped_column(String, nullable=False)
     entity_id: Mapped[str] = mapped_column(String, nullable=False)
     action: Mapped[str] = mapped_column(String, nullable=False)
     details: Mapped[dict] = mapped_column("metadata", JSON, default=dict)
     created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
-    __table_args__ = (
-        Index("idx_audit_entity", "entity_type", "entity_id"),
-    )
-
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 from sqlalchemy import String, ForeignKey, UniqueConstraint, CheckConstraint, Index, DateTime
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
-from ..base import Base, generate_id
+from ..base import Base, UUIDString, generate_id
 
 
 class Friendship(Base):
@@ -13,11 +13,11 @@ class Friendship(Base):
     """
     __tablename__ = "friendships"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_id)
-    user_a: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False)
-    user_b: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False)
+    id: Mapped[str] = mapped_column(UUIDString, primary_key=True, default=generate_id)
+    user_a: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=False)
+    user_b: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=False)
     status: Mapped[str] = mapped_column(String, nullable=False)
-    initiator: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False)
+    initiator: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=False)
     created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
@@ -38,9 +38,9 @@ class FriendInvite(Base):
     """
     __tablename__ = "friend_invites"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_id)
-    inviter_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False)
-    invitee_user_id: Mapped[str | None] = mapped_column(String, ForeignKey("users.id"), nullable=True)
+    id: Mapped[str] = mapped_column(UUIDString, primary_key=True, default=generate_id)
+    inviter_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=False)
+    invitee_user_id: Mapped[str | None] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=True)
     invitee_claim_type: Mapped[str] = mapped_column(String, nullable=False)
     invitee_claim_value: Mapped[str] = mapped_column(String, nullable=False)
     status: Mapped[str] = mapped_column(String, nullable=False)
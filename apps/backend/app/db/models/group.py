@@ -2,7 +2,7 @@ from __future__ import annotations
 from sqlalchemy import String, ForeignKey, DateTime, CheckConstraint, UniqueConstraint, Index, CHAR, Text, Enum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
-from ..base import Base, generate_id
+from ..base import Base, UUIDString, generate_id
 import enum
 
 
@@ -29,13 +29,13 @@ class Group(Base):
     """
     __tablename__ = "groups"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_id)
+    id: Mapped[str] = mapped_column(UUIDString, primary_key=True, default=generate_id)
     name: Mapped[str] = mapped_column(String, index=True)
     base_currency: Mapped[str] = mapped_column(CHAR(3), default="INR")
     group_type: Mapped[str] = mapped_column(Enum(GroupType), default=GroupType.OTHER, nullable=False)
     invite_policy: Mapped[str] = mapped_column(String, default="members")
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    owner_id: Mapped[str] = mapped_column(String, index=True)
+    owner_id: Mapped[str] = mapped_column(UUIDString, index=True)
     avatar_key: Mapped[str | None] = mapped_column(String, nullable=True)
     created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -54,11 +54,11 @@ class GroupMember(Base):
     __tablename__ = "group_members"
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_id)
-    group_id: Mapped[str] = mapped_column(String, ForeignKey("groups.id", ondelete="CASCADE"), nullable=False)
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False)
+    group_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("groups.id", ondelete="CASCADE"), nullable=False)
+    user_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=False)
     role: Mapped[str] = mapped_column(String, default=GroupRole.MEMBER, nullable=False)
     status: Mapped[str] = mapped_column(String, default="active", nullable=False)
-    invited_by: Mapped[str | None] = mapped_column(String, ForeignKey("users.id"), nullable=True)
+    invited_by: Mapped[str | None] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=True)
     created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 from sqlalchemy import String, ForeignKey, UniqueConstraint, CheckConstraint, DateTime
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
-from ..base import Base, generate_id
+from ..base import Base, TokenBytes, UUIDString, generate_id
 
 
 class GroupInvite(Base):
@@ -13,14 +13,14 @@ class GroupInvite(Base):
     """
     __tablename__ = "group_invites"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_id)
-    group_id: Mapped[str] = mapped_column(String, ForeignKey("groups.id", ondelete="CASCADE"), nullable=False)
-    inviter_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False)
-    invitee_user_id: Mapped[str | None] = mapped_column(String, ForeignKey("users.id"), nullable=True)
+    id: Mapped[str] = mapped_column(UUIDString, primary_key=True, default=generate_id)
+    group_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("groups.id", ondelete="CASCADE"), nullable=False)
+    inviter_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=False)
+    invitee_user_id: Mapped[str | None] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=True)
     invitee_claim_type: Mapped[str] = mapped_column(String, nullable=False)
     invitee_claim_value: Mapped[str] = mapped_column(String, nullable=False)
     status: Mapped[str] = mapped_column(String, nullable=False)
-    token: Mapped[str] = mapped_column(String, unique=True, nullable=False)
+    token: Mapped[str] = mapped_column(TokenBytes, unique=True, nullable=False)
     ttl_at: Mapped[object] = mapped_column(DateTime(timezone=True), nullable=False)
     created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
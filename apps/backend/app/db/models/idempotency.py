@@ -1,8 +1,8 @@
 from __future__ import annotations
-from sqlalchemy import String, JSON, UniqueConstraint, DateTime
+from sqlalchemy import String, UniqueConstraint, DateTime
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
-from ..base import Base, generate_id
+from ..base import Base, JSONDocument, UUIDString, generate_id
 
 
 class IdempotencyKey(Base):
@@ -14,9 +14,9 @@ class IdempotencyKey(Base):
     __tablename__ = "idempotency_keys"
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_id)
-    actor_user_id: Mapped[str] = mapped_column(String, index=True, nullable=False)
+    actor_user_id: Mapped[str] = mapped_column(UUIDString, index=True, nullable=False)
     client_request_id: Mapped[str] = mapped_column(String, nullable=False)
-    response: Mapped[dict] = mapped_column(JSON, nullable=False)
+    response: Mapped[dict] = mapped_column(JSONDocument, nullable=False, deferred=True)
     created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     __table_args__ = (
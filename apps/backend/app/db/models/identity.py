@@ -2,7 +2,7 @@ from __future__ import annotations
 from sqlalchemy import String, Boolean, ForeignKey, UniqueConstraint, CheckConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
-from ..base import Base, generate_id
+from ..base import Base, UUIDString, generate_id
 
 
 class IdentityClaim(Base):
@@ -13,8 +13,8 @@ class IdentityClaim(Base):
     """
     __tablename__ = "identity_claims"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_id)
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), index=True, nullable=False)
+    id: Mapped[str] = mapped_column(UUIDString, primary_key=True, default=generate_id)
+    user_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), index=True, nullable=False)
     claim_type: Mapped[str] = mapped_column(String, nullable=False)
     claim_value: Mapped[str] = mapped_column(String, nullable=False)
     is_primary: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
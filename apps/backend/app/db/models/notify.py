@@ -1,22 +1,51 @@
 from __future__ import annotations
-from sqlalchemy import String, JSON, CheckConstraint, BigInteger, ForeignKey, DateTime
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Index, text, select, CheckConstraint, BigInteger, ForeignKey, DateTime
+from sqlalchemy.orm import Mapped, Session, mapped_column
 from sqlalchemy.sql import func
-from ..base import Base
+from ..base import Base, JSONDocument, UUIDString
 
 
 class NotificationOutbox(Base):
     __tablename__ = "notifications_outbox"
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False)
+    user_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=False)
     type: Mapped[str] = mapped_column(String, nullable=False)
-    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONDocument, nullable=False)
     status: Mapped[str] = mapped_column(String, default="pending", nullable=False)
     created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     __table_args__ = (
         CheckConstraint("status in ('pending','sent','failed')", name="ck_notification_status"),
+        # The dispatcher reads the oldest pending rows; sent/failed rows stay out
+        # of the index and the INCLUDE columns make the scan index-only.
+        Index(
+            "ix_outbox_dispatch", "status", "created_at",
+            postgresql_include=["user_id", "type"],
+            postgresql_where=text("status = 'pending'"),
+        ),
     )
 
-
+    @classmethod
+    def claim_batch(cls, session: Session, limit: int = 100) -> list["NotificationOutbox"]:
+        """Lock and return the oldest pending notifications for this worker.
+        
+        Rows are selected ``FOR UPDATE SKIP LOCKED`` in the dispatch index
+        order, so concurrent workers each take a disjoint batch without
+        waiting on one another. The locks last until the caller commits the
+        new statuses.
+        
+        Args:
+            session: Session whose transaction will hold the row locks
+            limit: Maximum number of rows to claim
+            
+        Returns:
+            list[NotificationOutbox]: Claimed rows, oldest first
+        """
+        return list(session.scalars(
+            select(cls)
+            .where(cls.status == "pending")
+            .order_by(cls.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ))
@@ -1,8 +1,8 @@
 from __future__ import annotations
 from datetime import datetime
-from sqlalchemy import String, DateTime, Boolean, ForeignKey
+from sqlalchemy import DateTime, Boolean, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
-from ..base import Base, generate_id
+from ..base import Base, UUIDString, generate_id
 
 
 class RefreshToken(Base):
@@ -13,8 +13,14 @@ class RefreshToken(Base):
     """
     __tablename__ = "refresh_tokens"
 
-    jti: Mapped[str] = mapped_column(String, primary_key=True, default=generate_id)
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), index=True)
-    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+    jti: Mapped[str] = mapped_column(UUIDString, primary_key=True, default=generate_id)
+    user_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"))
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     revoked: Mapped[bool] = mapped_column(Boolean, default=False)
 
+    __table_args__ = (
+        # Session listing and revocation only look at live tokens; revoked rows
+        # stay out of the index and expired ones are pruned by a periodic task.
+        Index("ix_refresh_active", "user_id", "expires_at", postgresql_where=text("revoked = false")),
+    )
+
@@ -1,10 +1,10 @@
 from __future__ import annotations
-from sqlalchemy import String, ForeignKey, Numeric, DateTime, CHAR, Index, CheckConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, ForeignKey, Numeric, DateTime, Index, CheckConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship, selectinload, raiseload
 from sqlalchemy.sql import func
 from decimal import Decimal
 from datetime import datetime
-from ..base import Base, generate_id
+from ..base import Base, CurrencyCode, UUIDString, generate_id
 
 
 class Settlement(Base):
@@ -15,27 +15,31 @@ class Settlement(Base):
     """
     __tablename__ = "settlements"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_id)
-    group_id: Mapped[str] = mapped_column(String, ForeignKey("groups.id"), nullable=False)
-    from_user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False)
-    to_user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False)
+    id: Mapped[str] = mapped_column(UUIDString, primary_key=True, default=generate_id)
+    group_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("groups.id"), nullable=False)
+    from_user_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=False)
+    to_user_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=False)
     amount: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
     amount_inr: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
-    currency: Mapped[str] = mapped_column(CHAR(3), nullable=False)
+    currency: Mapped[str] = mapped_column(CurrencyCode, nullable=False)
     method: Mapped[str] = mapped_column(String, nullable=False)
     status: Mapped[str] = mapped_column(String, nullable=False)
     payment_id: Mapped[str | None] = mapped_column(String, nullable=True)
     notes: Mapped[str | None] = mapped_column(String, nullable=True)
     settled_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    created_by: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False)
+    created_by: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     __table_args__ = (
-        Index("idx_settlements_group_id", "group_id"),
-        Index("idx_settlements_from_user_id", "from_user_id"),
-        Index("idx_settlements_to_user_id", "to_user_id"),
-        Index("idx_settlements_status", "status"),
+        # Balance rollups filter by group and status and sum amount_inr per
+        # payer/payee; the INCLUDE columns let Postgres answer them index-only.
+        Index(
+            "ix_settle_group_status_created", "group_id", "status", "created_at",
+            postgresql_include=["amount_inr", "from_user_id", "to_user_id"],
+        ),
+        Index("ix_settle_user_status", "from_user_id", "status"),
+        Index("ix_settle_to_user_status", "to_user_id", "status"),
         CheckConstraint("amount > 0", name="ck_settlement_amount_positive"),
         CheckConstraint("amount_inr > 0", name="ck_settlement_amount_inr_positive"),
         CheckConstraint("method IN ('cash', 'upi', 'bank_transfer')", name="ck_settlement_method"),
@@ -47,3 +51,31 @@ class Settlement(Base):
     from_user: Mapped["User"] = relationship("User", foreign_keys=[from_user_id])
     to_user: Mapped["User"] = relationship("User", foreign_keys=[to_user_id])
     creator: Mapped["User"] = relationship("User", foreign_keys=[created_by])
+
+    @classmethod
+    def options_for_list(cls) -> tuple:
+        """Loader options for queries that render lists of settlements.
+        
+        List endpoints only render ``group_id``, so the group is not loaded.
+        Payer and payee are loaded with one batched ``IN`` query per
+        relationship, which collapses the repeated users a list always
+        contains instead of widening every joined row with full user columns.
+        Outside production any other relationship access on the loaded
+        objects raises instead of lazily issuing one query per row, so N+1
+        regressions surface in tests.
+        
+        Usage:
+            db.scalars(select(Settlement).options(*Settlement.options_for_list()))
+        
+        Returns:
+            tuple: Loader options to pass to ``Select.options``
+        """
+        from ...core.config import settings
+
+        loaders = [
+            selectinload(cls.from_user),
+            selectinload(cls.to_user),
+        ]
+        if settings.environment in {"production", "prod"}:
+            return tuple(loaders)
+        return tuple(loader.raiseload("*") for loader in loaders) + (raiseload("*"),)
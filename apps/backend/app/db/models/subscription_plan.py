@@ -13,11 +13,11 @@ Created: 2025-01-27
 """
 
 from __future__ import annotations
-from sqlalchemy import String, Numeric, Boolean, Integer, Text, ForeignKey, DateTime
+from sqlalchemy import String, Numeric, Boolean, Integer, Text, ForeignKey, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from datetime import datetime
-from ..base import Base
+from ..base import Base, CurrencyCode
 
 
 class SubscriptionPlan(Base):
@@ -48,7 +48,7 @@ class SubscriptionPlan(Base):
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     slug: Mapped[str] = mapped_column(String(100), unique=True, index=True, nullable=False)
     price: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False, default=0)
-    currency: Mapped[str] = mapped_column(String(3), nullable=False, default="INR")
+    currency: Mapped[str] = mapped_column(CurrencyCode, nullable=False, default="INR")
     billing_period: Mapped[str] = mapped_column(String(20), nullable=False, default="month")
     description: Mapped[str] = mapped_column(Text, nullable=True)
     is_popular: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
@@ -62,7 +62,8 @@ class SubscriptionPlan(Base):
         "SubscriptionFeature",
         back_populates="plan",
         cascade="all, delete-orphan",
-        order_by="SubscriptionFeature.display_order"
+        order_by="SubscriptionFeature.display_order",
+        lazy="selectin"
     )
 
 
@@ -91,6 +92,11 @@ class SubscriptionFeature(Base):
     display_order: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
+    __table_args__ = (
+        # Serves the ordered ``plan_id IN (...)`` batch issued when plans load their features.
+        Index("idx_subscription_features_plan_order", "plan_id", "display_order"),
+    )
+
     # Relationships
     plan: Mapped["SubscriptionPlan"] = relationship("SubscriptionPlan", back_populates="features")
 
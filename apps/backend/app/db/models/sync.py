@@ -1,20 +1,20 @@
 from __future__ import annotations
-from sqlalchemy import String, BigInteger, JSON, UniqueConstraint, ForeignKey, DateTime
+from sqlalchemy import String, BigInteger, UniqueConstraint, ForeignKey, DateTime
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
-from ..base import Base
+from ..base import Base, JSONDocument, UUIDString
 
 
 class SyncOp(Base):
     __tablename__ = "sync_ops"
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False)
+    user_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=False)
     seq: Mapped[int] = mapped_column(BigInteger, nullable=False)
     op_type: Mapped[str] = mapped_column(String, nullable=False)
     entity_type: Mapped[str] = mapped_column(String, nullable=False)
     entity_id: Mapped[str] = mapped_column(String, nullable=False)
-    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONDocument, nullable=False)
     created_at: Mapped[object] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     __table_args__ = (
@@ -22,3 +22,16 @@ class SyncOp(Base):
     )
 
 
+
+
+class SyncSeq(Base):
+    """Per-user sync sequence counter.
+
+    ``next_seq`` holds the last sequence number handed out to the user; an
+    atomic upsert increments and returns it, so concurrent writers never
+    receive the same number and sync_ops is never scanned for MAX(seq).
+    """
+    __tablename__ = "sync_seq"
+
+    user_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), primary_key=True)
+    next_seq: Mapped[int] = mapped_column(BigInteger, nullable=False)
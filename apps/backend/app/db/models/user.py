@@ -1,7 +1,9 @@
 from __future__ import annotations
-from sqlalchemy import String, Boolean
+from datetime import datetime
+from sqlalchemy import String, Boolean, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from ..base import Base, generate_id
+from sqlalchemy.sql import func
+from ..base import Base, CurrencyCode, UUIDString, generate_id
 
 
 class PlatformRole(str):
@@ -18,7 +20,7 @@ class User(Base):
     """
     __tablename__ = "users"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_id)
+    id: Mapped[str] = mapped_column(UUIDString, primary_key=True, default=generate_id)
     email: Mapped[str | None] = mapped_column(String, unique=True, index=True, nullable=True)
     hashed_password: Mapped[str] = mapped_column(String)
     role: Mapped[str] = mapped_column(String, default=PlatformRole.BASIC_USER)
@@ -27,10 +29,11 @@ class User(Base):
     apple_sub: Mapped[str | None] = mapped_column(String, unique=True, nullable=True)
     display_name: Mapped[str | None] = mapped_column(String, nullable=True)
     avatar_key: Mapped[str | None] = mapped_column(String, nullable=True)
-    preferred_currency: Mapped[str] = mapped_column(String, default="INR")
+    preferred_currency: Mapped[str] = mapped_column(CurrencyCode, default="INR")
     email_verified: Mapped[bool] = mapped_column(Boolean, default=False)
     phone_verified: Mapped[bool] = mapped_column(Boolean, default=False)
     language: Mapped[str] = mapped_column(String, default="en")
     notifications_enabled: Mapped[bool] = mapped_column(Boolean, default=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     groups: Mapped[list["GroupMember"]] = relationship("GroupMember", back_populates="user", foreign_keys="GroupMember.user_id")
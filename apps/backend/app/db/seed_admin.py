@@ -16,17 +16,76 @@ Key Features:
 """
 
 from __future__ import annotations
+import hashlib
+import hmac
+import json
 import logging
-import random
+import secrets
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator
+from pathlib import Path
+from sqlalchemy import exists, insert, or_, select
 from sqlalchemy.orm import Session
+from .base import generate_id
 from .models.user import User, PlatformRole
 from .session import SessionLocal
 from .deps import get_db
-from ..core.security import hash_password
+from ..core.security import hash_password, pwd_context
 from ..core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Development-only store of seed password hashes, so reseeding a wiped local
+# database does not pay the bcrypt cost again after every restart.
+SEED_CACHE_PATH = Path(__file__).resolve().parents[2] / ".seed_cache.json"
+
+
+def _load_seed_cache() -> dict[str, str]:
+    try:
+        return json.loads(SEED_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_seed_cache(cache: dict[str, str]) -> None:
+    try:
+        SEED_CACHE_PATH.write_text(json.dumps(cache))
+    except OSError as e:
+        logger.debug("Could not write seed password cache: %s", str(e))
+
+
+@lru_cache(maxsize=None)
+def _hash_seed_password(password: str) -> str:
+    """
+    Hash a seed password once per process.
+    
+    Seed users share passwords, so each distinct plaintext is hashed only once.
+    In development the hash is also persisted in ``SEED_CACHE_PATH``, keyed by
+    an HMAC of the password so the plaintext never touches disk. Cached hashes
+    made with an outdated scheme or cost are ignored and replaced.
+    
+    Args:
+        password: Plaintext seed password
+        
+    Returns:
+        str: Password hash suitable for ``User.hashed_password``
+    """
+    if settings.environment not in {"development", "dev", "local"}:
+        return hash_password(password)
+    
+    key = hmac.new(settings.secret_key.encode(), password.encode(), hashlib.sha256).hexdigest()
+    cache = _load_seed_cache()
+    cached = cache.get(key)
+    if cached and not pwd_context.needs_update(cached):
+        return cached
+    
+    hashed = hash_password(password)
+    cache[key] = hashed
+    _write_seed_cache(cache)
+    return hashed
+
+
 def _admin_credentials() -> tuple[str, str, str, str]:
     """
     Resolve admin credentials, using environment values when provided.
@@ -63,18 +122,144 @@ def generate_indian_phone_number() -> str:
         return phone_number
     else:
         # Fallback: generate a simple Indian mobile number
-        # Indian mobile numbers start with 6, 7, 8, or 9
-        first_digit = random.choice(['6', '7', '8', '9'])
-        remaining_digits = ''.join([str(random.randint(0, 9)) for _ in range(9)])
-        return f"+91{first_digit}{remaining_digits}"
+        return generate_indian_phone_numbers(1)[0]
+
+
+def generate_indian_phone_numbers(n: int) -> list[str]:
+    """
+    Generate ``n`` Indian mobile numbers in one batch.
+    
+    Indian mobile numbers are ``+91`` followed by ten digits starting with 6,
+    7, 8 or 9, so each number is a single uniform draw below 4 * 10**9 offset
+    into the 6000000000-9999999999 range. That is one ``secrets`` call per
+    number rather than one call per digit, and Faker's regex-backed provider
+    is skipped entirely.
+    
+    Args:
+        n: How many numbers to generate
+        
+    Returns:
+        list[str]: Phone numbers in ``+91XXXXXXXXXX`` form
+    """
+    return [f"+91{6_000_000_000 + secrets.randbelow(4_000_000_000)}" for _ in range(n)]
+
+
+@contextmanager
+def seed_session() -> Iterator[Session]:
+    """
+    Open a pooled session whose work is committed as a single transaction.
+    
+    Yields:
+        Session: Database session, committed on success and rolled back on error
+    """
+    db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _admin_exists(db: Session) -> bool:
+    """Check for a platform admin with an EXISTS probe instead of loading a row."""
+    return bool(db.scalar(select(exists().where(User.role == PlatformRole.PLATFORM_ADMIN))))
+
+
+# Development test accounts; all share the same password.
+TEST_USERS_DATA = [
+    {
+        "email": "nirnay@example.com",
+        "display_name": "Nirnay Kulshreshtha",
+        "password": "Test@123"
+    },
+    {
+        "email": "jan@example.com", 
+        "display_name": "Janmejay Agrawal",
+        "password": "Test@123"
+    },
+    {
+        "email": "jayant@example.com",
+        "display_name": "Jayant Kumar Singh", 
+        "password": "Test@123"
+    },
+    {
+        "email": "ankit@example.com",
+        "display_name": "Ankit Verma",
+        "password": "Test@123"
+    },
+    {
+        "email": "amit@example.com",
+        "display_name": "Amit Singh Chauhan",
+        "password": "Test@123"
+    }
+]
+TEST_USER_EMAILS = [user_data["email"] for user_data in TEST_USERS_DATA]
+
+
+def _admin_user_row() -> dict:
+    """Build the insert row for the default admin user."""
+    admin_email, admin_password, admin_display_name, admin_phone = _admin_credentials()
+    return {
+        "id": generate_id(),
+        "email": admin_email,
+        "hashed_password": _hash_seed_password(admin_password),
+        "role": PlatformRole.PLATFORM_ADMIN,
+        "display_name": admin_display_name,
+        "phone": admin_phone,
+        "preferred_currency": "INR",
+        "email_verified": True,  # Admin users are pre-verified
+        "phone_verified": True,  # Admin users are pre-verified
+        "notifications_enabled": True,
+        "language": "en",
+    }
+
 
+def _test_user_rows(existing_emails: set[str]) -> list[dict]:
+    """Build insert rows for the test users that do not exist yet."""
+    new_users_data = []
+    for user_data in TEST_USERS_DATA:
+        if user_data["email"] in existing_emails:
+            logger.info("Test user already exists: %s", user_data["email"])
+            continue
+        new_users_data.append(user_data)
+    
+    phone_numbers = generate_indian_phone_numbers(len(new_users_data))
+    return [
+        {
+            "id": generate_id(),
+            "email": user_data["email"],
+            "hashed_password": _hash_seed_password(user_data["password"]),
+            "role": PlatformRole.BASIC_USER,
+            "display_name": user_data["display_name"],
+            "phone": phone_number,
+            "preferred_currency": "INR",
+            "email_verified": True,  # Test users are pre-verified
+            "phone_verified": True,  # Test users are pre-verified
+            "notifications_enabled": True,
+            "language": "en",
+        }
+        for user_data, phone_number in zip(new_users_data, phone_numbers)
+    ]
+
+
+def _insert_users(db: Session, rows: list[dict]) -> list[User]:
+    """Insert user rows with a single batched INSERT ... RETURNING."""
+    if not rows:
+        return []
+    return list(db.scalars(insert(User).returning(User), rows).all())
 
-def create_default_admin_user(db: Session) -> User | None:
+
+def create_default_admin_user(db: Session, admin_exists: bool | None = None) -> User | None:
     """
     Create a default admin user if no admin users exist in the system.
     
     Args:
         db: Database session
+        admin_exists: Result of an existence probe the caller already ran;
+            probed here when omitted
         
     Returns:
         User: The created admin user, or None if admin already exists
@@ -84,31 +269,16 @@ def create_default_admin_user(db: Session) -> User | None:
     """
     try:
         # Check if any admin users already exist
-        existing_admin = db.query(User).filter(User.role == PlatformRole.PLATFORM_ADMIN).first()
-        if existing_admin:
-            logger.info("Admin user already exists: %s", existing_admin.email)
-            return existing_admin
-        
-        admin_email, admin_password, admin_display_name, admin_phone = _admin_credentials()
-        logger.info("Creating default admin user with email: %s", admin_email)
+        if admin_exists is None:
+            admin_exists = _admin_exists(db)
+        if admin_exists:
+            logger.info("Admin user already exists")
+            return None
         
-        # Create the admin user
-        admin_user = User(
-            email=admin_email,
-            hashed_password=hash_password(admin_password),
-            role=PlatformRole.PLATFORM_ADMIN,
-            display_name=admin_display_name,
-            phone=admin_phone,
-            preferred_currency="INR",
-            email_verified=True,  # Admin users are pre-verified
-            phone_verified=True,  # Admin users are pre-verified
-            notifications_enabled=True,
-            language="en"
-        )
+        admin_row = _admin_user_row()
+        logger.info("Creating default admin user with email: %s", admin_row["email"])
         
-        db.add(admin_user)
-        db.commit()
-        db.refresh(admin_user)
+        [admin_user] = _insert_users(db, [admin_row])
         
         logger.info("Successfully created default admin user: %s (ID: %s)", 
                    admin_user.email, admin_user.id)
@@ -117,7 +287,6 @@ def create_default_admin_user(db: Session) -> User | None:
         
     except Exception as e:
         logger.error("Failed to create default admin user: %s", str(e))
-        db.rollback()
         raise
 
 
@@ -134,22 +303,11 @@ def seed_admin_user() -> bool:
     try:
         logger.info("Starting admin user seeding process...")
         
-        # Create a new database session for seeding
-        db = SessionLocal()
-        
-        try:
-            # Create admin user
-            admin_user = create_default_admin_user(db)
-            
-            if admin_user:
-                logger.info("Admin user seeding completed successfully")
-                return True
-            else:
-                logger.warning("No admin user was created during seeding")
-                return False
-                
-        finally:
-            db.close()
+        with seed_session() as db:
+            # Create admin user unless one already exists
+            create_default_admin_user(db)
+            logger.info("Admin user seeding completed successfully")
+            return True
             
     except Exception as e:
         logger.error("Admin user seeding failed: %s", str(e))
@@ -164,12 +322,8 @@ def verify_admin_user_exists() -> bool:
         bool: True if admin user exists, False otherwise
     """
     try:
-        db = SessionLocal()
-        try:
-            admin_user = db.query(User).filter(User.role == PlatformRole.PLATFORM_ADMIN).first()
-            return admin_user is not None
-        finally:
-            db.close()
+        with seed_session() as db:
+            return _admin_exists(db)
     except Exception as e:
         logger.error("Failed to verify admin user existence: %s", str(e))
         return False
@@ -183,35 +337,37 @@ def get_admin_user_info() -> dict | None:
         dict: Admin user information, or None if no admin exists
     """
     try:
-        db = SessionLocal()
-        try:
-            admin_user = db.query(User).filter(User.role == PlatformRole.PLATFORM_ADMIN).first()
-            if admin_user:
-                return {
-                    "id": admin_user.id,
-                    "email": admin_user.email,
-                    "display_name": admin_user.display_name,
-                    "role": admin_user.role,
-                    "email_verified": admin_user.email_verified,
-                    "phone_verified": admin_user.phone_verified,
-                    "preferred_currency": admin_user.preferred_currency,
-                    "language": admin_user.language,
-                    "notifications_enabled": admin_user.notifications_enabled
-                }
-            return None
-        finally:
-            db.close()
+        with seed_session() as db:
+            # Select only the reported columns; no mapped User instance is built
+            admin_row = db.execute(
+                select(
+                    User.id,
+                    User.email,
+                    User.display_name,
+                    User.role,
+                    User.email_verified,
+                    User.phone_verified,
+                    User.preferred_currency,
+                    User.language,
+                    User.notifications_enabled,
+                )
+                .where(User.role == PlatformRole.PLATFORM_ADMIN)
+                .limit(1)
+            ).first()
+            return dict(admin_row._mapping) if admin_row else None
     except Exception as e:
         logger.error("Failed to get admin user info: %s", str(e))
         return None
 
 
-def create_test_users(db: Session) -> list[User]:
+def create_test_users(db: Session, existing_emails: set[str] | None = None) -> list[User]:
     """
     Create test users for development and testing purposes.
     
     Args:
         db: Database session
+        existing_emails: Test user emails the caller already found in the
+            database; looked up here with one query when omitted
         
     Returns:
         list[User]: List of created test users
@@ -220,82 +376,19 @@ def create_test_users(db: Session) -> list[User]:
         Exception: If there's an error creating test users
     """
     try:
-        # Define test users with their details
-        test_users_data = [
-            {
-                "email": "nirnay@example.com",
-                "display_name": "Nirnay Kulshreshtha",
-                "password": "Test@123"
-            },
-            {
-                "email": "jan@example.com", 
-                "display_name": "Janmejay Agrawal",
-                "password": "Test@123"
-            },
-            {
-                "email": "jayant@example.com",
-                "display_name": "Jayant Kumar Singh", 
-                "password": "Test@123"
-            },
-            {
-                "email": "ankit@example.com",
-                "display_name": "Ankit Verma",
-                "password": "Test@123"
-            },
-            {
-                "email": "amit@example.com",
-                "display_name": "Amit Singh Chauhan",
-                "password": "Test@123"
-            }
-        ]
-        
-        created_users = []
+        if existing_emails is None:
+            existing_emails = set(db.scalars(select(User.email).where(User.email.in_(TEST_USER_EMAILS))))
         
-        for user_data in test_users_data:
-            # Check if user already exists
-            existing_user = db.query(User).filter(User.email == user_data["email"]).first()
-            if existing_user:
-                logger.info("Test user already exists: %s", user_data["email"])
-                created_users.append(existing_user)
-                continue
-            
-            # Generate Indian phone number
-            phone_number = generate_indian_phone_number()
-            
-            logger.info("Creating test user: %s", user_data["email"])
-            
-            # Create the test user
-            test_user = User(
-                email=user_data["email"],
-                hashed_password=hash_password(user_data["password"]),
-                role=PlatformRole.BASIC_USER,
-                display_name=user_data["display_name"],
-                phone=phone_number,
-                preferred_currency="INR",
-                email_verified=True,  # Test users are pre-verified
-                phone_verified=True,  # Test users are pre-verified
-                notifications_enabled=True,
-                language="en"
-            )
-            
-            db.add(test_user)
-            created_users.append(test_user)
-            
+        created_users = _insert_users(db, _test_user_rows(existing_emails))
+        for test_user in created_users:
             logger.info("Successfully created test user: %s (ID: %s, Phone: %s)", 
                        test_user.email, test_user.id, test_user.phone)
         
-        db.commit()
-        
-        # Refresh all users to get their IDs
-        for user in created_users:
-            db.refresh(user)
-        
         logger.info("Successfully created %d test users", len(created_users))
         return created_users
         
     except Exception as e:
         logger.error("Failed to create test users: %s", str(e))
-        db.rollback()
         raise
 
 
@@ -312,29 +405,38 @@ def seed_all_users() -> bool:
     try:
         logger.info("Starting comprehensive user seeding process...")
         
-        # Create a new database session for seeding
-        db = SessionLocal()
-        
-        try:
-            # Create admin user
-            admin_user = create_default_admin_user(db)
-            admin_created = admin_user is not None
+        with seed_session() as db:
+            admin_email = _admin_credentials()[0]
             
-            # Create test users
-            test_users = create_test_users(db)
-            test_users_created = len(test_users) > 0
+            # One probe answers both "is there an admin?" and "which test users exist?"
+            existing = db.execute(
+                select(User.email, User.role).where(
+                    or_(
+                        User.email.in_([admin_email, *TEST_USER_EMAILS]),
+                        User.role == PlatformRole.PLATFORM_ADMIN,
+                    )
+                )
+            ).all()
+            existing_emails = {row.email for row in existing}
+            admin_exists = any(row.role == PlatformRole.PLATFORM_ADMIN for row in existing)
             
-            if admin_created or test_users_created:
-                logger.info("User seeding completed successfully")
-                logger.info("Admin user exists: %s", admin_created)
-                logger.info("Test users created: %d", len(test_users))
-                return True
+            rows = []
+            if admin_exists:
+                logger.info("Admin user already exists")
+            elif admin_email in existing_emails:
+                logger.warning("Admin email %s belongs to a non-admin user; skipping admin seeding", admin_email)
             else:
-                logger.warning("No users were created during seeding")
-                return False
-                
-        finally:
-            db.close()
+                rows.append(_admin_user_row())
+            rows.extend(_test_user_rows(existing_emails))
+            
+            # Admin and test users go in with one INSERT and one commit
+            created_users = _insert_users(db, rows)
+            for user in created_users:
+                logger.info("Created user: %s (ID: %s, Role: %s)", user.email, user.id, user.role)
+            
+            logger.info("User seeding completed successfully")
+            logger.info("Users created: %d", len(created_users))
+            return True
             
     except Exception as e:
         logger.error("User seeding failed: %s", str(e))
@@ -349,8 +451,7 @@ def get_all_users_info() -> dict:
         dict: Information about all users in the system
     """
     try:
-        db = SessionLocal()
-        try:
+        with seed_session() as db:
             all_users = db.query(User).all()
             users_info = []
             
@@ -374,8 +475,6 @@ def get_all_users_info() -> dict:
                 "basic_users": len([u for u in users_info if u["role"] == PlatformRole.BASIC_USER]),
                 "users": users_info
             }
-        finally:
-            db.close()
     except Exception as e:
         logger.error("Failed to get all users info: %s", str(e))
         return {"error": str(e)}
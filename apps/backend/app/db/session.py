@@ -1,6 +1,8 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 from ..core.config import settings
+from ..core.performance import PerformanceConfig
 
 
 # Optimized database engine configuration for better performance
@@ -9,11 +11,12 @@ engine = create_engine(
     future=True, 
     pool_pre_ping=True,
     # Connection pool settings for better performance
-    pool_size=20,  # Increased for better performance
-    max_overflow=30,  # Increased for better performance
-    pool_timeout=30,  # Increased timeout for better reliability
-    pool_recycle=3600,  # Recycle connections after 1 hour
-    pool_reset_on_return='commit',  # Reset connections when returned to pool
+    pool_size=PerformanceConfig.DB_POOL_SIZE,  # Per worker; see PerformanceConfig
+    max_overflow=PerformanceConfig.DB_MAX_OVERFLOW,
+    pool_timeout=PerformanceConfig.DB_POOL_TIMEOUT,
+    pool_recycle=PerformanceConfig.DB_POOL_RECYCLE,  # Recycle connections after 1 hour
+    pool_use_lifo=True,  # Reuse the most recently returned connection; idle ones age out via pool_recycle
+    pool_reset_on_return='rollback',  # Roll back (a no-op when idle) instead of COMMITting on checkin
     # Query optimization
     echo=False,  # Set to True for SQL query logging in development
     echo_pool=False,  # Set to True for connection pool logging
@@ -26,4 +29,25 @@ engine = create_engine(
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)
 
+PerformanceConfig.check_pool_budget()
+
+
+# Async engine for `async def` endpoints. psycopg 3 ships a native asyncio
+# driver, so the same `postgresql+psycopg://` URL works for both engines and
+# awaiting a query releases the event loop instead of blocking it.
+async_engine = create_async_engine(
+    str(settings.database_url),
+    pool_pre_ping=True,
+    pool_size=PerformanceConfig.DB_ASYNC_POOL_SIZE,  # Share of the per-worker budget; see PerformanceConfig
+    max_overflow=PerformanceConfig.DB_ASYNC_MAX_OVERFLOW,
+    pool_timeout=PerformanceConfig.DB_POOL_TIMEOUT,
+    pool_recycle=PerformanceConfig.DB_POOL_RECYCLE,
+    pool_use_lifo=True,
+    connect_args={
+        "application_name": "baantlo_backend_async",
+        "connect_timeout": 30,
+    },
+)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
 
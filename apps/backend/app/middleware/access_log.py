@@ -1,7 +1,8 @@
 """
-Access Log Middleware for FastAPI
+Access log formatting for FastAPI
 
-This middleware provides enhanced access logging with request timing information.
+Provides enhanced access logging with request timing information, used by
+:class:`app.middleware.observability.ObservabilityMiddleware`.
 It logs requests in a format similar to Uvicorn's access log but includes request duration,
 color coding for HTTP methods and status codes, and timestamps.
 """
@@ -10,11 +11,6 @@ from __future__ import annotations
 import time
 import logging
 import os
-from datetime import datetime
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
 
 # Get the uvicorn.access logger to maintain consistency
 access_logger = logging.getLogger("uvicorn.access")
@@ -60,245 +56,168 @@ class Colors:
     PATH = "\033[97m"        # Bright White
 
 
-class AccessLogMiddleware(BaseHTTPMiddleware):
+# HTTP status text for common status codes
+_STATUS_TEXTS = {
+    200: "OK",
+    201: "Created",
+    202: "Accepted",
+    204: "No Content",
+    301: "Moved Permanently",
+    302: "Found",
+    304: "Not Modified",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    422: "Unprocessable Entity",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+}
+
+
+def _status_color_for(status_code: int) -> str:
     """
-    Middleware for logging HTTP requests with timing, timestamp, and color coding.
+    Get color code for HTTP status code.
     
-    This middleware logs requests in the format:
-    INFO:     [<timestamp>] <client_ip>:<port> - "<colored_method> <path> <protocol>" <colored_status> <duration>
-    
-    Features:
-    - Request/response timing
-    - Request timestamp (when request hit the server)
-    - Color coding for HTTP methods and status codes
-    - Consistent format with Uvicorn access logs
-    - Includes request duration in seconds
+    Args:
+        status_code: HTTP status code
+        
+    Returns:
+        ANSI color code string
+    """
+    if 200 <= status_code < 300:
+        return Colors.STATUS_2XX
+    elif 300 <= status_code < 400:
+        return Colors.STATUS_3XX
+    elif 400 <= status_code < 500:
+        return Colors.STATUS_4XX
+    elif 500 <= status_code < 600:
+        return Colors.STATUS_5XX
+    else:
+        return Colors.RESET
+
+
+# Method and status strings are a small fixed set, so they are rendered once
+# at import time and looked up per request instead of being reassembled.
+_METHOD_COLORED = {
+    method: f"{color}{Colors.BOLD}{method}{Colors.RESET}"
+    for method, color in [
+        ("GET", Colors.GET),
+        ("POST", Colors.POST),
+        ("PUT", Colors.PUT),
+        ("PATCH", Colors.PATCH),
+        ("DELETE", Colors.DELETE),
+        ("OPTIONS", Colors.OPTIONS),
+        ("HEAD", Colors.HEAD),
+    ]
+}
+_STATUS_PLAIN = {code: f"{code} {text}" for code, text in _STATUS_TEXTS.items()}
+_STATUS_COLORED = {
+    code: f"{_status_color_for(code)}{status_str}{Colors.RESET}"
+    for code, status_str in _STATUS_PLAIN.items()
+}
+
+
+def _compute_use_colors() -> bool:
     """
+    Determine if colors should be used based on environment.
     
-    def __init__(self, app: ASGIApp, use_colors: bool = True):
-        super().__init__(app)
-        # Check if colors should be enabled (terminal support and environment)
-        self.use_colors = use_colors and self._should_use_colors()
+    Returns:
+        True if colors should be enabled, False otherwise
+    """
+    # Check environment variable (can be set to disable colors)
+    no_color = os.getenv("NO_COLOR") or os.getenv("FORCE_COLOR") == "0"
+    if no_color:
+        return False
     
-    def _should_use_colors(self) -> bool:
-        """
-        Determine if colors should be used based on environment.
-        
-        Returns:
-            True if colors should be enabled, False otherwise
-        """
-        # Check environment variable (can be set to disable colors)
-        no_color = os.getenv("NO_COLOR") or os.getenv("FORCE_COLOR") == "0"
-        if no_color:
-            return False
-        
-        # Force color can be enabled via environment variable (even without TTY)
-        force_color = os.getenv("FORCE_COLOR", "").lower() in ("1", "true", "yes")
-        if force_color:
-            return True
-        
-        # Check if we're in a terminal that supports colors
-        if not os.isatty(1):  # stdout is not a TTY
-            return False
-        
-        # Default to True if terminal supports it and no explicit disable
+    # Force color can be enabled via environment variable (even without TTY)
+    force_color = os.getenv("FORCE_COLOR", "").lower() in ("1", "true", "yes")
+    if force_color:
         return True
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """
-        Process request with access logging.
-        
-        Args:
-            request: The incoming request
-            call_next: The next middleware/handler in the chain
-            
-        Returns:
-            The response from the next handler
-        """
-        # Record start time and timestamp
-        start_time = time.time()
-        request_timestamp = datetime.now()
-        
-        # Get client information
-        client_host = request.client.host if request.client else "unknown"
-        client_port = request.client.port if request.client else 0
-        
-        try:
-            # Process the request
-            response = await call_next(request)
-            
-            # Calculate duration
-            duration = time.time() - start_time
-            
-            # Log access with timing and timestamp
-            self._log_access(
-                client_host=client_host,
-                client_port=client_port,
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
-                duration=duration,
-                timestamp=request_timestamp
-            )
-            
-            return response
-            
-        except Exception as e:
-            # Calculate duration even on error
-            duration = time.time() - start_time
-            
-            # Determine status code from exception
-            status_code = 500
-            if hasattr(e, 'status_code'):
-                status_code = e.status_code
-            
-            # Log access with error status and timestamp
-            self._log_access(
-                client_host=client_host,
-                client_port=client_port,
-                method=request.method,
-                path=request.url.path,
-                status_code=status_code,
-                duration=duration,
-                timestamp=request_timestamp
-            )
-            
-            raise
+    # Check if we're in a terminal that supports colors
+    if not os.isatty(1):  # stdout is not a TTY
+        return False
     
-    def _log_access(
-        self,
-        client_host: str,
-        client_port: int,
-        method: str,
-        path: str,
-        status_code: int,
-        duration: float,
-        timestamp: datetime
-    ) -> None:
-        """
-        Log access request with timing, timestamp, and color coding.
-        
-        Args:
-            client_host: Client IP address
-            client_port: Client port number
-            method: HTTP method
-            path: Request path
-            status_code: HTTP status code
-            duration: Request duration in seconds
-            timestamp: Timestamp when the request hit the server
-        """
-        # Format duration for readability (3 decimal places)
-        duration_str = f"{duration:.3f}s"
-        
-        # Format timestamp (ISO 8601 format with milliseconds)
-        timestamp_str = timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]  # Remove last 3 digits of microseconds
-        
-        # Get status text
-        status_text = self._get_status_text(status_code)
-        status_str = f"{status_code} {status_text}" if status_text else str(status_code)
-        
-        # Apply colors if enabled
-        if self.use_colors:
-            method_color = self._get_method_color(method)
-            status_color = self._get_status_color(status_code)
-            timestamp_colored = f"{Colors.TIMESTAMP}[{timestamp_str}]{Colors.RESET}"
-            method_colored = f"{method_color}{Colors.BOLD}{method}{Colors.RESET}"
-            path_colored = f"{Colors.PATH}{path}{Colors.RESET}"
-            status_colored = f"{status_color}{status_str}{Colors.RESET}"
-            duration_colored = f"{Colors.DURATION}({duration_str}){Colors.RESET}"
-            
-            # Log in Uvicorn-style format with timing, timestamp, and colors
-            log_message = (
-                f'{timestamp_colored} {client_host}:{client_port} - '
-                f'"{method_colored} {path_colored} HTTP/1.1" '
-                f'{status_colored} {duration_colored}'
-            )
-        else:
-            # Log without colors
-            log_message = (
-                f'[{timestamp_str}] {client_host}:{client_port} - "{method} {path} HTTP/1.1" '
-                f'{status_str} ({duration_str})'
-            )
-        
-        # Use appropriate log level based on status code
-        if status_code >= 500:
-            access_logger.error(log_message)
-        elif status_code >= 400:
-            access_logger.warning(log_message)
-        else:
-            access_logger.info(log_message)
+    # Default to True if terminal supports it and no explicit disable
+    return True
+
+
+_USE_COLORS = _compute_use_colors()
+
+
+def log_access(
+    client_host: str,
+    client_port: int,
+    method: str,
+    path: str,
+    status_code: int,
+    duration: float,
+    start_time: float,
+    use_colors: bool = True
+) -> None:
+    """
+    Log access request with timing, timestamp, and color coding.
     
-    def _get_method_color(self, method: str) -> str:
-        """
-        Get color code for HTTP method.
-        
-        Args:
-            method: HTTP method (GET, POST, PUT, etc.)
-            
-        Returns:
-            ANSI color code string
-        """
-        method_colors = {
-            "GET": Colors.GET,
-            "POST": Colors.POST,
-            "PUT": Colors.PUT,
-            "PATCH": Colors.PATCH,
-            "DELETE": Colors.DELETE,
-            "OPTIONS": Colors.OPTIONS,
-            "HEAD": Colors.HEAD,
-        }
-        return method_colors.get(method.upper(), Colors.RESET)
+    Requests are logged in the format:
+    INFO:     [<timestamp>] <client_ip>:<port> - "<colored_method> <path> <protocol>" <colored_status> <duration>
     
-    def _get_status_color(self, status_code: int) -> str:
-        """
-        Get color code for HTTP status code.
-        
-        Args:
-            status_code: HTTP status code
-            
-        Returns:
-            ANSI color code string
-        """
-        if 200 <= status_code < 300:
-            return Colors.STATUS_2XX
-        elif 300 <= status_code < 400:
-            return Colors.STATUS_3XX
-        elif 400 <= status_code < 500:
-            return Colors.STATUS_4XX
-        elif 500 <= status_code < 600:
-            return Colors.STATUS_5XX
-        else:
-            return Colors.RESET
+    Args:
+        client_host: Client IP address
+        client_port: Client port number
+        method: HTTP method
+        path: Request path
+        status_code: HTTP status code
+        duration: Request duration in seconds
+        start_time: Epoch seconds when the request hit the server
+        use_colors: Whether to color the line (also requires terminal/environment support)
+    """
+    # Use appropriate log level based on status code; skip all formatting
+    # when the access logger would drop the record anyway
+    if status_code >= 500:
+        level = logging.ERROR
+    elif status_code >= 400:
+        level = logging.WARNING
+    else:
+        level = logging.INFO
+    if not access_logger.isEnabledFor(level):
+        return
     
-    def _get_status_text(self, status_code: int) -> str:
-        """
-        Get HTTP status text for common status codes.
+    # Format duration as whole milliseconds (integer formatting is cheaper than :.3f)
+    duration_str = f"{int(duration * 1000)}ms"
+    
+    # Format timestamp (ISO 8601 format with milliseconds)
+    sec = int(start_time)
+    ms = int((start_time - sec) * 1000)
+    timestamp_str = f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))}.{ms:03d}"
+    
+    # Apply colors if enabled
+    if use_colors and _USE_COLORS:
+        timestamp_colored = f"{Colors.TIMESTAMP}[{timestamp_str}]{Colors.RESET}"
+        method_colored = _METHOD_COLORED.get(method, method)
+        path_colored = f"{Colors.PATH}{path}{Colors.RESET}"
+        status_colored = (
+            _STATUS_COLORED.get(status_code)
+            or f"{_status_color_for(status_code)}{status_code}{Colors.RESET}"
+        )
+        duration_colored = f"{Colors.DURATION}({duration_str}){Colors.RESET}"
         
-        Args:
-            status_code: HTTP status code
-            
-        Returns:
-            Status text string
-        """
-        status_texts = {
-            200: "OK",
-            201: "Created",
-            202: "Accepted",
-            204: "No Content",
-            301: "Moved Permanently",
-            302: "Found",
-            304: "Not Modified",
-            400: "Bad Request",
-            401: "Unauthorized",
-            403: "Forbidden",
-            404: "Not Found",
-            405: "Method Not Allowed",
-            409: "Conflict",
-            422: "Unprocessable Entity",
-            429: "Too Many Requests",
-            500: "Internal Server Error",
-            502: "Bad Gateway",
-            503: "Service Unavailable",
-        }
-        return status_texts.get(status_code, "")
-
+        # Log in Uvicorn-style format with timing, timestamp, and colors
+        log_message = (
+            f'{timestamp_colored} {client_host}:{client_port} - '
+            f'"{method_colored} {path_colored} HTTP/1.1" '
+            f'{status_colored} {duration_colored}'
+        )
+    else:
+        # Log without colors
+        status_str = _STATUS_PLAIN.get(status_code) or str(status_code)
+        log_message = (
+            f'[{timestamp_str}] {client_host}:{client_port} - "{method} {path} HTTP/1.1" '
+            f'{status_str} ({duration_str})'
+        )
+    
+    access_logger.log(level, log_message)
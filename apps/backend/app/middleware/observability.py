@@ -0,0 +1,155 @@
+"""
+Observability middleware for FastAPI.
+
+A single pure-ASGI middleware that handles all per-request monitoring:
+- Access logging (Uvicorn-style line with timestamp, colors and duration)
+- Response timing and memory headers (X-Response-Time, X-Memory-Usage)
+- Slow request detection
+
+Doing this in one middleware means one start-time read, one send wrapper and
+one extra stack frame per request instead of one of each per concern.
+"""
+
+from __future__ import annotations
+import time
+import logging
+import psutil
+import os
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .access_log import log_access
+
+logger = logging.getLogger(__name__)
+
+# Resident memory is sampled at most once per interval (seconds); every
+# request inside the window reuses the cached reading.
+RSS_SAMPLE_INTERVAL = 0.5
+
+
+class ObservabilityMiddleware:
+    """
+    Middleware for access logging, response timing and slow request detection.
+
+    Features:
+    - Access log line for every request (including failed ones)
+    - X-Response-Time / X-Memory-Usage response headers
+    - WARNING log for requests slower than ``slow_threshold`` seconds
+
+    Implemented as a plain ASGI middleware: the status code is captured and
+    the headers are appended from the ``http.response.start`` message, so no
+    Request/Response objects or BaseHTTPMiddleware task group are created per
+    request. Memory usage comes from a cached RSS sample refreshed at most
+    once every ``RSS_SAMPLE_INTERVAL`` seconds.
+    """
+
+    def __init__(self, app: ASGIApp, slow_threshold: float = 1.0, use_colors: bool = True):
+        self.app = app
+        self.slow_threshold = slow_threshold
+        self.use_colors = use_colors
+        self.process = psutil.Process(os.getpid())
+        self._mem_cache = (0.0, 0.0)
+
+    def _rss_mb(self) -> float:
+        """
+        Return the process resident set size in MB.
+
+        Reading RSS costs a /proc read, so the value is cached and only
+        refreshed when the cached sample is older than RSS_SAMPLE_INTERVAL.
+
+        Returns:
+            Resident memory in MB (possibly up to one interval stale)
+        """
+        now = time.monotonic()
+        sampled_at, rss_mb = self._mem_cache
+        if now - sampled_at < RSS_SAMPLE_INTERVAL:
+            return rss_mb
+        rss_mb = self.process.memory_info().rss / 1048576
+        self._mem_cache = (now, rss_mb)
+        return rss_mb
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process request with access logging and performance monitoring.
+
+        Args:
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Durations use the monotonic high-resolution clock; wall-clock time
+        # is only needed for the human-readable access log timestamp
+        start = time.perf_counter()
+        start_time = time.time()
+        start_memory = self._rss_mb()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                duration_ms = int((time.perf_counter() - start) * 1000)
+                headers = list(message.get("headers", ()))
+                headers.append((b"x-response-time", f"{duration_ms}ms".encode("latin-1")))
+                headers.append((b"x-memory-usage", f"{self._rss_mb():.1f}MB".encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            # Process the request
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            # Determine status code from exception
+            status_code = getattr(e, "status_code", 500)
+            raise
+        finally:
+            # Log access and slow requests, even on error
+            self._log(scope, status_code, time.perf_counter() - start, start_time, start_memory)
+
+    def _log(
+        self,
+        scope: Scope,
+        status_code: int,
+        duration: float,
+        start_time: float,
+        start_memory: float
+    ) -> None:
+        """
+        Emit the access log line and, for slow requests, a WARNING.
+
+        Args:
+            scope: The ASGI connection scope
+            status_code: HTTP status code sent to the client
+            duration: Request duration in seconds
+            start_time: Epoch seconds when the request hit the server
+            start_memory: Memory usage in MB when the request started
+        """
+        method = scope["method"]
+        path = scope["path"]
+        # Read straight from the scope; no Request object or property parsing
+        client_host, client_port = scope.get("client") or ("unknown", 0)
+
+        log_access(
+            client_host=client_host,
+            client_port=client_port,
+            method=method,
+            path=path,
+            status_code=status_code,
+            duration=duration,
+            start_time=start_time,
+            use_colors=self.use_colors
+        )
+
+        # Log slow requests with additional context
+        if duration > self.slow_threshold:
+            memory_delta = self._rss_mb() - start_memory
+            query_string = scope.get("query_string", b"")
+            logger.warning(
+                f"🐌 SLOW REQUEST DETECTED: {method} {path} "
+                f"took {int(duration * 1000)}ms (threshold: {self.slow_threshold}s) "
+                f"| Status: {status_code} | Memory: {memory_delta:+.1f}MB"
+                + (f" | Query: {query_string.decode('latin-1')}" if query_string else "")
+            )
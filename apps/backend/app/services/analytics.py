@@ -10,18 +10,321 @@ and include comprehensive logging for debugging purposes.
 """
 
 from __future__ import annotations
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_, or_, case, text
+from sqlalchemy import func, desc, and_, or_, select, text
 from decimal import Decimal
 
 from ..db.models import (
     User, Group, GroupMember, Expense, Settlement, FriendInvite, 
     Friendship, AuditLog, NotificationOutbox, SyncOp
 )
+from ..db.session import SessionLocal
+from .audit import ERROR_ACTION_PREFIX
 
+logger = logging.getLogger(__name__)
 
+
+# Dashboards poll with the same parameters every few seconds, so results are
+# cached per process. An omitted end_date is pinned to the start of the
+# current ANALYTICS_CACHE_BUCKET_MINUTES bucket so "up to now" requests share
+# an entry instead of each getting a unique utcnow().
+ANALYTICS_CACHE_TTL = 60
+ANALYTICS_CACHE_MAXSIZE = 256
+ANALYTICS_CACHE_BUCKET_MINUTES = 5
+
+# Upper bound on any single statement run for the comprehensive dashboard
+ANALYTICS_STATEMENT_TIMEOUT = "3s"
+
+# Threads shared by every dashboard request in the process. Each holds one
+# pooled connection while it runs a section, so this caps the extra
+# connections analytics takes well below PerformanceConfig.DB_POOL_SIZE no
+# matter how many admins poll at once.
+ANALYTICS_MAX_WORKERS = 2
+_analytics_executor = ThreadPoolExecutor(max_workers=ANALYTICS_MAX_WORKERS, thread_name_prefix="analytics")
+
+_analytics_cache: Dict[Tuple, Tuple[float, Any]] = {}
+_analytics_cache_lock = threading.Lock()
+
+
+def _bucketed_now() -> datetime:
+    """
+    Current UTC time floored to the start of its cache bucket.
+    
+    Analytics functions use this instead of ``utcnow()`` for every "now"
+    (default end dates, "last 24 hours" cut-offs), so every call within a
+    bucket sees the same timestamps and can share cached results.
+    """
+    now = datetime.utcnow().replace(second=0, microsecond=0)
+    return now - timedelta(minutes=now.minute % ANALYTICS_CACHE_BUCKET_MINUTES)
+
+
+def invalidate_analytics_cache() -> None:
+    """Drop every cached analytics result held by this process."""
+    with _analytics_cache_lock:
+        _analytics_cache.clear()
+
+
+def _ttl_cached(func: Callable) -> Callable:
+    """
+    Cache a date-range analytics function for ANALYTICS_CACHE_TTL seconds.
+    
+    The key is (function name, start_date, bucketed end_date, *other args);
+    the Session argument is not part of it. Empty results (the functions'
+    error fallback) are not cached.
+    
+    Args:
+        func: Function taking (db, start_date, end_date, ...)
+    
+    Returns:
+        The caching wrapper
+    """
+    @functools.wraps(func)
+    def wrapper(
+        db: Session,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        *args: Any,
+        **kwargs: Any
+    ) -> Any:
+        if end_date is None:
+            end_date = _bucketed_now()
+        key = (func.__name__, start_date, end_date, *args, *sorted(kwargs.items()))
+        now = time.monotonic()
+        
+        with _analytics_cache_lock:
+            entry = _analytics_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        result = func(db, start_date, end_date, *args, **kwargs)
+        if result:
+            with _analytics_cache_lock:
+                if len(_analytics_cache) >= ANALYTICS_CACHE_MAXSIZE:
+                    # Drop expired entries first, then the oldest insertions
+                    for k in [k for k, (expires, _) in _analytics_cache.items() if expires <= now]:
+                        del _analytics_cache[k]
+                    while len(_analytics_cache) >= ANALYTICS_CACHE_MAXSIZE:
+                        del _analytics_cache[next(iter(_analytics_cache))]
+                _analytics_cache[key] = (now + ANALYTICS_CACHE_TTL, result)
+        return result
+    
+    return wrapper
+
+
+def _read_rollup(db: Session, statement, params: Dict[str, Any]) -> Optional[list]:
+    """
+    Read pre-aggregated rows from an analytics materialized view or function.
+    
+    The read runs inside a savepoint so a missing view or function (e.g. a
+    development database created without migrations) doesn't poison the
+    session.
+    
+    Args:
+        db: Database session
+        statement: Query against one of the app.db.analytics_views objects
+        params: Bound parameters
+    
+    Returns:
+        The rows as mappings, or None when the object is unavailable and the caller
+        should fall back to the live query
+    """
+    try:
+        with db.begin_nested():
+            return db.execute(statement, params).mappings().all()
+    except Exception as e:
+        logger.warning("Rollup unavailable, using live query: %s", e)
+        return None
+
+
+def _approx_count(db: Session, model) -> int:
+    """
+    Approximate row count of a model's table from planner statistics.
+    
+    Reading ``pg_class.reltuples`` is O(1) where ``count(*)`` scans the
+    table; the estimate is refreshed by (auto)vacuum/analyze, which is
+    accurate enough for dashboard totals. Tables that have never been
+    analyzed report -1, in which case the exact count is used.
+    
+    Args:
+        db: Database session
+        model: ORM model whose table to count
+    
+    Returns:
+        Estimated number of rows
+    """
+    table = model.__table__
+    estimate = db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+        {"table": table.name},
+    ).scalar()
+    if estimate is None or estimate < 0:
+        return db.query(func.count()).select_from(table).scalar() or 0
+    return int(estimate)
+
+
+def _rollup_window(start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+    """Day-granular bounds for querying the daily materialized views."""
+    return {"start_day": start_date.date(), "end_day": end_date.date()}
+
+
+# date_trunc() field names accepted for ``group_by``; anything else falls back to "day"
+TIME_SERIES_GRANULARITIES = frozenset({"day", "week", "month"})
+
+# One round-trip for all three series: each CTE buckets its own table and is
+# left-joined onto a generate_series() of every bucket in the window, so the
+# result is dense (empty buckets report zeros) and already in date order.
+# {bucket} is the bucketing expression over created_at and {buckets} the
+# matching series, exposed as b(d).
+_TIME_SERIES_TEMPLATE = """
+    WITH u AS (
+        SELECT {bucket} AS d, count(*) AS n
+        FROM users
+        WHERE created_at >= :start_date AND created_at <= :end_date
+        GROUP BY 1
+    ), e AS (
+        SELECT {bucket} AS d, count(*) AS n
+        FROM expenses
+        WHERE created_at >= :start_date AND created_at <= :end_date AND deleted_at IS NULL
+        GROUP BY 1
+    ), s AS (
+        SELECT {bucket} AS d, count(*) AS n
+        FROM settlements
+        WHERE created_at >= :start_date AND created_at <= :end_date
+        GROUP BY 1
+    )
+    SELECT b.d AS date,
+           coalesce(u.n, 0) AS users,
+           coalesce(e.n, 0) AS expenses,
+           coalesce(s.n, 0) AS settlements
+    FROM {buckets}
+    LEFT JOIN u ON u.d = b.d
+    LEFT JOIN e ON e.d = b.d
+    LEFT JOIN s ON s.d = b.d
+    ORDER BY 1
+"""
+
+# Days use a plain cast, which is cheaper than date_trunc() and matches the
+# idx_*_created_day expression indexes in ensure_indexes; date_trunc() is
+# only needed for week/month. The UTC conversion keeps the cast immutable.
+_TIME_SERIES_DAILY_SQL = text(_TIME_SERIES_TEMPLATE.format(
+    bucket="(created_at AT TIME ZONE 'UTC')::date",
+    buckets="""(
+        SELECT g::date AS d
+        FROM generate_series(
+            (CAST(:start_date AS timestamptz) AT TIME ZONE 'UTC')::date,
+            (CAST(:end_date AS timestamptz) AT TIME ZONE 'UTC')::date,
+            interval '1 day'
+        ) AS g
+    ) AS b""",
+))
+_TIME_SERIES_SQL = text(_TIME_SERIES_TEMPLATE.format(
+    bucket="date_trunc(:granularity, created_at)",
+    buckets="""generate_series(
+        date_trunc(:granularity, CAST(:start_date AS timestamptz)),
+        date_trunc(:granularity, CAST(:end_date AS timestamptz)),
+        CAST(:step AS interval)
+    ) AS b(d)""",
+))
+
+# Same series from the daily materialized view, as-is for days and rolled up
+# to weeks/months otherwise; the day filter sits in the join so empty
+# buckets survive as zeros
+_TIME_SERIES_DAILY_ROLLUP_SQL = text("""
+    SELECT b.d AS date,
+           coalesce(m.users, 0) AS users,
+           coalesce(m.expenses, 0) AS expenses,
+           coalesce(m.settlements, 0) AS settlements
+    FROM (
+        SELECT g::date AS d
+        FROM generate_series(CAST(:start_day AS date), CAST(:end_day AS date), interval '1 day') AS g
+    ) AS b
+    LEFT JOIN mv_timeseries_daily m ON m.day = b.d
+    ORDER BY 1
+""")
+
+_TIME_SERIES_ROLLUP_SQL = text("""
+    SELECT b.d AS date,
+           coalesce(sum(m.users), 0) AS users,
+           coalesce(sum(m.expenses), 0) AS expenses,
+           coalesce(sum(m.settlements), 0) AS settlements
+    FROM generate_series(
+        date_trunc(:granularity, CAST(:start_day AS timestamptz)),
+        date_trunc(:granularity, CAST(:end_day AS timestamptz)),
+        CAST(:step AS interval)
+    ) AS b(d)
+    LEFT JOIN mv_timeseries_daily m
+        ON date_trunc(:granularity, CAST(m.day AS timestamptz)) = b.d
+        AND m.day BETWEEN :start_day AND :end_day
+    GROUP BY b.d
+    ORDER BY 1
+""")
+
+_FINANCIAL_ROLLUP_SQL = text("""
+    SELECT currency,
+           sum(expense_count) AS expense_count,
+           sum(sum_amount) AS total_amount,
+           sum(sum_inr) AS total_inr
+    FROM mv_financial_daily
+    WHERE day BETWEEN :start_day AND :end_day
+    GROUP BY currency
+""")
+
+_GROUP_ACTIVITY_ROLLUP = """
+    SELECT g.id, g.name,
+           sum(a.expense_count) AS expense_count,
+           sum(a.sum_inr) AS total_expenses
+    FROM mv_group_activity a
+    JOIN groups g ON g.id = a.group_id
+    WHERE a.day BETWEEN :start_day AND :end_day
+    GROUP BY g.id, g.name
+    ORDER BY {order} DESC
+    LIMIT 10
+"""
+_GROUPS_BY_AMOUNT_ROLLUP_SQL = text(_GROUP_ACTIVITY_ROLLUP.format(order="total_expenses"))
+_GROUPS_BY_COUNT_ROLLUP_SQL = text(_GROUP_ACTIVITY_ROLLUP.format(order="expense_count"))
+
+# Server-side builders for the system health and data quality sections (see
+# app.db.analytics_views.ANALYTICS_FUNCTIONS); each returns the whole section
+# as one JSON document
+_SYSTEM_HEALTH_SQL = text("SELECT analytics_system_health(:since) AS section")
+_DATA_QUALITY_SQL = text("SELECT analytics_data_quality(:dormant_before) AS section")
+
+# Whole-table user counts for get_user_engagement_metrics, one pass over users
+_USER_COUNTS_SQL = text("""
+    SELECT count(*) AS total,
+           count(*) FILTER (WHERE email_verified) AS email_verified,
+           count(*) FILTER (WHERE phone_verified) AS phone_verified,
+           count(*) FILTER (WHERE google_sub IS NOT NULL) AS google,
+           count(*) FILTER (WHERE google_sub IS NULL AND apple_sub IS NOT NULL) AS apple,
+           count(*) FILTER (WHERE google_sub IS NULL AND apple_sub IS NULL) AS email
+    FROM users
+""")
+
+# Expense activity in a window for get_user_engagement_metrics; one pass over
+# live expenses, index-only via idx_expenses_created_live. Grouping by payer
+# lets Postgres hash-aggregate instead of sorting for count(DISTINCT ...):
+# the number of groups is the active-user count and their sizes sum to the
+# expense total.
+_EXPENSE_ACTIVITY_SQL = text("""
+    SELECT coalesce(sum(n), 0) AS total_expenses,
+           count(*) AS active_users
+    FROM (
+        SELECT count(*) AS n
+        FROM expenses
+        WHERE created_at >= :start_date AND created_at <= :end_date AND deleted_at IS NULL
+        GROUP BY payer_id
+    ) AS per_payer
+""")
+
+
+@_ttl_cached
 def get_time_series_data(
     db: Session, 
     start_date: Optional[datetime] = None, 
@@ -31,6 +334,10 @@ def get_time_series_data(
     """
     Get time-series data for users, expenses, and settlements.
     
+    Reads the daily materialized view and rolls it up to ``group_by``; when
+    the view is unavailable all three series are computed live in a single
+    statement (see _TIME_SERIES_SQL).
+    
     Args:
         db: Database session
         start_date: Start date for filtering (defaults to 30 days ago)
@@ -38,93 +345,53 @@ def get_time_series_data(
         group_by: Grouping period - "day", "week", or "month"
     
     Returns:
-        List of dictionaries with date and counts for each metric
+        List of dictionaries with date and counts for each metric, one per
+        bucket in the window (empty buckets report zeros), in date order
     """
-    print(f"[analytics] Getting time-series data from {start_date} to {end_date}, grouped by {group_by}")
+    logger.debug("Getting time-series data from %s to %s, grouped by %s", start_date, end_date, group_by)
     
     # Default to last 30 days if no dates provided
     if not end_date:
-        end_date = datetime.utcnow()
+        end_date = _bucketed_now()
     if not start_date:
         start_date = end_date - timedelta(days=30)
     
-    # Determine date truncation based on group_by
-    if group_by == "day":
-        date_trunc = func.date_trunc('day', User.created_at)
-    elif group_by == "week":
-        date_trunc = func.date_trunc('week', User.created_at)
-    elif group_by == "month":
-        date_trunc = func.date_trunc('month', User.created_at)
-    else:
-        date_trunc = func.date_trunc('day', User.created_at)
+    # Only whitelisted granularities reach date_trunc
+    granularity = group_by if group_by in TIME_SERIES_GRANULARITIES else "day"
     
     try:
-        # Get user registrations over time
-        user_registrations = db.query(
-            date_trunc.label('date'),
-            func.count(User.id).label('users')
-        ).filter(
-            and_(
-                User.created_at >= start_date,
-                User.created_at <= end_date
-            )
-        ).group_by(date_trunc).order_by(date_trunc).all()
-        
-        # Get expenses over time
-        expense_counts = db.query(
-            date_trunc.label('date'),
-            func.count(Expense.id).label('expenses')
-        ).filter(
-            and_(
-                Expense.created_at >= start_date,
-                Expense.created_at <= end_date,
-                Expense.deleted_at.is_(None)
-            )
-        ).group_by(date_trunc).order_by(date_trunc).all()
-        
-        # Get settlements over time
-        settlement_counts = db.query(
-            date_trunc.label('date'),
-            func.count(Settlement.id).label('settlements')
-        ).filter(
-            and_(
-                Settlement.created_at >= start_date,
-                Settlement.created_at <= end_date
-            )
-        ).group_by(date_trunc).order_by(date_trunc).all()
-        
-        # Combine all data
-        data_dict = {}
-        
-        for row in user_registrations:
-            date_key = row.date.isoformat() if row.date else "unknown"
-            if date_key not in data_dict:
-                data_dict[date_key] = {"date": date_key, "users": 0, "expenses": 0, "settlements": 0}
-            data_dict[date_key]["users"] = row.users
-        
-        for row in expense_counts:
-            date_key = row.date.isoformat() if row.date else "unknown"
-            if date_key not in data_dict:
-                data_dict[date_key] = {"date": date_key, "users": 0, "expenses": 0, "settlements": 0}
-            data_dict[date_key]["expenses"] = row.expenses
-        
-        for row in settlement_counts:
-            date_key = row.date.isoformat() if row.date else "unknown"
-            if date_key not in data_dict:
-                data_dict[date_key] = {"date": date_key, "users": 0, "expenses": 0, "settlements": 0}
-            data_dict[date_key]["settlements"] = row.settlements
-        
-        result = list(data_dict.values())
-        result.sort(key=lambda x: x["date"])
+        daily = granularity == "day"
+        params = {"granularity": granularity, "step": f"1 {granularity}"}
+        rows = _read_rollup(
+            db,
+            _TIME_SERIES_DAILY_ROLLUP_SQL if daily else _TIME_SERIES_ROLLUP_SQL,
+            {**params, **_rollup_window(start_date, end_date)},
+        )
+        if rows is None:
+            rows = db.execute(
+                _TIME_SERIES_DAILY_SQL if daily else _TIME_SERIES_SQL,
+                {**params, "start_date": start_date, "end_date": end_date},
+            ).mappings().all()
+        
+        result = [
+            {
+                "date": row["date"].isoformat(),
+                "users": int(row["users"]),
+                "expenses": int(row["expenses"]),
+                "settlements": int(row["settlements"]),
+            }
+            for row in rows
+        ]
         
-        print(f"[analytics] Time-series data: {len(result)} data points")
+        logger.debug("Time-series data: %d data points", len(result))
         return result
         
     except Exception as e:
-        print(f"[analytics] Error getting time-series data: {e}")
+        logger.error("Error getting time-series data: %s", e)
         return []
 
 
+@_ttl_cached
 def get_user_engagement_metrics(
     db: Session, 
     start_date: Optional[datetime] = None, 
@@ -141,69 +408,56 @@ def get_user_engagement_metrics(
     Returns:
         Dictionary with user engagement metrics
     """
-    print(f"[analytics] Getting user engagement metrics from {start_date} to {end_date}")
+    logger.debug("Getting user engagement metrics from %s to %s", start_date, end_date)
     
     if not end_date:
-        end_date = datetime.utcnow()
+        end_date = _bucketed_now()
     if not start_date:
         start_date = end_date - timedelta(days=30)
     
     try:
-        # Total users
-        total_users = db.query(User).count()
-        
-        # Active users in date range (users who created expenses or settlements)
-        active_users = db.query(func.count(func.distinct(Expense.payer_id))).filter(
-            and_(
-                Expense.created_at >= start_date,
-                Expense.created_at <= end_date,
-                Expense.deleted_at.is_(None)
+        # Every per-user count in one scan of users; a user's auth method is
+        # Google if linked, else Apple if linked, else email. The total is
+        # counted exactly in the same pass (it's free there, and keeps the
+        # verification rates consistent with their numerators).
+        user_counts = db.execute(_USER_COUNTS_SQL).one()
+        total_users = user_counts.total
+        
+        auth_method_breakdown = {
+            method: count
+            for method, count in (
+                ("google", user_counts.google),
+                ("apple", user_counts.apple),
+                ("email", user_counts.email),
             )
-        ).scalar() or 0
-        
-        # Auth method breakdown
-        auth_breakdown = db.query(
-            case(
-                (User.google_sub.isnot(None), "google"),
-                (User.apple_sub.isnot(None), "apple"),
-                else_="email"
-            ).label('auth_method'),
-            func.count(User.id).label('count')
-        ).group_by('auth_method').all()
-        
-        auth_method_breakdown = {row.auth_method: row.count for row in auth_breakdown}
-        
-        # Verification rates
-        email_verified = db.query(func.count(User.id)).filter(User.email_verified == True).scalar() or 0
-        phone_verified = db.query(func.count(User.id)).filter(User.phone_verified == True).scalar() or 0
+            if count
+        }
         
-        email_verification_rate = (email_verified / total_users * 100) if total_users > 0 else 0
-        phone_verification_rate = (phone_verified / total_users * 100) if total_users > 0 else 0
+        email_verification_rate = (user_counts.email_verified / total_users * 100) if total_users > 0 else 0
+        phone_verification_rate = (user_counts.phone_verified / total_users * 100) if total_users > 0 else 0
         
         # Currency distribution
-        currency_dist = db.query(
+        currency_dist = db.execute(select(
             User.preferred_currency,
-            func.count(User.id).label('count')
-        ).group_by(User.preferred_currency).all()
+            func.count(User.id).label('user_count')
+        ).group_by(User.preferred_currency)).mappings().all()
         
-        currency_distribution = {row.preferred_currency: row.count for row in currency_dist}
+        currency_distribution = {row["preferred_currency"]: row["user_count"] for row in currency_dist}
         
         # Language distribution
-        language_dist = db.query(
+        language_dist = db.execute(select(
             User.language,
-            func.count(User.id).label('count')
-        ).group_by(User.language).all()
+            func.count(User.id).label('user_count')
+        ).group_by(User.language)).mappings().all()
         
-        language_distribution = {row.language: row.count for row in language_dist}
+        language_distribution = {row["language"]: row["user_count"] for row in language_dist}
         
-        # Average expenses per user
-        total_expenses = db.query(func.count(Expense.id)).filter(
-            and_(
-                Expense.created_at >= start_date,
-                Expense.created_at <= end_date,
-                Expense.deleted_at.is_(None)
-            )
-        ).scalar() or 0
+        # Active users (distinct payers) and expense volume share one scan
+        activity = db.execute(
+            _EXPENSE_ACTIVITY_SQL, {"start_date": start_date, "end_date": end_date}
+        ).one()
+        active_users = activity.active_users
+        total_expenses = int(activity.total_expenses)
         
         avg_expenses_per_user = (total_expenses / active_users) if active_users > 0 else 0
         
@@ -220,14 +474,15 @@ def get_user_engagement_metrics(
             "languageDistribution": language_distribution
         }
         
-        print(f"[analytics] User engagement metrics: {result}")
+        logger.debug("User engagement metrics: %s", result)
         return result
         
     except Exception as e:
-        print(f"[analytics] Error getting user engagement metrics: {e}")
+        logger.error("Error getting user engagement metrics: %s", e)
         return {}
 
 
+@_ttl_cached
 def get_financial_insights(
     db: Session, 
     start_date: Optional[datetime] = None, 
@@ -244,90 +499,112 @@ def get_financial_insights(
     Returns:
         Dictionary with financial insights
     """
-    print(f"[analytics] Getting financial insights from {start_date} to {end_date}")
+    logger.debug("Getting financial insights from %s to %s", start_date, end_date)
     
     if not end_date:
-        end_date = datetime.utcnow()
+        end_date = _bucketed_now()
     if not start_date:
         start_date = end_date - timedelta(days=30)
     
     try:
-        # Basic expense metrics
-        expense_stats = db.query(
-            func.count(Expense.id).label('total_expenses'),
-            func.avg(Expense.amount_inr).label('avg_amount'),
-            func.sum(Expense.amount_inr).label('total_amount')
-        ).filter(
-            and_(
-                Expense.created_at >= start_date,
-                Expense.created_at <= end_date,
-                Expense.deleted_at.is_(None)
-            )
-        ).first()
-        
-        # Expense by currency
-        expense_by_currency = db.query(
-            Expense.currency,
-            func.count(Expense.id).label('count'),
-            func.sum(Expense.amount).label('total_amount')
-        ).filter(
-            and_(
-                Expense.created_at >= start_date,
-                Expense.created_at <= end_date,
-                Expense.deleted_at.is_(None)
-            )
-        ).group_by(Expense.currency).all()
-        
-        currency_breakdown = {
-            row.currency: {
-                "count": row.count,
-                "total_amount": float(row.total_amount or 0)
+        window = _rollup_window(start_date, end_date)
+        
+        # Expense totals and per-currency breakdown from the daily rollup
+        currency_rows = _read_rollup(db, _FINANCIAL_ROLLUP_SQL, window)
+        if currency_rows is not None:
+            currency_breakdown = {
+                row["currency"]: {
+                    "count": int(row["expense_count"]),
+                    "total_amount": float(row["total_amount"] or 0)
+                }
+                for row in currency_rows
+            }
+            total_expense_count = sum(int(row["expense_count"]) for row in currency_rows)
+            total_expense_amount = sum(float(row["total_inr"] or 0) for row in currency_rows)
+            avg_expense_amount = (total_expense_amount / total_expense_count) if total_expense_count > 0 else 0
+        else:
+            # Basic expense metrics
+            expense_stats = db.query(
+                func.count(Expense.id).label('total_expenses'),
+                func.avg(Expense.amount_inr).label('avg_amount'),
+                func.sum(Expense.amount_inr).label('total_amount')
+            ).filter(
+                and_(
+                    Expense.created_at >= start_date,
+                    Expense.created_at <= end_date,
+                    Expense.deleted_at.is_(None)
+                )
+            ).first()
+            total_expense_count = expense_stats.total_expenses or 0
+            total_expense_amount = float(expense_stats.total_amount or 0)
+            avg_expense_amount = float(expense_stats.avg_amount or 0)
+            
+            # Expense by currency
+            expense_by_currency = db.execute(select(
+                Expense.currency,
+                func.count(Expense.id).label('expense_count'),
+                func.sum(Expense.amount).label('total_amount')
+            ).filter(
+                and_(
+                    Expense.created_at >= start_date,
+                    Expense.created_at <= end_date,
+                    Expense.deleted_at.is_(None)
+                )
+            ).group_by(Expense.currency)).mappings().all()
+            
+            currency_breakdown = {
+                row["currency"]: {
+                    "count": row["expense_count"],
+                    "total_amount": float(row["total_amount"] or 0)
+                }
+                for row in expense_by_currency
             }
-            for row in expense_by_currency
-        }
         
-        # Top expenses
-        top_expenses = db.query(
+        # Top expenses: plain column rows (no Expense/Group entities, so no
+        # identity-map work or relationship loads), joined on the indexed FK
+        top_expenses = db.execute(select(
             Expense.id,
             Expense.amount_inr,
             Expense.description,
             Group.name.label('group_name')
-        ).join(Group).filter(
+        ).select_from(Expense).join(Group, Expense.group_id == Group.id).filter(
             and_(
                 Expense.created_at >= start_date,
                 Expense.created_at <= end_date,
                 Expense.deleted_at.is_(None)
             )
-        ).order_by(desc(Expense.amount_inr)).limit(10).all()
+        ).order_by(desc(Expense.amount_inr)).limit(10)).mappings().all()
         
         top_expenses_list = [
             {
-                "id": exp.id,
-                "amount": float(exp.amount_inr),
-                "description": exp.description,
-                "group": exp.group_name
+                "id": exp["id"],
+                "amount": float(exp["amount_inr"]),
+                "description": exp["description"],
+                "group": exp["group_name"]
             }
             for exp in top_expenses
         ]
         
         # Groups with highest expenses
-        groups_with_expenses = db.query(
-            Group.id,
-            Group.name,
-            func.sum(Expense.amount_inr).label('total_expenses')
-        ).join(Expense).filter(
-            and_(
-                Expense.created_at >= start_date,
-                Expense.created_at <= end_date,
-                Expense.deleted_at.is_(None)
-            )
-        ).group_by(Group.id, Group.name).order_by(desc('total_expenses')).limit(10).all()
+        groups_with_expenses = _read_rollup(db, _GROUPS_BY_AMOUNT_ROLLUP_SQL, window)
+        if groups_with_expenses is None:
+            groups_with_expenses = db.execute(select(
+                Group.id,
+                Group.name,
+                func.sum(Expense.amount_inr).label('total_expenses')
+            ).select_from(Group).join(Expense, Expense.group_id == Group.id).filter(
+                and_(
+                    Expense.created_at >= start_date,
+                    Expense.created_at <= end_date,
+                    Expense.deleted_at.is_(None)
+                )
+            ).group_by(Group.id, Group.name).order_by(desc('total_expenses')).limit(10)).mappings().all()
         
         groups_highest_expenses = [
             {
-                "groupId": group.id,
-                "name": group.name,
-                "total": float(group.total_expenses or 0)
+                "groupId": str(group["id"]),
+                "name": group["name"],
+                "total": float(group["total_expenses"] or 0)
             }
             for group in groups_with_expenses
         ]
@@ -335,7 +612,7 @@ def get_financial_insights(
         # Settlement metrics
         settlement_stats = db.query(
             func.count(Settlement.id).label('total_settlements'),
-            func.count(case((Settlement.status == 'completed', 1))).label('completed_settlements')
+            func.count().filter(Settlement.status == 'completed').label('completed_settlements')
         ).filter(
             and_(
                 Settlement.created_at >= start_date,
@@ -347,39 +624,35 @@ def get_financial_insights(
         completed_settlements = settlement_stats.completed_settlements or 0
         settlement_completion_rate = (completed_settlements / total_settlements * 100) if total_settlements > 0 else 0
         
-        # Unsettled amounts by group (simplified - groups with pending settlements)
-        unsettled_groups = db.query(
+        # Unsettled amounts by group (simplified - groups with pending settlements).
+        # Only pending rows contribute, so they're filtered in WHERE (served by
+        # idx_settlements_created_status) rather than summed through a CASE;
+        # amounts are positive, so every remaining group has a non-zero total.
+        unsettled_groups = db.execute(select(
             Group.id,
             Group.name,
-            func.sum(case(
-                (Settlement.status == 'pending', Settlement.amount_inr),
-                else_=0
-            )).label('unsettled_amount')
-        ).join(Settlement).filter(
+            func.sum(Settlement.amount_inr).label('unsettled_amount')
+        ).select_from(Group).join(Settlement, Settlement.group_id == Group.id).filter(
             and_(
                 Settlement.created_at >= start_date,
-                Settlement.created_at <= end_date
+                Settlement.created_at <= end_date,
+                Settlement.status == 'pending'
             )
-        ).group_by(Group.id, Group.name).having(
-            func.sum(case(
-                (Settlement.status == 'pending', Settlement.amount_inr),
-                else_=0
-            )) > 0
-        ).order_by(desc('unsettled_amount')).limit(10).all()
+        ).group_by(Group.id, Group.name).order_by(desc('unsettled_amount')).limit(10)).mappings().all()
         
         unsettled_amounts = [
             {
-                "groupId": group.id,
-                "name": group.name,
-                "amount": float(group.unsettled_amount or 0)
+                "groupId": group["id"],
+                "name": group["name"],
+                "amount": float(group["unsettled_amount"] or 0)
             }
             for group in unsettled_groups
         ]
         
         result = {
-            "avgExpenseAmount": round(float(expense_stats.avg_amount or 0), 2),
-            "totalExpenses": expense_stats.total_expenses or 0,
-            "totalExpenseAmount": float(expense_stats.total_amount or 0),
+            "avgExpenseAmount": round(avg_expense_amount, 2),
+            "totalExpenses": total_expense_count,
+            "totalExpenseAmount": total_expense_amount,
             "expenseByCurrency": currency_breakdown,
             "topExpenses": top_expenses_list,
             "groupsWithHighestExpenses": groups_highest_expenses,
@@ -387,14 +660,15 @@ def get_financial_insights(
             "unsettledAmountsByGroup": unsettled_amounts
         }
         
-        print(f"[analytics] Financial insights: {result}")
+        logger.debug("Financial insights: %s", result)
         return result
         
     except Exception as e:
-        print(f"[analytics] Error getting financial insights: {e}")
+        logger.error("Error getting financial insights: %s", e)
         return {}
 
 
+@_ttl_cached
 def get_group_analytics(
     db: Session, 
     start_date: Optional[datetime] = None, 
@@ -411,51 +685,57 @@ def get_group_analytics(
     Returns:
         Dictionary with group analytics
     """
-    print(f"[analytics] Getting group analytics from {start_date} to {end_date}")
+    logger.debug("Getting group analytics from %s to %s", start_date, end_date)
     
     if not end_date:
-        end_date = datetime.utcnow()
+        end_date = _bucketed_now()
     if not start_date:
         start_date = end_date - timedelta(days=30)
     
     try:
         # Basic group metrics
-        total_groups = db.query(func.count(Group.id)).scalar() or 0
+        total_groups = _approx_count(db, Group)
         
-        # Average group size
-        avg_group_size = db.query(
-            func.avg(func.count(GroupMember.id))
-        ).select_from(Group).join(GroupMember).group_by(Group.id).scalar() or 0
+        # Average group size: aggregates can't nest, so count members per
+        # group in a subquery and average over it in one statement
+        group_sizes = db.query(
+            func.count(GroupMember.id).label('member_count')
+        ).group_by(GroupMember.group_id).subquery()
+        avg_group_size = float(db.query(func.avg(group_sizes.c.member_count)).scalar() or 0)
         
         # Most active groups (by expense count)
-        most_active_groups = db.query(
-            Group.id,
-            Group.name,
-            func.count(Expense.id).label('expense_count')
-        ).join(Expense).filter(
-            and_(
-                Expense.created_at >= start_date,
-                Expense.created_at <= end_date,
-                Expense.deleted_at.is_(None)
-            )
-        ).group_by(Group.id, Group.name).order_by(desc('expense_count')).limit(10).all()
+        most_active_groups = _read_rollup(
+            db, _GROUPS_BY_COUNT_ROLLUP_SQL, _rollup_window(start_date, end_date)
+        )
+        if most_active_groups is None:
+            most_active_groups = db.execute(select(
+                Group.id,
+                Group.name,
+                func.count(Expense.id).label('expense_count')
+            ).select_from(Group).join(Expense, Expense.group_id == Group.id).filter(
+                and_(
+                    Expense.created_at >= start_date,
+                    Expense.created_at <= end_date,
+                    Expense.deleted_at.is_(None)
+                )
+            ).group_by(Group.id, Group.name).order_by(desc('expense_count')).limit(10)).mappings().all()
         
         most_active_list = [
             {
-                "groupId": group.id,
-                "name": group.name,
-                "expenseCount": group.expense_count
+                "groupId": str(group["id"]),
+                "name": group["name"],
+                "expenseCount": int(group["expense_count"])
             }
             for group in most_active_groups
         ]
         
         # Groups by currency
-        groups_by_currency = db.query(
+        groups_by_currency = db.execute(select(
             Group.base_currency,
-            func.count(Group.id).label('count')
-        ).group_by(Group.base_currency).all()
+            func.count(Group.id).label('group_count')
+        ).group_by(Group.base_currency)).mappings().all()
         
-        groups_currency_dist = {row.base_currency: row.count for row in groups_by_currency}
+        groups_currency_dist = {row["base_currency"]: row["group_count"] for row in groups_by_currency}
         
         # Group invite acceptance rate (simplified)
         total_invites = db.query(func.count(GroupMember.id)).filter(
@@ -478,11 +758,11 @@ def get_group_analytics(
             "groupsByCurrency": groups_currency_dist
         }
         
-        print(f"[analytics] Group analytics: {result}")
+        logger.debug("Group analytics: %s", result)
         return result
         
     except Exception as e:
-        print(f"[analytics] Error getting group analytics: {e}")
+        logger.error("Error getting group analytics: %s", e)
         return {}
 
 
@@ -490,69 +770,80 @@ def get_system_health(db: Session) -> Dict[str, Any]:
     """
     Get system health metrics including audit logs, notifications, and sync operations.
     
+    Built in one round-trip by the ``analytics_system_health`` SQL function,
+    falling back to individual queries where the function doesn't exist.
+    
     Args:
         db: Database session
     
     Returns:
         Dictionary with system health metrics
     """
-    print("[analytics] Getting system health metrics")
+    logger.debug("Getting system health metrics")
+    
+    # Rolling window anchored to the cache bucket, so calls within the same
+    # bucket issue identical statements
+    since = _bucketed_now() - timedelta(hours=24)
     
     try:
+        rows = _read_rollup(db, _SYSTEM_HEALTH_SQL, {"since": since})
+        if rows is not None:
+            result = rows[0]["section"]
+            logger.debug("System health: %s", result)
+            return result
+        
         # Recent audit logs (last 24 hours)
-        recent_audit_logs = db.query(
+        recent_audit_logs = db.execute(select(
             AuditLog.action,
-            func.count(AuditLog.id).label('count')
+            func.count(AuditLog.id).label('event_count')
         ).filter(
-            AuditLog.created_at >= datetime.utcnow() - timedelta(hours=24)
-        ).group_by(AuditLog.action).order_by(desc('count')).limit(10).all()
+            AuditLog.created_at >= since
+        ).group_by(AuditLog.action).order_by(desc('event_count')).limit(10)).mappings().all()
         
         recent_audit_list = [
-            {"action": log.action, "count": log.count}
+            {"action": log["action"], "count": log["event_count"]}
             for log in recent_audit_logs
         ]
         
-        # Notification outbox status
+        # Notification outbox status; ck_notification_status limits status to
+        # these three values, so one FILTER aggregate per status covers it
         notification_status = db.query(
-            case(
-                (NotificationOutbox.status == 'pending', 'pending'),
-                (NotificationOutbox.status == 'sent', 'sent'),
-                (NotificationOutbox.status == 'failed', 'failed'),
-                else_='unknown'
-            ).label('status'),
-            func.count(NotificationOutbox.id).label('count')
-        ).group_by('status').all()
-        
-        notification_breakdown = {row.status: row.count for row in notification_status}
-        
-        # Sync operation stats
-        sync_stats = db.query(
-            func.count(SyncOp.id).label('total'),
-            func.count(case((SyncOp.status == 'pending', 1))).label('pending')
-        ).first()
+            func.count().filter(NotificationOutbox.status == 'pending').label('pending'),
+            func.count().filter(NotificationOutbox.status == 'sent').label('sent'),
+            func.count().filter(NotificationOutbox.status == 'failed').label('failed')
+        ).select_from(NotificationOutbox).one()
+        
+        notification_breakdown = {
+            status: count
+            for status, count in notification_status._mapping.items()
+            if count
+        }
         
+        # Sync operation stats. Sync ops are an append-only feed with no
+        # delivery state, so nothing is ever pending; the total is estimated
+        # rather than counted because the table only grows.
         sync_operation_stats = {
-            "total": sync_stats.total or 0,
-            "pending": sync_stats.pending or 0
+            "total": _approx_count(db, SyncOp),
+            "pending": 0
         }
         
         # Recent errors (from audit logs)
-        recent_errors = db.query(
+        recent_errors = db.execute(select(
             AuditLog.entity_type,
-            func.count(AuditLog.id).label('count'),
+            func.count(AuditLog.id).label('error_count'),
             func.max(AuditLog.created_at).label('last_occurred')
         ).filter(
             and_(
-                AuditLog.action.like('%error%'),
-                AuditLog.created_at >= datetime.utcnow() - timedelta(hours=24)
+                AuditLog.action.like(f"{ERROR_ACTION_PREFIX}%"),
+                AuditLog.created_at >= since
             )
-        ).group_by(AuditLog.entity_type).order_by(desc('count')).limit(5).all()
+        ).group_by(AuditLog.entity_type).order_by(desc('error_count')).limit(5)).mappings().all()
         
         recent_errors_list = [
             {
-                "type": error.entity_type,
-                "count": error.count,
-                "lastOccurred": error.last_occurred.isoformat() if error.last_occurred else "unknown"
+                "type": error["entity_type"],
+                "count": error["error_count"],
+                "lastOccurred": error["last_occurred"].isoformat() if error["last_occurred"] else "unknown"
             }
             for error in recent_errors
         ]
@@ -564,11 +855,11 @@ def get_system_health(db: Session) -> Dict[str, Any]:
             "recentErrors": recent_errors_list
         }
         
-        print(f"[analytics] System health: {result}")
+        logger.debug("System health: %s", result)
         return result
         
     except Exception as e:
-        print(f"[analytics] Error getting system health metrics: {e}")
+        logger.error("Error getting system health metrics: %s", e)
         return {}
 
 
@@ -576,15 +867,26 @@ def get_data_quality_metrics(db: Session) -> Dict[str, Any]:
     """
     Get data quality metrics including incomplete profiles and dormant resources.
     
+    Built in one round-trip by the ``analytics_data_quality`` SQL function,
+    falling back to individual queries where the function doesn't exist.
+    
     Args:
         db: Database session
     
     Returns:
         Dictionary with data quality metrics
     """
-    print("[analytics] Getting data quality metrics")
+    logger.debug("Getting data quality metrics")
+    
+    dormant_before = _bucketed_now() - timedelta(days=30)
     
     try:
+        rows = _read_rollup(db, _DATA_QUALITY_SQL, {"dormant_before": dormant_before})
+        if rows is not None:
+            result = rows[0]["section"]
+            logger.debug("Data quality metrics: %s", result)
+            return result
+        
         # Users with incomplete profiles (missing display_name or avatar)
         incomplete_profiles = db.query(func.count(User.id)).filter(
             or_(
@@ -604,7 +906,7 @@ def get_data_quality_metrics(db: Session) -> Dict[str, Any]:
         # Dormant groups (no activity in last 30 days)
         dormant_groups = db.query(func.count(Group.id)).filter(
             and_(
-                Group.updated_at < datetime.utcnow() - timedelta(days=30),
+                Group.updated_at < dormant_before,
                 Group.archived_at.is_(None)
             )
         ).scalar() or 0
@@ -621,14 +923,65 @@ def get_data_quality_metrics(db: Session) -> Dict[str, Any]:
             "pendingOperations": pending_operations
         }
         
-        print(f"[analytics] Data quality metrics: {result}")
+        logger.debug("Data quality metrics: %s", result)
         return result
         
     except Exception as e:
-        print(f"[analytics] Error getting data quality metrics: {e}")
+        logger.error("Error getting data quality metrics: %s", e)
         return {}
 
 
+def _run_in_own_session(fn: Callable, *args: Any) -> Any:
+    """
+    Run one analytics section on a dedicated session, for use from a worker
+    thread.
+    
+    Every statement in the section is capped at ANALYTICS_STATEMENT_TIMEOUT
+    (``SET LOCAL`` lasts until the session's transaction ends at close), so
+    a runaway aggregate is cancelled instead of holding a connection and
+    loading the database.
+    
+    Args:
+        fn: Analytics function taking a Session first
+        *args: Remaining arguments for ``fn``
+    
+    Returns:
+        Whatever ``fn`` returns
+    """
+    db = SessionLocal()
+    try:
+        db.execute(text(f"SET LOCAL statement_timeout = '{ANALYTICS_STATEMENT_TIMEOUT}'"))
+        return fn(db, *args)
+    finally:
+        db.close()
+
+
+def _run_on_callers_session(db: Session, fn: Callable, *args: Any) -> Any:
+    """
+    Run one analytics section on the request's own session.
+    
+    The section runs inside a savepoint that is always rolled back: the
+    sections only read, and rolling back undoes the ``SET LOCAL`` timeout
+    and any statement it cancelled, so the rest of the request's
+    transaction is left as it was.
+    
+    Args:
+        db: The caller's session
+        fn: Analytics function taking a Session first
+        *args: Remaining arguments for ``fn``
+    
+    Returns:
+        Whatever ``fn`` returns
+    """
+    savepoint = db.begin_nested()
+    try:
+        db.execute(text(f"SET LOCAL statement_timeout = '{ANALYTICS_STATEMENT_TIMEOUT}'"))
+        return fn(db, *args)
+    finally:
+        savepoint.rollback()
+
+
+@_ttl_cached
 def get_comprehensive_analytics(
     db: Session, 
     start_date: Optional[datetime] = None, 
@@ -637,29 +990,57 @@ def get_comprehensive_analytics(
     """
     Get comprehensive analytics data combining all metrics.
     
+    Results are cached per process for ANALYTICS_CACHE_TTL seconds (see
+    _ttl_cached), so repeated dashboard polls don't rerun the aggregations.
+    
+    The sections are independent, so one runs on the caller's session while
+    the rest run on the shared ANALYTICS_MAX_WORKERS threads, each on its
+    own pooled session (a Session can't be shared across threads). A
+    section that fails or times out comes back empty without affecting the
+    others, so the dashboard degrades instead of going blank.
+    
     Args:
-        db: Database session
+        db: Database session; runs the first section
         start_date: Start date for filtering
         end_date: End date for filtering
     
     Returns:
         Dictionary with all analytics data
     """
-    print(f"[analytics] Getting comprehensive analytics from {start_date} to {end_date}")
+    logger.debug("Getting comprehensive analytics from %s to %s", start_date, end_date)
+    
+    sections = {
+        "timeSeries": (get_time_series_data, (start_date, end_date)),
+        "userEngagement": (get_user_engagement_metrics, (start_date, end_date)),
+        "financialInsights": (get_financial_insights, (start_date, end_date)),
+        "groupAnalytics": (get_group_analytics, (start_date, end_date)),
+        "systemHealth": (get_system_health, ()),
+        "dataQuality": (get_data_quality_metrics, ()),
+    }
     
     try:
-        analytics = {
-            "timeSeries": get_time_series_data(db, start_date, end_date),
-            "userEngagement": get_user_engagement_metrics(db, start_date, end_date),
-            "financialInsights": get_financial_insights(db, start_date, end_date),
-            "groupAnalytics": get_group_analytics(db, start_date, end_date),
-            "systemHealth": get_system_health(db),
-            "dataQuality": get_data_quality_metrics(db)
+        own_name, (own_fn, own_args) = next(iter(sections.items()))
+        futures = {
+            name: _analytics_executor.submit(_run_in_own_session, fn, *args)
+            for name, (fn, args) in sections.items()
+            if name != own_name
         }
-        
-        print(f"[analytics] Comprehensive analytics completed successfully")
+        analytics = {}
+        try:
+            analytics[own_name] = _run_on_callers_session(db, own_fn, *own_args)
+        except Exception as e:
+            logger.error("Analytics section %s failed: %s", own_name, e)
+            analytics[own_name] = [] if own_name == "timeSeries" else {}
+        for name, future in futures.items():
+            try:
+                analytics[name] = future.result()
+            except Exception as e:
+                logger.error("Analytics section %s failed: %s", name, e)
+                analytics[name] = [] if name == "timeSeries" else {}
+        
+        logger.debug("Comprehensive analytics completed successfully")
         return analytics
         
     except Exception as e:
-        print(f"[analytics] Error getting comprehensive analytics: {e}")
+        logger.error("Error getting comprehensive analytics: %s", e)
         return {}
@@ -1,17 +1,72 @@
 from __future__ import annotations
-from sqlalchemy.orm import Session
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session, SessionTransaction
 from ..db.models import AuditLog
 
+# Session.info key holding audit rows not yet written
+AUDIT_BUFFER_KEY = "audit_buffer"
+
+# Rows per multi-row INSERT; 5 bound values per row keeps each statement well
+# under Postgres' 65535 bind parameter limit
+AUDIT_INSERT_BATCH_SIZE = 1000
+
+_audit_logs = AuditLog.__table__
+
+# Failure events use actions of the form "error.<action>" (e.g.
+# "error.admin_read"). A fixed prefix keeps the "recent errors" dashboard
+# query on the idx_audit_errors partial index instead of a '%error%' scan.
+ERROR_ACTION_PREFIX = "error."
+
 
 def write_audit(db: Session, actor_user_id: str | None, entity_type: str, entity_id: str, action: str, metadata: dict | None = None) -> None:
-    record = AuditLog(
-        actor_user_id=actor_user_id,
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        details=metadata or {},
+    """
+    Record an audit event.
+
+    The row is buffered on the session and written together with every other
+    audit row of the transaction in one multi-row INSERT when it commits, so
+    a request producing many events costs one round-trip instead of one per
+    event. Rows are discarded if the transaction rolls back.
+
+    Args:
+        db: Database session the event belongs to
+        actor_user_id: User performing the action (None for system events)
+        entity_type: Kind of entity acted on
+        entity_id: ID of the entity acted on
+        action: What was done
+        metadata: Extra event details
+    """
+    db.info.setdefault(AUDIT_BUFFER_KEY, []).append(
+        {
+            "actor_user_id": actor_user_id,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "action": action,
+            # Core insert below, so the column name rather than the attribute
+            "metadata": metadata or {},
+        }
     )
-    db.add(record)
-    db.flush()
+    # Callers rely on this call flushing their own pending changes (sessions
+    # don't autoflush), so keep doing that when there is something to flush
+    if db.new or db.dirty or db.deleted:
+        db.flush()
+
+
+@event.listens_for(Session, "before_commit")
+def _write_audit_buffer(session: Session) -> None:
+    """
+    Insert the buffered audit rows just before commit.
+
+    Rows go straight to the table as Core multi-row ``INSERT ... VALUES``
+    statements, one per AUDIT_INSERT_BATCH_SIZE rows, so no AuditLog
+    instances or identity-map entries are created.
+    """
+    rows = session.info.pop(AUDIT_BUFFER_KEY, None)
+    for start in range(0, len(rows or ()), AUDIT_INSERT_BATCH_SIZE):
+        session.execute(insert(_audit_logs).values(rows[start:start + AUDIT_INSERT_BATCH_SIZE]))
 
 
+@event.listens_for(Session, "after_transaction_end")
+def _discard_audit_buffer(session: Session, transaction: SessionTransaction) -> None:
+    """Drop rows buffered in a transaction that ended without committing."""
+    if transaction.parent is None:
+        session.info.pop(AUDIT_BUFFER_KEY, None)
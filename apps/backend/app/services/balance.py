@@ -1,29 +1,180 @@
 from __future__ import annotations
 from decimal import Decimal
-from typing import Dict, List, DefaultDict
-from collections import defaultdict
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
-import json
+from typing import Dict, List
+from sqlalchemy import Integer, Numeric, String, bindparam, func, text
+from sqlalchemy.orm import Session
 import logging
+import threading
+import time
+import orjson
 from redis import Redis
-from ..db.models import Expense, ExpenseSplit, GroupMember, User, Settlement
+from ..db.base import UUIDString
+from ..db.models import Expense, GroupMember
 from ..api.v1.schemas import BalanceResponse, DebtSimplification
 from ..core.redis import get_redis
 
 # Configure logging for balance calculations
 logger = logging.getLogger(__name__)
 
+# In-process cache in front of Redis for group balances. Invalidation only
+# reaches the current process, so the TTL is kept short: other workers may
+# serve a balance up to GROUP_BALANCE_L1_TTL seconds old after a write.
+GROUP_BALANCE_L1_TTL = 5.0
+GROUP_BALANCE_L1_MAXSIZE = 1024
+_group_balance_l1: Dict[str, tuple[float, List[BalanceResponse]]] = {}
+_group_balance_l1_lock = threading.Lock()
 
-def calculate_group_balances(group_id: str, db: Session, r: Redis = None) -> List[BalanceResponse]:
+# Stampede protection on a Redis miss: the recomputing worker holds a lock key
+# for at most GROUP_BALANCE_LOCK_TTL seconds; others poll for its result
+GROUP_BALANCE_LOCK_TTL = 10
+GROUP_BALANCE_LOCK_WAIT = 0.5
+GROUP_BALANCE_LOCK_POLL = 0.05
+
+# Net balance per user in one GROUP BY: payments and outgoing settlements
+# count positive, splits and incoming settlements negative. Active members are
+# included with a zero row (is_member = 1) so members with no activity appear,
+# and names are joined in for everyone, members or not.
+#
+# Expected plan on Postgres: the amount branches are Index Only Scans on
+# covering indexes (given a reasonably fresh visibility map), the member branch
+# a plain Index Scan:
+#   group_members  idx_group_members_group_status (group_id, status)
+#   expenses       idx_expenses_group_balance (group_id) INCLUDE (id, payer_id,
+#                  amount_inr) WHERE deleted_at IS NULL
+#   expense_splits idx_expense_splits_expense_user (expense_id, user_id)
+#                  INCLUDE (amount_inr), nested loop per expense
+#   settlements    ix_settle_group_status_created (group_id, status, created_at)
+#                  INCLUDE (amount_inr, from_user_id, to_user_id)
+# followed by a HashAggregate on uid and a users_pkey lookup per participant.
+_GROUP_BALANCES_SQL = text("""
+    SELECT t.uid AS uid, sum(t.amount) AS balance, max(t.is_member) AS is_member,
+           u.display_name AS display_name, u.email AS email
+    FROM (
+        SELECT user_id AS uid, 0 AS amount, 1 AS is_member
+        FROM group_members
+        WHERE group_id = :group_id AND status = 'active'
+        UNION ALL
+        SELECT payer_id, amount_inr, 0
+        FROM expenses
+        WHERE group_id = :group_id AND deleted_at IS NULL
+        UNION ALL
+        SELECT es.user_id, -es.amount_inr, 0
+        FROM expense_splits es
+        JOIN expenses e ON e.id = es.expense_id
+        WHERE e.group_id = :group_id AND e.deleted_at IS NULL
+        UNION ALL
+        SELECT from_user_id, amount_inr, 0
+        FROM settlements
+        WHERE group_id = :group_id AND status = 'completed'
+        UNION ALL
+        SELECT to_user_id, -amount_inr, 0
+        FROM settlements
+        WHERE group_id = :group_id AND status = 'completed'
+    ) t
+    LEFT JOIN users u ON u.id = t.uid
+    GROUP BY t.uid, u.display_name, u.email
+""").bindparams(
+    bindparam("group_id", type_=UUIDString)
+).columns(uid=UUIDString, balance=Numeric(10, 2), is_member=Integer, display_name=String, email=String)
+
+
+def _balances_from_rendered(rendered: List[Dict[str, str]]) -> List[BalanceResponse]:
+    """
+    Build balance models from their cached JSON form without re-validating.
+    
+    The dicts are produced by calculate_group_balances itself, so only the
+    amounts need converting back to Decimal.
+    """
+    return [
+        BalanceResponse.model_construct(
+            user_id=balance["user_id"],
+            user_name=balance["user_name"],
+            balance_inr=Decimal(balance["balance_inr"]),
+            balance_currency=Decimal(balance["balance_currency"]),
+            currency=balance["currency"],
+        )
+        for balance in rendered
+    ]
+
+
+# A user's signed contributions across every group they are an active member of
+_USER_NET_BALANCE_SQL = text("""
+    WITH member_groups AS (
+        SELECT group_id FROM group_members
+        WHERE user_id = :user_id AND status = 'active'
+    )
+    SELECT coalesce(sum(amount), 0) AS balance
+    FROM (
+        SELECT amount_inr AS amount
+        FROM expenses
+        WHERE payer_id = :user_id AND deleted_at IS NULL
+          AND group_id IN (SELECT group_id FROM member_groups)
+        UNION ALL
+        SELECT -es.amount_inr
+        FROM expense_splits es
+        JOIN expenses e ON e.id = es.expense_id
+        WHERE es.user_id = :user_id AND e.deleted_at IS NULL
+          AND e.group_id IN (SELECT group_id FROM member_groups)
+        UNION ALL
+        SELECT amount_inr
+        FROM settlements
+        WHERE from_user_id = :user_id AND status = 'completed'
+          AND group_id IN (SELECT group_id FROM member_groups)
+        UNION ALL
+        SELECT -amount_inr
+        FROM settlements
+        WHERE to_user_id = :user_id AND status = 'completed'
+          AND group_id IN (SELECT group_id FROM member_groups)
+    ) t
+""").bindparams(
+    bindparam("user_id", type_=UUIDString)
+).columns(balance=Numeric(10, 2))
+
+
+def _remember_group_balances(group_id: str, balances: List[BalanceResponse]) -> None:
+    """Store balances in the in-process cache, evicting the oldest entry when full."""
+    with _group_balance_l1_lock:
+        if group_id not in _group_balance_l1 and len(_group_balance_l1) >= GROUP_BALANCE_L1_MAXSIZE:
+            del _group_balance_l1[next(iter(_group_balance_l1))]
+        _group_balance_l1[group_id] = (time.monotonic() + GROUP_BALANCE_L1_TTL, balances)
+
+
+def _wait_for_cached_balances(r: Redis, cache_key: str) -> List[BalanceResponse] | None:
+    """
+    Poll for balances another worker is computing.
+    
+    Returns None if they don't show up within GROUP_BALANCE_LOCK_WAIT seconds
+    (or Redis fails), in which case the caller computes them itself.
+    """
+    deadline = time.monotonic() + GROUP_BALANCE_LOCK_WAIT
+    try:
+        while time.monotonic() < deadline:
+            time.sleep(GROUP_BALANCE_LOCK_POLL)
+            cached_data = r.get(cache_key)
+            if cached_data:
+                return _balances_from_rendered(orjson.loads(cached_data))
+    except Exception as e:
+        logger.warning(f"Failed waiting for cached balance data under {cache_key}, error: {e}")
+    return None
+
+
+def calculate_group_balances(group_id: str, db: Session, r: Redis = None, use_l1: bool = True) -> List[BalanceResponse]:
     """
     Calculate net balances for each user in a group with caching.
     
     This function handles cases where expense splits may reference users who are no longer
     active group members, ensuring all users involved in expenses are included in balance calculations.
+
+    Pass ``use_l1=False`` when the result guards a write: the in-process cache
+    can lag writes handled by other workers, while Redis is invalidated for all.
     """
     logger.info(f"Starting balance calculation for group_id: {group_id}")
     
+    # Hottest groups are answered without any I/O
+    entry = _group_balance_l1.get(group_id) if use_l1 else None
+    if entry is not None and entry[0] > time.monotonic():
+        return list(entry[1])
+    
     if r is None:
         r = get_redis()
     
@@ -35,177 +186,115 @@ def calculate_group_balances(group_id: str, db: Session, r: Redis = None) -> Lis
         cached_data = r.get(cache_key)
         if cached_data:
             logger.info(f"Retrieved cached balance data for group_id: {group_id}")
-            cached_balances = json.loads(cached_data)
-            return [BalanceResponse(**balance) for balance in cached_balances]
+            cached_balances = _balances_from_rendered(orjson.loads(cached_data))
+            _remember_group_balances(group_id, cached_balances)
+            return list(cached_balances)
     except Exception as e:
         logger.warning(f"Failed to retrieve cached balance data for group_id: {group_id}, error: {e}")
         pass  # Continue with database calculation if cache fails
     
-    # Get all active group members with user data in one query
-    members = db.query(GroupMember).filter(
-        GroupMember.group_id == group_id,
-        GroupMember.status == "active"
-    ).options(
-        joinedload(GroupMember.user)
-    ).all()
-    
-    logger.debug("Found %d active members in group_id=%s", len(members), group_id)
-    
-    if not members:
-        logger.warning(f"No active members found for group_id: {group_id}")
-        return []
-    
-    user_names: Dict[str, str] = {}
-    for member in members:
-        # Cache display names for active members
-        name = member.user.display_name or member.user.email or member.user_id
-        user_names[member.user_id] = name
-    
-    # Aggregate payer totals
-    payer_totals = {
-        row[0]: Decimal(row[1] or 0)
-        for row in db.query(
-            Expense.payer_id,
-            func.coalesce(func.sum(Expense.amount_inr), 0)
-        ).filter(
-            Expense.group_id == group_id,
-            Expense.deleted_at.is_(None)
-        ).group_by(Expense.payer_id)
-    }
-    
-    # Aggregate split totals
-    split_totals = {
-        row[0]: Decimal(row[1] or 0)
-        for row in db.query(
-            ExpenseSplit.user_id,
-            func.coalesce(func.sum(ExpenseSplit.amount_inr), 0)
-        ).join(
-            Expense, Expense.id == ExpenseSplit.expense_id
-        ).filter(
-            Expense.group_id == group_id,
-            Expense.deleted_at.is_(None)
-        ).group_by(ExpenseSplit.user_id)
-    }
-    
-    # Aggregate settlements (completed only)
-    settlement_outgoing = {
-        row[0]: Decimal(row[1] or 0)
-        for row in db.query(
-            Settlement.from_user_id,
-            func.coalesce(func.sum(Settlement.amount_inr), 0)
-        ).filter(
-            Settlement.group_id == group_id,
-            Settlement.status == "completed"
-        ).group_by(Settlement.from_user_id)
-    }
-    
-    settlement_incoming = {
-        row[0]: Decimal(row[1] or 0)
-        for row in db.query(
-            Settlement.to_user_id,
-            func.coalesce(func.sum(Settlement.amount_inr), 0)
-        ).filter(
-            Settlement.group_id == group_id,
-            Settlement.status == "completed"
-        ).group_by(Settlement.to_user_id)
-    }
-    
-    # Collect every user id referenced in the aggregates
-    all_user_ids = set(user_names.keys()) | set(payer_totals.keys()) | set(split_totals.keys()) | set(settlement_outgoing.keys()) | set(settlement_incoming.keys())
-    
-    # Backfill names for users not in the current active membership
-    missing_user_ids = [uid for uid in all_user_ids if uid not in user_names]
-    if missing_user_ids:
-        for user in db.query(User.id, User.display_name, User.email).filter(User.id.in_(missing_user_ids)):
-            user_names[user.id] = user.display_name or user.email or user.id
-    
-    # Ensure we have a fallback for any remaining ids
-    for uid in all_user_ids:
-        user_names.setdefault(uid, uid)
-    
-    balances: DefaultDict[str, Decimal] = defaultdict(lambda: Decimal("0"))
-    for uid in all_user_ids:
-        balances[uid]  # initialize zero entry so members with no activity appear
-    
-    for user_id, total in payer_totals.items():
-        balances[user_id] += total
-    
-    for user_id, total in split_totals.items():
-        balances[user_id] -= total
-    
-    for user_id, total in settlement_outgoing.items():
-        balances[user_id] += total
-    
-    for user_id, total in settlement_incoming.items():
-        balances[user_id] -= total
-    
-    result = [
-        BalanceResponse(
-            user_id=user_id,
-            user_name=user_names[user_id],
-            balance_inr=balance,
-            balance_currency=balance,
-            currency="INR",
-        )
-        for user_id, balance in balances.items()
-    ]
-    
-    logger.debug(
-        "Completed balance calculation for group_id=%s with %d participants",
-        group_id,
-        len(result),
-    )
+    # On a miss only one worker recomputes a group at a time; the others wait
+    # briefly for its result instead of stampeding the database
+    lock_key = f"lock:{cache_key}"
+    try:
+        holds_lock = bool(r.set(lock_key, "1", nx=True, ex=GROUP_BALANCE_LOCK_TTL))
+    except Exception:
+        holds_lock = True  # No lock without Redis; just compute
+    if not holds_lock:
+        cached_balances = _wait_for_cached_balances(r, cache_key)
+        if cached_balances is not None:
+            _remember_group_balances(group_id, cached_balances)
+            return list(cached_balances)
     
-    # Cache the result for 5 minutes
     try:
-        cache_data = [balance.dict() for balance in result]
-        r.setex(cache_key, 300, json.dumps(cache_data, default=str))
-        logger.debug("Cached balance data for group_id=%s", group_id)
-    except Exception as e:
-        logger.warning(f"Failed to cache balance data for group_id: {group_id}, error: {e}")
-        pass  # Continue if caching fails
+        # Net balances, names and membership for every participant in one query
+        rows = db.execute(_GROUP_BALANCES_SQL, {"group_id": group_id}).all()
+    
+        if not any(row.is_member for row in rows):
+            logger.warning(f"No active members found for group_id: {group_id}")
+            return []
+    
+        # Render the cache payload once; the response models are built from the
+        # same dicts so cache hits and misses go through one code path
+        rendered = []
+        for row in rows:
+            balance = str(Decimal(row.balance or 0))
+            rendered.append({
+                "user_id": row.uid,
+                "user_name": row.display_name or row.email or row.uid,
+                "balance_inr": balance,
+                "balance_currency": balance,
+                "currency": "INR",
+            })
+        result = _balances_from_rendered(rendered)
+        _remember_group_balances(group_id, result)
+    
+        logger.debug(
+            "Completed balance calculation for group_id=%s with %d participants",
+            group_id,
+            len(result),
+        )
     
-    return result
+        # Cache the result for 5 minutes
+        try:
+            r.setex(cache_key, 300, orjson.dumps(rendered))
+            logger.debug("Cached balance data for group_id=%s", group_id)
+        except Exception as e:
+            logger.warning(f"Failed to cache balance data for group_id: {group_id}, error: {e}")
+            pass  # Continue if caching fails
+    
+        return list(result)
+    finally:
+        # Release on every exit (including no members or an error) so waiters
+        # aren't left sleeping on a lock nobody is going to fill
+        if holds_lock:
+            try:
+                r.delete(lock_key)
+            except Exception:
+                pass
 
 
 def simplify_debts(balances: List[BalanceResponse]) -> List[DebtSimplification]:
-    """Simplify debts to minimize total transactions using a greedy algorithm."""
-    # Separate creditors (positive balance) and debtors (negative balance)
-    creditors = [(b.user_id, b.user_name, b.balance_inr) for b in balances if b.balance_inr > 0]
-    debtors = [(b.user_id, b.user_name, -b.balance_inr) for b in balances if b.balance_inr < 0]
+    """
+    Simplify debts to minimize total transactions using a greedy algorithm.
     
-    # Sort by amount (largest first)
-    creditors.sort(key=lambda x: x[2], reverse=True)
-    debtors.sort(key=lambda x: x[2], reverse=True)
+    Amounts are worked in integer paise (balances are INR with two decimals),
+    so the loop does exact int arithmetic on parallel lists mutated in place;
+    Decimals are only built for the debts it emits.
+    """
+    # Separate creditors (positive balance) and debtors (negative balance),
+    # largest first
+    creditors = sorted((b for b in balances if b.balance_inr > 0), key=lambda b: b.balance_inr, reverse=True)
+    debtors = sorted((b for b in balances if b.balance_inr < 0), key=lambda b: b.balance_inr)
+    
+    credit_paise = [int(b.balance_inr * 100) for b in creditors]
+    debt_paise = [int(-b.balance_inr * 100) for b in debtors]
     
     simplified_debts = []
     i = j = 0
     
     while i < len(creditors) and j < len(debtors):
-        creditor_id, creditor_name, creditor_amount = creditors[i]
-        debtor_id, debtor_name, debtor_amount = debtors[j]
-        
-        # Calculate how much the debtor can pay to this creditor
-        amount = min(creditor_amount, debtor_amount)
+        # How much the debtor can pay to this creditor
+        amount = credit_paise[i] if credit_paise[i] < debt_paise[j] else debt_paise[j]
         
-        if amount > Decimal("0.01"):  # Only include if amount is significant
+        if amount > 1:  # Only include if more than one paisa
             simplified_debts.append(DebtSimplification(
-                from_user_id=debtor_id,
-                from_user_name=debtor_name,
-                to_user_id=creditor_id,
-                to_user_name=creditor_name,
-                amount=amount,
+                from_user_id=debtors[j].user_id,
+                from_user_name=debtors[j].user_name,
+                to_user_id=creditors[i].user_id,
+                to_user_name=creditors[i].user_name,
+                amount=Decimal(amount).scaleb(-2),
                 currency="INR"
             ))
         
         # Update remaining amounts
-        creditors[i] = (creditor_id, creditor_name, creditor_amount - amount)
-        debtors[j] = (debtor_id, debtor_name, debtor_amount - amount)
+        credit_paise[i] -= amount
+        debt_paise[j] -= amount
         
         # Move to next creditor or debtor if current one is settled
-        if creditors[i][2] <= Decimal("0.01"):
+        if credit_paise[i] <= 1:
             i += 1
-        if debtors[j][2] <= Decimal("0.01"):
+        if debt_paise[j] <= 1:
             j += 1
     
     return simplified_debts
@@ -235,74 +324,13 @@ def calculate_user_net_balance(user_id: str, db: Session, r: Redis = None) -> De
         logger.warning(f"Failed to retrieve cached user balance for user_id: {user_id}, error: {e}")
         pass  # Continue with database calculation if cache fails
     
-    # Get all groups where user is an active member
-    memberships = db.query(GroupMember.group_id).filter(
-        GroupMember.user_id == user_id,
-        GroupMember.status == "active"
-    ).all()
-    
-    group_ids = [membership.group_id for membership in memberships]
-    
-    logger.debug(
-        "Found %d active group memberships for user_id=%s",
-        len(group_ids),
-        user_id,
-    )
-    
-    if not group_ids:
-        return Decimal("0")
-    
-    # Calculate aggregated totals directly from the database
-    total_paid = db.query(
-        func.coalesce(func.sum(Expense.amount_inr), 0)
-    ).filter(
-        Expense.payer_id == user_id,
-        Expense.deleted_at.is_(None),
-        Expense.group_id.in_(group_ids),
-    ).scalar() or Decimal("0")
-    
-    total_owed = db.query(
-        func.coalesce(func.sum(ExpenseSplit.amount_inr), 0)
-    ).join(
-        Expense, Expense.id == ExpenseSplit.expense_id
-    ).filter(
-        ExpenseSplit.user_id == user_id,
-        Expense.deleted_at.is_(None),
-        Expense.group_id.in_(group_ids),
-    ).scalar() or Decimal("0")
-    
-    settlements_paid = db.query(
-        func.coalesce(func.sum(Settlement.amount_inr), 0)
-    ).filter(
-        Settlement.from_user_id == user_id,
-        Settlement.status == "completed",
-        Settlement.group_id.in_(group_ids),
-    ).scalar() or Decimal("0")
-    
-    settlements_received = db.query(
-        func.coalesce(func.sum(Settlement.amount_inr), 0)
-    ).filter(
-        Settlement.to_user_id == user_id,
-        Settlement.status == "completed",
-        Settlement.group_id.in_(group_ids),
-    ).scalar() or Decimal("0")
-    
-    total_balance = (
-        Decimal(total_paid)
-        - Decimal(total_owed)
-        + Decimal(settlements_paid)
-        - Decimal(settlements_received)
+    # Paid minus owed plus settled out minus settled in, over the user's
+    # active groups, summed in one statement
+    total_balance = Decimal(
+        db.execute(_USER_NET_BALANCE_SQL, {"user_id": user_id}).scalar_one() or 0
     )
     
-    logger.debug(
-        "Computed net balance for user_id=%s -> paid=%s owed=%s settled_out=%s settled_in=%s total=%s",
-        user_id,
-        total_paid,
-        total_owed,
-        settlements_paid,
-        settlements_received,
-        total_balance,
-    )
+    logger.debug("Computed net balance for user_id=%s -> total=%s", user_id, total_balance)
     
     # Cache the result for 2 minutes (shorter than group balances since user balance changes more frequently)
     try:
@@ -317,27 +345,29 @@ def calculate_user_net_balance(user_id: str, db: Session, r: Redis = None) -> De
 
 def get_group_expense_summary(group_id: str, db: Session) -> Dict[str, any]:
     """Get summary statistics for a group's expenses."""
-    expenses = db.query(Expense).filter(
+    # Aggregated in the database rather than over loaded Expense objects
+    total_amount, expense_count, unique_payers = db.query(
+        func.coalesce(func.sum(Expense.amount_inr), 0),
+        func.count(Expense.id),
+        func.count(func.distinct(Expense.payer_id)),
+    ).filter(
         Expense.group_id == group_id,
         Expense.deleted_at.is_(None)
-    ).all()
-    
-    total_amount = sum(expense.amount_inr for expense in expenses)
-    expense_count = len(expenses)
-    
-    # Get unique payers
-    payers = set(expense.payer_id for expense in expenses)
+    ).one()
     
     return {
-        "total_amount": total_amount,
+        "total_amount": Decimal(total_amount),
         "expense_count": expense_count,
-        "unique_payers": len(payers),
+        "unique_payers": unique_payers,
         "currency": "INR"
     }
 
 
 def invalidate_group_balance_cache(group_id: str, r: Redis = None) -> None:
     """Invalidate cached balance data for a group."""
+    with _group_balance_l1_lock:
+        _group_balance_l1.pop(group_id, None)
+    
     if r is None:
         r = get_redis()
     
@@ -348,25 +378,43 @@ def invalidate_group_balance_cache(group_id: str, r: Redis = None) -> None:
         pass  # Continue if cache invalidation fails
 
 
-def invalidate_user_balance_cache(user_id: str, r: Redis = None) -> None:
-    """Invalidate cached balance data for a user across all groups."""
+def invalidate_user_balance_cache(user_id: str, r: Redis = None, db: Session | None = None) -> None:
+    """
+    Invalidate cached balance data for a user across all groups.
+    
+    Reuses the caller's session when given; otherwise a short-lived one is
+    opened for the membership lookup.
+    """
     if r is None:
         r = get_redis()
     
+    keys = [f"balance:user:{user_id}"]
     try:
-        # Invalidate user's own balance cache
-        user_cache_key = f"balance:user:{user_id}"
-        r.delete(user_cache_key)
-        
-        # Get all groups where user is a member and invalidate their caches
-        from ..db.deps import get_db
-        db = next(get_db())
-        memberships = db.query(GroupMember).filter(
-            GroupMember.user_id == user_id,
-            GroupMember.status == "active"
-        ).all()
-        
-        for membership in memberships:
-            invalidate_group_balance_cache(membership.group_id, r)
+        # Group ids only; every group balance the user appears in goes too
+        if db is None:
+            from ..db.session import SessionLocal
+            with SessionLocal() as own_db:
+                group_ids = _active_group_ids(own_db, user_id)
+        else:
+            group_ids = _active_group_ids(db, user_id)
+        keys.extend(f"balance:group:{group_id}" for group_id in group_ids)
+        with _group_balance_l1_lock:
+            for group_id in group_ids:
+                _group_balance_l1.pop(group_id, None)
+    except Exception:
+        pass  # Still drop the user's own balance below
+    
+    try:
+        # One UNLINK for every key instead of a DELETE round-trip per group
+        r.unlink(*keys)
     except Exception:
         pass  # Continue if cache invalidation fails
+
+
+def _active_group_ids(db: Session, user_id: str) -> List[str]:
+    """Ids of the groups the user is an active member of."""
+    rows = db.query(GroupMember.group_id).filter(
+        GroupMember.user_id == user_id,
+        GroupMember.status == "active"
+    ).all()
+    return [group_id for (group_id,) in rows]
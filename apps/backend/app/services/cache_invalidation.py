@@ -8,26 +8,26 @@ expense/settlement mutations affecting a group.
 
 from __future__ import annotations
 from typing import Iterable
+from redis import Redis
 from sqlalchemy.orm import Session
 
 from ..core.redis import get_redis
 from ..db.models import GroupMember
 
 
-def _delete_keys(keys: Iterable[str]) -> None:
-    r = get_redis()
+def _delete_keys(keys: Iterable[str], r: Redis | None = None) -> None:
+    """Drop keys in one round-trip; UNLINK frees the memory off Redis' main thread."""
+    keys = list(keys)
+    if not keys:
+        return
     try:
-        for k in keys:
-            try:
-                r.delete(k)
-            except Exception:
-                # Best-effort
-                pass
+        (r or get_redis()).unlink(*keys)
     except Exception:
+        # Best-effort
         pass
 
 
-def invalidate_user_caches_for_group(db: Session, group_id: str) -> None:
+def invalidate_user_caches_for_group(db: Session, group_id: str, r: Redis | None = None) -> None:
     """Invalidate cached aggregates for all active members of a group.
 
     This clears keys:
@@ -47,6 +47,6 @@ def invalidate_user_caches_for_group(db: Session, group_id: str) -> None:
     for uid in user_ids:
         keys.append(f"dash:user:{uid}")
         keys.append(f"groups:overview:user:{uid}")
-    _delete_keys(keys)
+    _delete_keys(keys, r)
 
 
@@ -14,6 +14,11 @@ logger = logging.getLogger(__name__)
 # Cache exchange rates for 1 hour
 EXCHANGE_RATE_CACHE_TTL = 3600
 
+# One pooled HTTP/2 client shared by every provider call, so rate fetches reuse
+# connections instead of paying DNS + TCP + TLS each time. Created on first
+# use (inside the running event loop) and closed on app shutdown.
+_http_client: httpx.AsyncClient | None = None
+
 # Supported currencies with their symbols and names
 SUPPORTED_CURRENCIES = {
     "INR": {"symbol": "₹", "name": "Indian Rupee", "decimal_places": 2},
@@ -29,6 +34,65 @@ SUPPORTED_CURRENCIES = {
     "CNY": {"symbol": "¥", "name": "Chinese Yuan", "decimal_places": 2},
 }
 
+# Static rates (updated periodically), built once at import rather than per call
+_ONE = Decimal("1.0")
+_TO_INR_RATES: Dict[str, Decimal] = {
+    "USD": Decimal("83.0"),
+    "EUR": Decimal("90.0"),
+    "GBP": Decimal("105.0"),
+    "JPY": Decimal("0.55"),
+    "AUD": Decimal("55.0"),
+    "CAD": Decimal("61.0"),
+    "SGD": Decimal("61.0"),
+    "AED": Decimal("22.6"),
+}
+_FROM_INR_RATES: Dict[str, Decimal] = {
+    "USD": Decimal("0.012"),
+    "EUR": Decimal("0.011"),
+    "GBP": Decimal("0.0095"),
+    "JPY": Decimal("1.82"),
+    "AUD": Decimal("0.018"),
+    "CAD": Decimal("0.016"),
+    "SGD": Decimal("0.016"),
+    "AED": Decimal("0.044"),
+}
+# (from, to) -> rate used when the providers fail
+_FALLBACK_RATES: Dict[tuple[str, str], Decimal] = {
+    **{("INR", currency): rate for currency, rate in _FROM_INR_RATES.items()},
+    **{(currency, "INR"): rate for currency, rate in _TO_INR_RATES.items()},
+}
+
+# format_currency constants
+_CENT = Decimal("0.01")
+_UNIT = Decimal("1")
+_CRORE = Decimal("10000000")
+_LAKH = Decimal("100000")
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared provider HTTP client, creating it if needed."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared provider HTTP client (called on app shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _rate_table_key(base_currency: str) -> str:
+    """Redis hash holding every cached rate from one base currency."""
+    return f"exchange_rates:{base_currency}"
+
+
 async def get_exchange_rate(from_currency: str, to_currency: str) -> Decimal:
     """Get exchange rate between two currencies, with caching."""
     if from_currency == to_currency:
@@ -36,12 +100,14 @@ async def get_exchange_rate(from_currency: str, to_currency: str) -> Decimal:
     
     cache_key = f"exchange_rate:{from_currency}:{to_currency}"
     
-    # Try to get from cache first
+    # Try the base currency's rate table, then the per-pair key, in one round-trip
     try:
-        r = get_redis()
-        cached_rate = r.get(cache_key)
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.hget(_rate_table_key(from_currency), to_currency)
+        pipe.get(cache_key)
+        cached_rate = next((rate for rate in pipe.execute() if rate), None)
         if cached_rate:
-            return Decimal(cached_rate.decode())
+            return Decimal(cached_rate)
     except Exception as e:
         logger.warning(f"Failed to get exchange rate from cache: {e}")
     
@@ -77,17 +143,27 @@ async def _fetch_exchange_rate(from_currency: str, to_currency: str) -> Decimal:
         _fetch_from_currency_api,
     ]
     
+    # Race all providers and take the first usable rate, so one provider
+    # timing out doesn't delay the others
+    tasks = {asyncio.create_task(provider(from_currency, to_currency)): provider for provider in providers}
     last_error = None
-    for provider in providers:
-        try:
-            rate = await provider(from_currency, to_currency)
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                rate = await next_done
+            except Exception as e:
+                last_error = e
+                continue
             if rate and rate > 0:
-                logger.info(f"Successfully fetched rate {from_currency}->{to_currency}: {rate} from {provider.__name__}")
+                logger.info(f"Successfully fetched rate {from_currency}->{to_currency}: {rate}")
                 return rate
-        except Exception as e:
-            logger.warning(f"Provider {provider.__name__} failed: {e}")
-            last_error = e
-            continue
+    finally:
+        for task in tasks:
+            task.cancel()
+    
+    for task, provider in tasks.items():
+        if task.done() and not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Provider {provider.__name__} failed: {task.exception()}")
     
     # If all providers fail, raise the last error
     raise Exception(f"All exchange rate providers failed. Last error: {last_error}")
@@ -97,15 +173,14 @@ async def _fetch_from_exchangerate_api(from_currency: str, to_currency: str) ->
     """Fetch from exchangerate-api.com (free tier, no API key required)."""
     url = f"https://api.exchangerate-api.com/v4/latest/{from_currency}"
     
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        data = response.json()
-        
-        if to_currency not in data["rates"]:
-            raise ValueError(f"Currency {to_currency} not supported")
-        
-        return Decimal(str(data["rates"][to_currency]))
+    response = await _get_http_client().get(url)
+    response.raise_for_status()
+    data = response.json()
+    
+    if to_currency not in data["rates"]:
+        raise ValueError(f"Currency {to_currency} not supported")
+    
+    return Decimal(str(data["rates"][to_currency]))
 
 
 async def _fetch_from_fixer_io(from_currency: str, to_currency: str) -> Decimal:
@@ -133,25 +208,14 @@ def convert_to_inr(amount: Decimal, currency: str) -> Decimal:
         r = get_redis()
         cached_rate = r.get(cache_key)
         if cached_rate:
-            rate = Decimal(cached_rate.decode())
+            rate = Decimal(cached_rate)
             logger.info(f"Using cached conversion rate {currency}->INR: {rate}")
             return amount * rate
     except Exception as e:
         logger.warning(f"Failed to get conversion rate from cache: {e}")
     
-    # Fallback to static rates (updated periodically)
-    conversion_rates = {
-        "USD": Decimal("83.0"),
-        "EUR": Decimal("90.0"),
-        "GBP": Decimal("105.0"),
-        "JPY": Decimal("0.55"),
-        "AUD": Decimal("55.0"),
-        "CAD": Decimal("61.0"),
-        "SGD": Decimal("61.0"),
-        "AED": Decimal("22.6"),
-    }
-    
-    rate = conversion_rates.get(currency, Decimal("1.0"))
+    # Fallback to static rates
+    rate = _TO_INR_RATES.get(currency, _ONE)
     
     # Cache the rate for 1 hour
     try:
@@ -168,19 +232,7 @@ def convert_from_inr(amount_inr: Decimal, to_currency: str) -> Decimal:
     if to_currency == "INR":
         return amount_inr
     
-    conversion_rates = {
-        "USD": Decimal("0.012"),
-        "EUR": Decimal("0.011"),
-        "GBP": Decimal("0.0095"),
-        "JPY": Decimal("1.82"),
-        "AUD": Decimal("0.018"),
-        "CAD": Decimal("0.016"),
-        "SGD": Decimal("0.016"),
-        "AED": Decimal("0.044"),
-    }
-    
-    rate = conversion_rates.get(to_currency, Decimal("1.0"))
-    return amount_inr * rate
+    return amount_inr * _FROM_INR_RATES.get(to_currency, _ONE)
 
 
 def format_currency(amount: Decimal, currency: str) -> str:
@@ -193,14 +245,14 @@ def format_currency(amount: Decimal, currency: str) -> str:
     decimal_places = currency_info["decimal_places"]
     
     # Round to appropriate decimal places
-    rounded_amount = amount.quantize(Decimal('0.01') if decimal_places == 2 else Decimal('1'))
+    rounded_amount = amount.quantize(_CENT if decimal_places == 2 else _UNIT)
     
     if currency == "INR":
         # Indian number formatting (lakhs, crores)
-        if rounded_amount >= 10000000:  # 1 crore
-            return f"{symbol}{rounded_amount / 10000000:.2f}Cr"
-        elif rounded_amount >= 100000:  # 1 lakh
-            return f"{symbol}{rounded_amount / 100000:.2f}L"
+        if rounded_amount >= _CRORE:
+            return f"{symbol}{rounded_amount / _CRORE:.2f}Cr"
+        elif rounded_amount >= _LAKH:
+            return f"{symbol}{rounded_amount / _LAKH:.2f}L"
         else:
             return f"{symbol}{rounded_amount:,.2f}"
     else:
@@ -224,41 +276,57 @@ def validate_currency(currency: str) -> bool:
 
 
 async def get_latest_rates(base_currency: str = "INR") -> Dict[str, Decimal]:
-    """Get latest exchange rates for all supported currencies."""
-    rates = {}
+    """
+    Get latest exchange rates for all supported currencies.
     
-    for currency in SUPPORTED_CURRENCIES:
-        if currency != base_currency:
-            try:
-                rate = await get_exchange_rate(base_currency, currency)
-                rates[currency] = rate
-            except Exception as e:
-                logger.warning(f"Failed to get rate for {base_currency}->{currency}: {e}")
-                # Use fallback rate
-                rates[currency] = _get_fallback_rate(base_currency, currency)
+    The whole table is cached as one Redis hash per base currency, so a warm
+    call is a single HGETALL. Missing rates are fetched concurrently and
+    written back in one pipelined HSET; rates that could not be fetched use
+    the static fallback and are not cached.
+    """
+    targets = [currency for currency in SUPPORTED_CURRENCIES if currency != base_currency]
+    table_key = _rate_table_key(base_currency)
+    
+    rates: Dict[str, Decimal] = {}
+    try:
+        cached = get_redis().hgetall(table_key)
+        rates = {currency: Decimal(cached[currency]) for currency in targets if currency in cached}
+    except Exception as e:
+        logger.warning(f"Failed to get exchange rates from cache: {e}")
+    
+    missing = [currency for currency in targets if currency not in rates]
+    if not missing:
+        return rates
+    
+    # Fetch the missing rates concurrently
+    results = await asyncio.gather(
+        *(_fetch_exchange_rate(base_currency, currency) for currency in missing),
+        return_exceptions=True,
+    )
+    
+    fetched: Dict[str, str] = {}
+    for currency, result in zip(missing, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to get rate for {base_currency}->{currency}: {result}")
+            rates[currency] = _get_fallback_rate(base_currency, currency)
+        else:
+            rates[currency] = result
+            fetched[currency] = str(result)
     
-    return rates
+    if fetched:
+        try:
+            pipe = get_redis().pipeline(transaction=False)
+            pipe.hset(table_key, mapping=fetched)
+            # Keep the table's original expiry so early entries don't outlive the TTL
+            pipe.expire(table_key, EXCHANGE_RATE_CACHE_TTL, nx=True)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to cache exchange rates: {e}")
+    
+    # Return in the usual currency order
+    return {currency: rates[currency] for currency in targets}
 
 
 def _get_fallback_rate(from_currency: str, to_currency: str) -> Decimal:
     """Get fallback exchange rate when API fails."""
-    fallback_rates = {
-        ("INR", "USD"): Decimal("0.012"),
-        ("INR", "EUR"): Decimal("0.011"),
-        ("INR", "GBP"): Decimal("0.0095"),
-        ("INR", "JPY"): Decimal("1.82"),
-        ("INR", "AUD"): Decimal("0.018"),
-        ("INR", "CAD"): Decimal("0.016"),
-        ("INR", "SGD"): Decimal("0.016"),
-        ("INR", "AED"): Decimal("0.044"),
-        ("USD", "INR"): Decimal("83.0"),
-        ("EUR", "INR"): Decimal("90.0"),
-        ("GBP", "INR"): Decimal("105.0"),
-        ("JPY", "INR"): Decimal("0.55"),
-        ("AUD", "INR"): Decimal("55.0"),
-        ("CAD", "INR"): Decimal("61.0"),
-        ("SGD", "INR"): Decimal("61.0"),
-        ("AED", "INR"): Decimal("22.6"),
-    }
-    
-    return fallback_rates.get((from_currency, to_currency), Decimal("1.0"))
+    return _FALLBACK_RATES.get((from_currency, to_currency), _ONE)
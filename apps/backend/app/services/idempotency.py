@@ -1,23 +1,58 @@
 from __future__ import annotations
 from typing import Callable
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from ..db.models import IdempotencyKey
 
+# ON CONFLICT support per dialect; production runs on Postgres, tests on SQLite
+_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def _stored_response(db: Session, actor_user_id: str, client_request_id: str) -> dict | None:
+    # Fetch just the stored response; no IdempotencyKey instance is needed
+    row = db.execute(
+        select(IdempotencyKey.response).where(
+            IdempotencyKey.actor_user_id == actor_user_id,
+            IdempotencyKey.client_request_id == client_request_id,
+        )
+    ).first()
+    return row.response if row else None
+
 
 def with_idempotency(db: Session, actor_user_id: str, client_request_id: str | None, handler: Callable[[], dict]) -> dict:
+    """
+    Run ``handler`` at most once per client request id and commit its work.
+
+    This function owns the transaction: the handler flushes but never commits,
+    so its writes and the stored response land in one commit. A duplicate that
+    arrives after that commit gets the stored response. One that overlaps it
+    blocks on ``uq_idem_actor_key`` in the insert, finds the key taken once the
+    first request commits, rolls its own work back and returns the stored
+    response instead.
+    """
     if not client_request_id:
-        return handler()
-    existing = (
-        db.query(IdempotencyKey)
-        .filter(IdempotencyKey.actor_user_id == actor_user_id, IdempotencyKey.client_request_id == client_request_id)
-        .first()
-    )
-    if existing:
-        return existing.response
+        response = handler()
+        db.commit()
+        return response
+    stored = _stored_response(db, actor_user_id, client_request_id)
+    if stored is not None:
+        return stored
     response = handler()
-    rec = IdempotencyKey(id=f"{actor_user_id}:{client_request_id}", actor_user_id=actor_user_id, client_request_id=client_request_id, response=response)
-    db.add(rec)
-    db.flush()
+    insert = _INSERTS[db.get_bind().dialect.name]
+    inserted = db.execute(
+        insert(IdempotencyKey)
+        .values(
+            id=f"{actor_user_id}:{client_request_id}",
+            actor_user_id=actor_user_id,
+            client_request_id=client_request_id,
+            response=response,
+        )
+        .on_conflict_do_nothing()
+        .returning(IdempotencyKey.id)
+    ).first()
+    if inserted is None:
+        db.rollback()
+        return _stored_response(db, actor_user_id, client_request_id)
+    db.commit()
     return response
-
-
@@ -1,16 +1,19 @@
 from __future__ import annotations
 from sqlalchemy.orm import Session
-from sqlalchemy import func, select
-from ..db.models import SyncOp
+from sqlalchemy.dialects.postgresql import insert
+from ..db.models import SyncOp, SyncSeq
 
 
 def append_sync(db: Session, user_id: str, op_type: str, entity_type: str, entity_id: str, payload: dict) -> SyncOp:
+    # One atomic upsert hands out the user's next sequence number; concurrent
+    # writers serialize on the counter row instead of racing on MAX(seq)
     next_seq = db.execute(
-        select(func.coalesce(func.max(SyncOp.seq), 0) + 1).where(SyncOp.user_id == user_id)
+        insert(SyncSeq)
+        .values(user_id=user_id, next_seq=1)
+        .on_conflict_do_update(index_elements=[SyncSeq.user_id], set_={"next_seq": SyncSeq.next_seq + 1})
+        .returning(SyncSeq.next_seq)
     ).scalar_one()
     rec = SyncOp(user_id=user_id, seq=int(next_seq), op_type=op_type, entity_type=entity_type, entity_id=entity_id, payload=payload)
     db.add(rec)
     db.flush()
     return rec
-
-
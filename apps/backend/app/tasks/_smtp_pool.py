@@ -0,0 +1,121 @@
+"""
+Per-worker SMTP connection reuse for the notification tasks.
+
+Opening a session (TCP connect, STARTTLS, AUTH) costs far more than sending
+one message, so each worker thread keeps its connection open across tasks.
+A cached connection is checked with NOOP before use, replaced after
+MAX_MESSAGES_PER_CONNECTION messages, and dropped after any send failure.
+All connections are closed when the worker process shuts down.
+"""
+
+from __future__ import annotations
+import logging
+import threading
+from typing import Callable
+from email.message import EmailMessage
+from smtplib import SMTP, SMTPException
+
+from celery.signals import worker_process_shutdown
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Providers commonly recommend not reusing a session for more than ~100 messages
+MAX_MESSAGES_PER_CONNECTION = 100
+
+_local = threading.local()
+_open_connections: set[SMTP] = set()
+_open_connections_lock = threading.Lock()
+
+
+def _connect() -> SMTP:
+    smtp = SMTP(settings.smtp_host, settings.smtp_port or 25)
+    if settings.smtp_user and settings.smtp_pass:
+        smtp.starttls()
+        smtp.login(settings.smtp_user, settings.smtp_pass)
+    with _open_connections_lock:
+        _open_connections.add(smtp)
+    return smtp
+
+
+def _close(smtp: SMTP) -> None:
+    with _open_connections_lock:
+        _open_connections.discard(smtp)
+    try:
+        smtp.quit()
+    except Exception:
+        smtp.close()
+
+
+def discard_smtp() -> None:
+    """Drop this thread's cached connection (e.g. after a failed send)."""
+    smtp = getattr(_local, "smtp", None)
+    _local.smtp = None
+    if smtp is not None:
+        _close(smtp)
+
+
+def get_smtp() -> SMTP:
+    """
+    Return this thread's SMTP connection, opening a new one if needed.
+
+    Returns:
+        A connected (and, when credentials are configured, authenticated) client
+    """
+    smtp = getattr(_local, "smtp", None)
+    if smtp is not None:
+        if _local.sent >= MAX_MESSAGES_PER_CONNECTION:
+            discard_smtp()
+            smtp = None
+        else:
+            try:
+                if smtp.noop()[0] != 250:
+                    discard_smtp()
+                    smtp = None
+            except (SMTPException, OSError):
+                discard_smtp()
+                smtp = None
+    if smtp is None:
+        smtp = _connect()
+        _local.smtp = smtp
+        _local.sent = 0
+    return smtp
+
+
+def _send(deliver: Callable[[SMTP], object]) -> None:
+    try:
+        deliver(get_smtp())
+    except Exception:
+        discard_smtp()
+        raise
+    _local.sent += 1
+
+
+def send_message(msg: EmailMessage) -> None:
+    """
+    Send a message over the pooled connection.
+
+    Raises:
+        Whatever smtplib raises; the connection is discarded first so the next
+        send starts from a fresh session
+    """
+    _send(lambda smtp: smtp.send_message(msg))
+
+
+def send_raw(from_addr: str, to_addr: str, raw: bytes) -> None:
+    """
+    Send an already serialized message over the pooled connection.
+
+    Raises:
+        Same as send_message
+    """
+    _send(lambda smtp: smtp.sendmail(from_addr, [to_addr], raw))
+
+
+@worker_process_shutdown.connect
+def _close_all(**kwargs) -> None:
+    with _open_connections_lock:
+        connections = list(_open_connections)
+    for smtp in connections:
+        _close(smtp)
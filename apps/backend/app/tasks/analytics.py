@@ -0,0 +1,8 @@
+from __future__ import annotations
+from app.celery_app import celery_app
+from app.db.analytics_views import refresh_analytics_views
+
+
+@celery_app.task(name="app.tasks.analytics.refresh_views")
+def refresh_views():
+    refresh_analytics_views()
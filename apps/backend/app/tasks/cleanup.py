@@ -1,8 +1,8 @@
 from __future__ import annotations
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from app.celery_app import celery_app
 from app.db.session import SessionLocal
-from app.db.models import FriendInvite, GroupInvite
+from app.db.models import FriendInvite, GroupInvite, IdempotencyKey, RefreshToken
 
 
 @celery_app.task(name="app.tasks.cleanup.expire_invites")
@@ -10,8 +10,33 @@ def expire_invites():
 	with SessionLocal() as db:
 		now = datetime.now(timezone.utc)
 		for model in (FriendInvite, GroupInvite):
-			rows = db.query(model).filter(model.status == "pending", model.ttl_at < now).all()
-			for r in rows:
-				r.status = "expired"
-				db.add(r)
+			db.query(model).filter(model.status == "pending", model.ttl_at < now).update(
+				{model.status: "expired"}, synchronize_session=False
+			)
+		db.commit()
+
+
+# Expired tokens are kept briefly so late refresh attempts still hit a row
+# and fail as expired rather than unknown.
+REFRESH_TOKEN_RETENTION = timedelta(days=7)
+
+
+@celery_app.task(name="app.tasks.cleanup.prune_refresh_tokens")
+def prune_refresh_tokens():
+	with SessionLocal() as db:
+		cutoff = datetime.now(timezone.utc) - REFRESH_TOKEN_RETENTION
+		db.query(RefreshToken).filter(RefreshToken.expires_at < cutoff).delete(synchronize_session=False)
+		db.commit()
+
+
+# Clients only retry a request for a short while; older keys just bloat the
+# unique index that every mutating request probes.
+IDEMPOTENCY_KEY_RETENTION = timedelta(days=1)
+
+
+@celery_app.task(name="app.tasks.cleanup.prune_idempotency_keys")
+def prune_idempotency_keys():
+	with SessionLocal() as db:
+		cutoff = datetime.now(timezone.utc) - IDEMPOTENCY_KEY_RETENTION
+		db.query(IdempotencyKey).filter(IdempotencyKey.created_at < cutoff).delete(synchronize_session=False)
 		db.commit()
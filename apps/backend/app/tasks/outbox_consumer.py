@@ -1,4 +1,5 @@
 from __future__ import annotations
+from sqlalchemy import update
 from app.celery_app import celery_app
 from app.db.session import SessionLocal
 from app.db.models import NotificationOutbox
@@ -8,20 +9,28 @@ from email.message import EmailMessage
 from twilio.rest import Client
 
 
+# Notification types that have a delivery path
+DELIVERABLE_TYPES = frozenset({"friend_request", "friend_accept", "group_invite", "member_added", "member_removed", "role_changed"})
+
+
 @celery_app.task(name="app.tasks.outbox.process")
 def process_outbox(limit: int = 100):
     with SessionLocal() as db:
-        rows = db.query(NotificationOutbox).filter(NotificationOutbox.status == "pending").order_by(NotificationOutbox.id.asc()).limit(limit).all()
+        rows = NotificationOutbox.claim_batch(db, limit)
+        sent_ids, failed_ids = [], []
         for r in rows:
             ok = False
-            if r.type in {"friend_request", "friend_accept", "group_invite", "member_added", "member_removed", "role_changed"}:
+            if r.type in DELIVERABLE_TYPES:
                 # placeholder push/email/SMS logic
                 ok = True
-            if ok:
-                r.status = "sent"
-            else:
-                r.status = "failed"
-            db.add(r)
+            (sent_ids if ok else failed_ids).append(r.id)
+        # One UPDATE per outcome instead of one per row
+        for status, ids in (("sent", sent_ids), ("failed", failed_ids)):
+            if ids:
+                db.execute(
+                    update(NotificationOutbox)
+                    .where(NotificationOutbox.id.in_(ids))
+                    .values(status=status)
+                    .execution_options(synchronize_session=False)
+                )
         db.commit()
-
-
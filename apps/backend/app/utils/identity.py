@@ -1,39 +1,49 @@
+import re
 from typing import Tuple
 
+_PHONE_STRIP = str.maketrans("", "", " -()\t")
+_NON_DIGIT = re.compile(r"\D")
+_IN_CC = "+91"
+_MOBILE_PFX = frozenset("6789")
+
 
 def normalize_email(value: str) -> str:
     if not isinstance(value, str):
         value = str(value)
+    # Already normalized (the usual case): skip building two new strings
+    if value.islower() and not value[0].isspace() and not value[-1].isspace():
+        return value
     return value.strip().lower()
 
 
 def normalize_phone_e164(value: str) -> str:
     if not isinstance(value, str):
         value = str(value)
-    s = (
-        value.replace(" ", "")
-        .replace("-", "")
-        .replace("(", "")
-        .replace(")", "")
-    )
+    if value.isascii() and value.isdigit():
+        # Common case: bare digits, nothing to strip
+        s = digits = value
+    else:
+        s = value.translate(_PHONE_STRIP)
+        digits = None
     if s.startswith("+"):
         digits = s[1:]
         if not digits.isdigit():
             raise ValueError("invalid_phone")
-        if s.startswith("+91") and len(digits) == 12:
+        if s.startswith(_IN_CC) and len(digits) == 12:
             return s
-        if s.startswith("+91") and len(digits) == 10:
-            return "+91" + digits
-        if s.startswith("+91") and len(digits) == 11 and digits.startswith("0"):
-            return "+91" + digits[1:]
+        if s.startswith(_IN_CC) and len(digits) == 10:
+            return _IN_CC + digits
+        if s.startswith(_IN_CC) and len(digits) == 11 and digits.startswith("0"):
+            return _IN_CC + digits[1:]
         raise ValueError("unsupported_region")
-    digits = ''.join(ch for ch in s if ch.isdigit())
-    if len(digits) == 10 and digits[0] in {"6", "7", "8", "9"}:
-        return "+91" + digits
+    if digits is None:
+        digits = _NON_DIGIT.sub("", s)
+    if len(digits) == 10 and digits[0] in _MOBILE_PFX:
+        return _IN_CC + digits
     if len(digits) == 11 and digits.startswith("0"):
         d = digits[1:]
-        if len(d) == 10 and d[0] in {"6", "7", "8", "9"}:
-            return "+91" + d
+        if len(d) == 10 and d[0] in _MOBILE_PFX:
+            return _IN_CC + d
     if digits.startswith("91") and len(digits) == 12:
         return "+" + digits
     raise ValueError("invalid_phone")
@@ -1,5 +1,5 @@
+import os
 import secrets
-import base64
 import uuid
 from typing import Union
 
@@ -13,8 +13,7 @@ def generate_token_128b() -> str:
     Returns:
         str: A 128-bit random token encoded as base64url (22 characters)
     """
-    raw = secrets.token_bytes(16)
-    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+    return secrets.token_urlsafe(16)
 
 
 def generate_uuid() -> str:
@@ -39,7 +38,11 @@ def generate_uuid_short() -> str:
     Returns:
         str: A UUID4 string without hyphens (32 characters)
     """
-    return str(uuid.uuid4()).replace('-', '')
+    # Same bits uuid4() produces, without constructing a UUID object
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return raw.hex()
 
 
 def is_valid_uuid(uuid_string: str) -> bool:
@@ -1,21 +1,60 @@
 from __future__ import annotations
+import secrets
 import time
 from redis import Redis
+from redis.commands.core import Script
+
+# Trim, count, admit and expire in one atomic step, so concurrent checks can't
+# both see room under the limit. Returns {allowed, reset_in_seconds}.
+_SLIDING_WINDOW_LUA = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+if redis.call('ZCARD', KEYS[1]) >= limit then
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    local oldest_ts = tonumber(oldest[2]) or now
+    return {0, math.max(0, oldest_ts + window - now)}
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('EXPIRE', KEYS[1], window)
+return {1, 0}
+"""
+
+_sliding_window_script: Script | None = None
 
 
 def sliding_window_allow(r: Redis, key: str, window_seconds: int, limit: int) -> tuple[bool, int]:
+    global _sliding_window_script
+    if _sliding_window_script is None:
+        # EVALSHA, reloading the script automatically if the server lost it
+        _sliding_window_script = r.register_script(_SLIDING_WINDOW_LUA)
     now = int(time.time())
-    r.zremrangebyscore(key, 0, now - window_seconds)
-    count = r.zcard(key)
-    if count >= limit:
-        oldest = r.zrange(key, 0, 0, withscores=True)
-        reset_in = 0
-        if oldest and len(oldest[0]) == 2:
-            oldest_ts = int(oldest[0][1])
-            reset_in = max(0, (oldest_ts + window_seconds) - now)
-        return False, reset_in
-    r.zadd(key, {str(now): now})
-    r.expire(key, window_seconds)
-    return True, 0
+    # Unique member per request so hits within the same second all count
+    member = f"{now}:{secrets.token_hex(4)}"
+    allowed, reset_in = _sliding_window_script(
+        keys=[key], args=[now, window_seconds, limit, member], client=r
+    )
+    return bool(allowed), int(reset_in)
 
 
+def fixed_window_allow(r: Redis, key: str, window_seconds: int, limit: int) -> tuple[bool, int]:
+    """
+    Fixed-window counter: an O(1) INCR per check instead of a sorted-set entry.
+
+    The window starts at the first hit and is not extended by later ones, so
+    up to twice ``limit`` requests can pass around a window boundary; use it
+    where that burst is acceptable and keep sliding_window_allow otherwise.
+    ``key`` must not be shared with sliding_window_allow (different type).
+
+    Returns:
+        (allowed, seconds until the window resets when not allowed, else 0)
+    """
+    pipe = r.pipeline(transaction=False)
+    pipe.incr(key)
+    pipe.expire(key, window_seconds, nx=True)
+    pipe.ttl(key)
+    count, _, ttl = pipe.execute()
+    if count > limit:
+        return False, max(0, ttl)
+    return True, 0
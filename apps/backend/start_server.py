@@ -27,17 +27,30 @@ def main():
         "host": "0.0.0.0",
         "port": 8000,
         "log_level": "info",
-        "access_log": False,  # Disabled - using custom AccessLogMiddleware instead
-        "use_colors": True,
+        "access_log": False,  # Disabled - using custom ObservabilityMiddleware instead
     }
     
+    # Worker count drives per-worker DB pool sizing (see PerformanceConfig),
+    # so export it before the app (and its engines) are imported
+    if environment in {"development", "dev", "local"}:
+        workers = 1
+    else:
+        # Explicit WEB_CONCURRENCY / WORKERS win; otherwise one async worker per core
+        workers = int(
+            os.getenv("WEB_CONCURRENCY")
+            or os.getenv("WORKERS")
+            or max(2, os.cpu_count() or 2)
+        )
+    os.environ["WORKERS"] = str(workers)
+    
     if environment in {"development", "dev", "local"}:
         # Development configuration
         config.update({
             "reload": True,
             "reload_dirs": [str(app_dir)],
             "reload_excludes": ["*.pyc", "*.pyo", "__pycache__", "*.log"],
-            "workers": 1,  # Single worker for development with reload
+            "use_colors": True,
+            "workers": workers,  # Single worker for development with reload
             "loop": "uvloop",  # Use uvloop for better performance
             "http": "httptools",  # Use httptools for better HTTP parsing
             "ws": "websockets",  # Use websockets for WebSocket support
@@ -49,7 +62,8 @@ def main():
         # Production configuration
         config.update({
             "reload": False,
-            "workers": 3,  # Multiple workers for production
+            "use_colors": False,  # Plain records for log collectors; no ANSI wrapping
+            "workers": workers,  # DB pools are sized per worker
             "loop": "uvloop",
             "http": "httptools",
             "ws": "websockets",
@@ -58,9 +72,14 @@ def main():
             "timeout_graceful_shutdown": 30,
             "limit_concurrency": 1000,  # Limit concurrent connections
             "limit_max_requests": 1000,  # Restart worker after N requests
-            "backlog": 2048,  # Socket backlog
+            "backlog": int(os.getenv("UVICORN_BACKLOG", "4096")),  # Socket backlog, matches the default somaxconn
         })
     
+    # Create tables, ensure indexes and seed users once, before any worker
+    # starts, instead of repeating the work in every worker's startup hook
+    from app.db.init_db import init_db
+    init_db()
+    
     # Start the server
     uvicorn.run(**config)
 
@@ -0,0 +1,188 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.db.base import Base
+from app.db.deps import get_db
+from app.db.models import User, Group, GroupMember
+from app.auth.tokens import create_access_token
+
+# In-memory test database; StaticPool hands the one connection (and so the one
+# database) to every session, including those the test client's requests open.
+# It is private to the process, so each pytest-xdist worker gets its own.
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Stable ids, so tokens minted once per run stay valid for every test's rows
+TEST_USER_ID = "0b7e4f52-3c1a-4d8e-a5f6-7b8c9d0e1f01"
+TEST_GROUP_ID = "0b7e4f52-3c1a-4d8e-a5f6-7b8c9d0e1f02"
+
+
+# pysqlite emits its own BEGIN lazily and breaks SAVEPOINT; let SQLAlchemy
+# issue BEGIN so each test's outer transaction really wraps its savepoints
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_begin(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+# Session of the running test's transaction, if it has one. A plain module
+# global rather than a ContextVar: TestClient runs the app on its own portal
+# thread (and sync dependencies in a threadpool), so a value set in the test's
+# context is not reliably visible there; tests in a process run one at a time.
+_current_db = None
+
+
+def _override_get_db():
+    if _current_db is None:
+        # Tests without db_session keep the app's configured database
+        yield from get_db()
+    else:
+        yield _current_db
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _db_override():
+    # Installed once for the run; db_session only swaps _current_db
+    app.dependency_overrides[get_db] = _override_get_db
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="session")
+def _schema():
+    Base.metadata.create_all(bind=engine)
+    yield
+    # An in-memory database vanishes with the process; only files need cleaning
+    if engine.url.database not in (None, "", ":memory:"):
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db_session(_schema):
+    # Everything a test writes, including commits made by fixtures and route
+    # handlers, happens inside one transaction that is rolled back afterwards.
+    # Route handlers share this session through the get_db override.
+    global _current_db
+    connection = engine.connect()
+    trans = connection.begin()
+    db = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+    _current_db = db
+    try:
+        yield db
+    finally:
+        _current_db = None
+        db.close()
+        trans.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="function")
+def query_counter():
+    """Record every SQL statement executed on the test engine."""
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        # The savepoints db_session opens around commits are not queries
+        if not statement.startswith(("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture(scope="session")
+def client():
+    # One client (and ASGI transport) for the whole run; per-test state lives
+    # in db_session, which points get_db at its own transaction
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def authed_client(auth_headers):
+    # Separate from ``client`` so unauthenticated tests stay unauthenticated
+    c = TestClient(app)
+    c.headers.update(auth_headers)
+    return c
+
+
+@pytest.fixture(scope="session")
+def hashed_secret():
+    """Hash of "secret", computed once: the password KDF is deliberately slow."""
+    from app.core.security import hash_password
+    return hash_password("secret")
+
+
+@pytest.fixture(scope="session")
+def test_user_factory():
+    """Return a callable that inserts a user with a fresh id and email."""
+    def make(db, **overrides) -> User:
+        user_id = overrides.pop("id", None) or str(uuid.uuid4())
+        fields = {
+            "email": f"{user_id}@example.com",
+            "hashed_password": "hashed_password",
+            "display_name": "Test User",
+            "preferred_currency": "INR",
+            "email_verified": True,
+            "phone_verified": True,
+        }
+        fields.update(overrides)
+        user = User(id=user_id, **fields)
+        db.add(user)
+        db.commit()
+        return user
+    return make
+
+
+@pytest.fixture(scope="session")
+def test_group_factory():
+    """Return a callable that inserts a group owned by ``owner`` (an active member)."""
+    def make(db, owner: User, **overrides) -> Group:
+        group_id = overrides.pop("id", None) or str(uuid.uuid4())
+        fields = {"name": "Test Group", "base_currency": "INR"}
+        fields.update(overrides)
+        group = Group(id=group_id, owner_id=owner.id, **fields)
+        db.add(group)
+        db.add(GroupMember(
+            id=str(uuid.uuid4()),
+            group_id=group.id,
+            user_id=owner.id,
+            role="owner",
+            status="active",
+        ))
+        db.commit()
+        return group
+    return make
+
+
+@pytest.fixture(scope="function")
+def test_user(db_session, test_user_factory):
+    return test_user_factory(db_session, id=TEST_USER_ID, email="test@example.com")
+
+
+@pytest.fixture(scope="function")
+def test_group(db_session, test_user, test_group_factory):
+    return test_group_factory(db_session, test_user, id=TEST_GROUP_ID)
+
+
+@pytest.fixture(scope="session")
+def auth_headers():
+    # Signed once; test_user is re-inserted with TEST_USER_ID in each test
+    token, _ = create_access_token({"sub": TEST_USER_ID, "roles": ["BASIC_USER"]})
+    return {"Authorization": f"Bearer {token}"}
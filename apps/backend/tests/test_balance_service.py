@@ -1,10 +1,9 @@
 import pytest
 from decimal import Decimal
 from datetime import datetime
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
 
-from app.db.base import Base
 from app.db.models import (
     User,
     Group,
@@ -16,11 +15,6 @@ from app.db.models import (
 from app.services.balance import calculate_group_balances
 
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test_balance.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-
 class DummyRedis:
     """Simple in-memory stand-in for Redis during tests."""
 
@@ -33,25 +27,20 @@ class DummyRedis:
     def setex(self, key: str, ttl: int, value: str) -> None:
         self._store[key] = value
 
+    def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool | None:
+        if nx and key in self._store:
+            return None
+        self._store[key] = value
+        return True
+
     def delete(self, key: str) -> None:
         self._store.pop(key, None)
 
 
-@pytest.fixture(scope="function")
-def db_session():
-    Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-        Base.metadata.drop_all(bind=engine)
-
-
 def test_calculate_group_balances_completed_settlement_offsets_debt(db_session):
     """Completed settlement should neutralize the outstanding balance."""
     user_a = User(
-        id="user_a",
+        id="6f1c2b3e-8a4d-4f5e-9b6a-1c2d3e4f5a01",
         email="user_a@example.com",
         hashed_password="hashed",
         display_name="User A",
@@ -60,7 +49,7 @@ def test_calculate_group_balances_completed_settlement_offsets_debt(db_session):
         phone_verified=True,
     )
     user_b = User(
-        id="user_b",
+        id="6f1c2b3e-8a4d-4f5e-9b6a-1c2d3e4f5a02",
         email="user_b@example.com",
         hashed_password="hashed",
         display_name="User B",
@@ -71,7 +60,7 @@ def test_calculate_group_balances_completed_settlement_offsets_debt(db_session):
     db_session.add_all([user_a, user_b])
 
     group = Group(
-        id="group_1",
+        id="6f1c2b3e-8a4d-4f5e-9b6a-1c2d3e4f5a03",
         name="Test Group",
         base_currency="INR",
         owner_id=user_a.id,
@@ -95,7 +84,7 @@ def test_calculate_group_balances_completed_settlement_offsets_debt(db_session):
     db_session.add_all([member_a, member_b])
 
     expense = Expense(
-        id="expense_1",
+        id="6f1c2b3e-8a4d-4f5e-9b6a-1c2d3e4f5a04",
         group_id=group.id,
         payer_id=user_a.id,
         amount=Decimal("100.00"),
@@ -108,14 +97,14 @@ def test_calculate_group_balances_completed_settlement_offsets_debt(db_session):
     db_session.add(expense)
 
     split_a = ExpenseSplit(
-        id="split_a",
+        id="6f1c2b3e-8a4d-4f5e-9b6a-1c2d3e4f5a05",
         expense_id=expense.id,
         user_id=user_a.id,
         amount=Decimal("50.00"),
         amount_inr=Decimal("50.00"),
     )
     split_b = ExpenseSplit(
-        id="split_b",
+        id="6f1c2b3e-8a4d-4f5e-9b6a-1c2d3e4f5a06",
         expense_id=expense.id,
         user_id=user_b.id,
         amount=Decimal("50.00"),
@@ -124,7 +113,7 @@ def test_calculate_group_balances_completed_settlement_offsets_debt(db_session):
     db_session.add_all([split_a, split_b])
 
     settlement = Settlement(
-        id="settlement_1",
+        id="6f1c2b3e-8a4d-4f5e-9b6a-1c2d3e4f5a07",
         group_id=group.id,
         from_user_id=user_b.id,
         to_user_id=user_a.id,
@@ -146,3 +135,171 @@ def test_calculate_group_balances_completed_settlement_offsets_debt(db_session):
     assert Decimal("0.00") == balance_map[user_a.id]
     assert Decimal("0.00") == balance_map[user_b.id]
     assert sum(balance_map.values()) == Decimal("0.00")
+
+
+def test_settlement_list_options_load_related_rows_in_bounded_queries(db_session, query_counter):
+    """Listing settlements should not issue per-row queries for users or groups."""
+    users = [
+        User(
+            id=f"6f1c2b3e-8a4d-4f5e-9b6a-1c2d3e4f5b0{index}",
+            email=f"list_user_{index}@example.com",
+            hashed_password="hashed",
+            display_name=f"List User {index}",
+            preferred_currency="INR",
+            email_verified=True,
+            phone_verified=True,
+        )
+        for index in range(3)
+    ]
+    db_session.add_all(users)
+    group = Group(
+        id="6f1c2b3e-8a4d-4f5e-9b6a-1c2d3e4f5b10",
+        name="List Group",
+        base_currency="INR",
+        owner_id=users[0].id,
+    )
+    db_session.add(group)
+    db_session.add_all(
+        [
+            Settlement(
+                id=f"6f1c2b3e-8a4d-4f5e-9b6a-1c2d3e4f5b2{index}",
+                group_id=group.id,
+                from_user_id=users[index].id,
+                to_user_id=users[(index + 1) % 3].id,
+                amount=Decimal("10.00"),
+                amount_inr=Decimal("10.00"),
+                currency="INR",
+                method="cash",
+                status="completed",
+                created_by=users[0].id,
+            )
+            for index in range(3)
+        ]
+    )
+    group_id = group.id
+    db_session.commit()
+    db_session.expunge_all()
+    query_counter.clear()
+
+    settlements = db_session.scalars(
+        select(Settlement).options(*Settlement.options_for_list())
+    ).all()
+    # The fields the list endpoints serialize
+    rows = sorted((s.group_id, s.from_user.display_name, s.to_user.display_name) for s in settlements)
+
+    assert rows == [
+        (group_id, "List User 0", "List User 1"),
+        (group_id, "List User 1", "List User 2"),
+        (group_id, "List User 2", "List User 0"),
+    ]
+    # One query for settlements plus one batch per user relationship.
+    assert len(query_counter) <= 3
+    with pytest.raises(InvalidRequestError):
+        settlements[0].group
+    with pytest.raises(InvalidRequestError):
+        settlements[0].from_user.groups
+    with pytest.raises(InvalidRequestError):
+        settlements[0].creator
+
+
+def test_calculate_group_balances_reads_members_and_totals_in_one_query(db_session, query_counter):
+    """An uncached balance calculation should cost a single round-trip when everyone is a member."""
+    users = [
+        User(
+            id=f"6f1c2b3e-8a4d-4f5e-9b6a-1c2d3e4f5c0{index}",
+            email=f"trip_user_{index}@example.com",
+            hashed_password="hashed",
+            display_name=f"Trip User {index}",
+            preferred_currency="INR",
+            email_verified=True,
+            phone_verified=True,
+        )
+        for index in range(2)
+    ]
+    db_session.add_all(users)
+    group = Group(
+        id="6f1c2b3e-8a4d-4f5e-9b6a-1c2d3e4f5c10",
+        name="Trip Group",
+        base_currency="INR",
+        owner_id=users[0].id,
+    )
+    db_session.add(group)
+    db_session.add_all(
+        [
+            GroupMember(id=f"trip_member_{index}", group_id=group.id, user_id=user.id, role="member", status="active")
+            for index, user in enumerate(users)
+        ]
+    )
+    expense = Expense(
+        id="6f1c2b3e-8a4d-4f5e-9b6a-1c2d3e4f5c20",
+        group_id=group.id,
+        payer_id=users[0].id,
+        amount=Decimal("30.00"),
+        currency="INR",
+        amount_inr=Decimal("30.00"),
+        description="Fuel",
+        expense_date=datetime.utcnow(),
+        created_by=users[0].id,
+    )
+    db_session.add(expense)
+    db_session.add_all(
+        [
+            ExpenseSplit(
+                id=f"6f1c2b3e-8a4d-4f5e-9b6a-1c2d3e4f5c3{index}",
+                expense_id=expense.id,
+                user_id=user.id,
+                amount=Decimal("15.00"),
+                amount_inr=Decimal("15.00"),
+            )
+            for index, user in enumerate(users)
+        ]
+    )
+    # Read the ids before commit() expires the instances, so refresh SELECTs
+    # don't land in the query count
+    group_id = group.id
+    payer_id, other_id = (user.id for user in users)
+    db_session.commit()
+    query_counter.clear()
+
+    redis = DummyRedis()
+    balances = calculate_group_balances(group_id, db_session, redis)
+    balance_map = {balance.user_id: balance.balance_inr for balance in balances}
+
+    assert balance_map == {payer_id: Decimal("15.00"), other_id: Decimal("-15.00")}
+    assert balances[0].user_name.startswith("Trip User")
+    assert len(query_counter) == 1
+    # The recompute lock is released and only the cached result is left
+    assert set(redis._store) == {f"balance:group:{group_id}"}
+
+
+def test_calculate_group_balances_leaves_another_workers_lock_alone(db_session, monkeypatch):
+    """A worker that times out waiting on someone else's lock computes but never releases it."""
+    monkeypatch.setattr("app.services.balance.GROUP_BALANCE_LOCK_WAIT", 0.05)
+    owner = User(
+        id="6f1c2b3e-8a4d-4f5e-9b6a-1c2d3e4f5d01",
+        email="lock_owner@example.com",
+        hashed_password="hashed",
+        display_name="Lock Owner",
+        preferred_currency="INR",
+        email_verified=True,
+        phone_verified=True,
+    )
+    group = Group(
+        id="6f1c2b3e-8a4d-4f5e-9b6a-1c2d3e4f5d10",
+        name="Lock Group",
+        base_currency="INR",
+        owner_id=owner.id,
+    )
+    db_session.add_all([owner, group])
+    db_session.add(GroupMember(id="lock_member", group_id=group.id, user_id=owner.id, role="owner", status="active"))
+    group_id, owner_id = group.id, owner.id
+    db_session.commit()
+    redis = DummyRedis()
+    lock_key = f"lock:balance:group:{group_id}"
+    redis.set(lock_key, "1", nx=True, ex=10)
+
+    balances = calculate_group_balances(group_id, db_session, redis, use_l1=False)
+
+    assert [(b.user_id, b.balance_inr) for b in balances] == [(owner_id, Decimal("0.00"))]
+    assert redis.get(lock_key) == "1"
+    assert redis.get(f"balance:group:{group_id}") is not None
@@ -7,9 +7,6 @@ This test exercises the auth flow (register/login) and the optimized
 Aggressive logging is used to aid debugging if failures occur.
 """
 
-from fastapi.testclient import TestClient
-from app.main import app
-
 
 def _extract_access_token(body: dict) -> str | None:
     # Support both direct and session-wrapped formats
@@ -21,8 +18,7 @@ def _extract_access_token(body: dict) -> str | None:
     return session.get("access_token")
 
 
-def test_login_and_fetch_dashboard_stats_with_given_credentials():
-    client = TestClient(app)
+def test_login_and_fetch_dashboard_stats_with_given_credentials(client):
 
     email = "nirnay@bucle.dev"
     password = "Test@123"
@@ -0,0 +1,44 @@
+import uuid
+
+from sqlalchemy import select
+
+from app.db.models import Group, IdempotencyKey
+from app.services.idempotency import with_idempotency
+
+
+def test_replayed_client_request_id_returns_stored_response(db_session, test_user):
+    calls: list[int] = []
+
+    def handler() -> dict:
+        calls.append(1)
+        return {"invite_id": f"inv-{len(calls)}", "status": "pending"}
+
+    first = with_idempotency(db_session, test_user.id, "req-1", handler)
+    replay = with_idempotency(db_session, test_user.id, "req-1", handler)
+
+    assert first == {"invite_id": "inv-1", "status": "pending"}
+    assert replay == first
+    assert len(calls) == 1
+
+
+def test_losing_a_concurrent_duplicate_rolls_back_and_returns_winner(db_session, test_user):
+    """A key committed while the handler ran wins; the loser's writes are dropped."""
+    group_id = str(uuid.uuid4())
+
+    def handler() -> dict:
+        # Stand-in for an overlapping duplicate that commits first
+        db_session.add(IdempotencyKey(
+            id=f"{test_user.id}:req-2",
+            actor_user_id=test_user.id,
+            client_request_id="req-2",
+            response={"invite_id": "winner", "status": "pending"},
+        ))
+        db_session.commit()
+        db_session.add(Group(id=group_id, owner_id=test_user.id, name="Loser", base_currency="INR"))
+        db_session.flush()
+        return {"invite_id": "loser", "status": "pending"}
+
+    response = with_idempotency(db_session, test_user.id, "req-2", handler)
+
+    assert response == {"invite_id": "winner", "status": "pending"}
+    assert db_session.scalar(select(Group.id).where(Group.id == group_id)) is None
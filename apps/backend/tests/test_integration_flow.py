@@ -1,9 +1,4 @@
-from fastapi.testclient import TestClient
-from app.main import app
-
-
-def test_register_login_group_create_flow():
-  client = TestClient(app)
+def test_register_login_group_create_flow(client):
   r = client.post('/api/v1/auth/register', json={'email': 'u@test', 'password': 'password123'})
   assert r.status_code in (200, 201)
   r = client.post('/api/v1/auth/login', json={'email': 'u@test', 'password': 'password123'})